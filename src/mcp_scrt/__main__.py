@@ -5,6 +5,7 @@ prompts, and resources for Secret Network blockchain interaction.
 """
 
 import asyncio
+from contextlib import asynccontextmanager
 from fastmcp import FastMCP
 
 from mcp_scrt.core.session import Session
@@ -54,6 +55,7 @@ from mcp_scrt.tools.transaction import (
     EstimateGasTool,
     SimulateTransactionTool,
     GetTransactionStatusTool,
+    GetTransactionsBulkTool,
 )
 from mcp_scrt.tools.staking import (
     GetValidatorsTool,
@@ -64,10 +66,12 @@ from mcp_scrt.tools.staking import (
     GetDelegationsTool,
     GetUnbondingTool,
     GetRedelegationsTool,
+    GetStakingSummaryTool,
 )
 from mcp_scrt.tools.rewards import (
     GetRewardsTool,
     WithdrawRewardsTool,
+    WithdrawRewardsBatchTool,
     SetWithdrawAddressTool,
     GetCommunityPoolTool,
 )
@@ -78,6 +82,7 @@ from mcp_scrt.tools.governance import (
     DepositProposalTool,
     VoteProposalTool,
     GetVoteTool,
+    GetVotesBulkTool,
 )
 from mcp_scrt.tools.contract import (
     UploadContractTool,
@@ -93,6 +98,7 @@ from mcp_scrt.tools.contract import (
 )
 from mcp_scrt.tools.ibc import (
     IBCTransferTool,
+    IBCTransferBatchTool,
     GetIBCChannelsTool,
     GetIBCChannelTool,
     GetIBCDenomTraceTool,
@@ -109,9 +115,19 @@ from mcp_scrt.resources.network import get_network_config_resource
 from mcp_scrt.resources.validators import get_top_validators_resource
 
 
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Close the client pool's LCD connections on the server's event loop at shutdown."""
+    try:
+        yield
+    finally:
+        await client_pool.aclose()
+
+
 # Create FastMCP server
 mcp = FastMCP(
     name="secret-network-mcp",
+    lifespan=lifespan,
 )
 
 # Initialize global context
@@ -139,6 +155,7 @@ context = ToolExecutionContext(
     session=session,
     client_pool=client_pool,
     network=settings.secret_network,
+    verbose_messages=settings.verbose_messages,
 )
 
 
@@ -473,18 +490,25 @@ async def secret_get_transaction(tx_hash: str) -> dict:
 
 
 @mcp.tool()
-async def secret_search_transactions(query: str, limit: int = 100) -> dict:
+async def secret_search_transactions(
+    query: str, limit: int = 100, include_details: bool = True
+) -> dict:
     """Search for transactions.
 
     Args:
         query: Search query (e.g., "message.sender='secret1...'")
-        limit: Maximum number of results (default: 100)
+        limit: Maximum number of results (default: 100, at most 500)
+        include_details: Return full transactions; if false, only hash,
+            height, code and message types
 
     Returns:
         List of matching transactions
     """
     tool = SearchTransactionsTool(context)
-    return await tool.run({"query": query, "limit": limit})
+    params = {"query": query, "limit": limit}
+    if not include_details:
+        params["include_details"] = False
+    return await tool.run(params)
 
 
 @mcp.tool()
@@ -530,17 +554,42 @@ async def secret_get_transaction_status(tx_hash: str) -> dict:
 
 
 @mcp.tool()
-async def secret_get_validators(status: str = "BOND_STATUS_BONDED") -> dict:
+async def secret_get_transactions(tx_hashes: list) -> dict:
+    """Get many transactions by hash concurrently.
+
+    Args:
+        tx_hashes: List of transaction hashes (at most 100)
+
+    Returns:
+        Transactions and lookup errors, each keyed by hash
+    """
+    tool = GetTransactionsBulkTool(context)
+    return await tool.run({"hashes": tx_hashes})
+
+
+@mcp.tool()
+async def secret_get_validators(
+    status: str = "BOND_STATUS_BONDED",
+    max_items: int = None,
+    pagination_key: str = None,
+) -> dict:
     """Get list of validators.
 
     Args:
         status: Validator status filter (default: BOND_STATUS_BONDED)
+        max_items: Maximum validators to return (default: 100)
+        pagination_key: next_key from a previous call, to fetch the next page
 
     Returns:
-        List of validators
+        Page of validators and the next_key for the following page
     """
     tool = GetValidatorsTool(context)
-    return await tool.run({"status": status})
+    params = {"status": status}
+    if max_items:
+        params["max_items"] = max_items
+    if pagination_key:
+        params["pagination_key"] = pagination_key
+    return await tool.run(params)
 
 
 @mcp.tool()
@@ -662,6 +711,20 @@ async def secret_get_redelegations(address: str = None) -> dict:
     return await tool.run(params)
 
 
+@mcp.tool()
+async def secret_get_staking_summary(address: str) -> dict:
+    """Get delegations, unbonding delegations and redelegations for an address.
+
+    Args:
+        address: Delegator address
+
+    Returns:
+        Staking summary with all three lists
+    """
+    tool = GetStakingSummaryTool(context)
+    return await tool.run({"address": address})
+
+
 @mcp.tool()
 async def secret_get_rewards(address: str = None) -> dict:
     """Get staking rewards for an address.
@@ -692,6 +755,21 @@ async def secret_withdraw_rewards(validator_address: str = None) -> dict:
     return await tool.run(params)
 
 
+@mcp.tool()
+async def secret_withdraw_rewards_batch(validator_addresses: list) -> dict:
+    """Withdraw staking rewards from several validators.
+
+    Args:
+        validator_addresses: Validator addresses to withdraw from; the
+            withdrawals are packed into as few transactions as possible
+
+    Returns:
+        Transaction hashes and details
+    """
+    tool = WithdrawRewardsBatchTool(context)
+    return await tool.run({"validator_addresses": validator_addresses})
+
+
 @mcp.tool()
 async def secret_set_withdraw_address(withdraw_address: str) -> dict:
     """Set the withdraw address for rewards.
@@ -718,17 +796,31 @@ async def secret_get_community_pool() -> dict:
 
 
 @mcp.tool()
-async def secret_get_proposals(status: str = None) -> dict:
+async def secret_get_proposals(
+    status: str = None,
+    include_details: bool = False,
+    max_items: int = None,
+    pagination_key: str = None,
+) -> dict:
     """Get governance proposals.
 
     Args:
         status: Optional status filter (PROPOSAL_STATUS_VOTING_PERIOD, etc.)
+        include_details: Fetch full details for every proposal concurrently
+        max_items: Maximum proposals to return (default: 100)
+        pagination_key: next_key from a previous call, to fetch the next page
 
     Returns:
-        List of proposals
+        Page of proposals and the next_key for the following page
     """
     tool = GetProposalsTool(context)
     params = {"status": status} if status else {}
+    if include_details:
+        params["include_details"] = True
+    if max_items:
+        params["max_items"] = max_items
+    if pagination_key:
+        params["pagination_key"] = pagination_key
     return await tool.run(params)
 
 
@@ -827,6 +919,20 @@ async def secret_get_vote(proposal_id: int, voter: str = None) -> dict:
     return await tool.run(params)
 
 
+@mcp.tool()
+async def secret_get_votes(queries: list) -> dict:
+    """Get votes for many proposal and voter pairs concurrently.
+
+    Args:
+        queries: List of {"proposal_id": ..., "voter": ...} entries
+
+    Returns:
+        Vote per query (null if the voter has not voted)
+    """
+    tool = GetVotesBulkTool(context)
+    return await tool.run({"queries": queries})
+
+
 @mcp.tool()
 async def secret_upload_contract(wasm_file_path: str) -> dict:
     """Upload a smart contract WASM file.
@@ -940,17 +1046,21 @@ async def secret_query_contract(contract_address: str, query_msg: dict) -> dict:
 
 
 @mcp.tool()
-async def secret_batch_execute(executions: list) -> dict:
+async def secret_batch_execute(executions: list, simulate: bool = False) -> dict:
     """Execute multiple contract operations in a batch.
 
     Args:
         executions: List of execution objects with 'contract_address', 'execute_msg', and optional 'funds'
+        simulate: Simulate all executions concurrently before signing (default: False)
 
     Returns:
         Transaction hash and batch execution results
     """
     tool = BatchExecuteTool(context)
-    return await tool.run({"executions": executions})
+    params = {"executions": executions}
+    if simulate:
+        params["simulate"] = simulate
+    return await tool.run(params)
 
 
 @mcp.tool()
@@ -1044,6 +1154,23 @@ async def secret_ibc_transfer(
     return await tool.run(params)
 
 
+@mcp.tool()
+async def secret_ibc_transfer_batch(transfers: list, memo: str = "") -> dict:
+    """Transfer tokens via IBC to several recipients in one transaction.
+
+    Args:
+        transfers: List of {"channel_id": ..., "recipient": ..., "amount": ...}
+            entries, each optionally with denom, port_id, timeout_height,
+            timeout_timestamp and memo
+        memo: Optional transaction memo
+
+    Returns:
+        Transaction hash and per-transfer results
+    """
+    tool = IBCTransferBatchTool(context)
+    return await tool.run({"transfers": transfers, "memo": memo})
+
+
 @mcp.tool()
 async def secret_get_ibc_channels() -> dict:
     """Get all IBC channels.
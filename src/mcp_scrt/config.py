@@ -151,6 +151,14 @@ class Settings(BaseSettings):
         description="Enable extra debug logging (requires LOG_LEVEL=DEBUG)",
     )
 
+    verbose_messages: bool = Field(
+        default=True,
+        description=(
+            "Include human-readable 'message' fields in tool responses. Only "
+            "templated messages (built with BaseTool._with_message) can be omitted"
+        ),
+    )
+
     # Connection pool configuration
     max_connections: int = Field(
         default=10,
@@ -44,6 +44,14 @@ CACHE_TTL: Dict[str, int] = {
     "blocks": 10,  # 10 seconds - new blocks every ~6 seconds
     "accounts": 60,  # 60 seconds - account info changes moderately
     "tx_results": 3600,  # 1 hour - transaction results are immutable
+    "proposals": 3600,  # 1 hour - finalized proposals are immutable
+    "active_proposals": 10,  # 10 seconds - tallies change while voting/depositing
+    "ibc_channels": 60,  # 1 minute - channels open and close rarely
+    "denom_traces": 86400,  # 1 day - a trace hash always maps to the same trace
+    "health_check": 5,  # 5 seconds - repeated health polls reuse the last result
+    "rewards": 6,  # 6 seconds - one block; rewards accrue every block
+    "delegations": 6,  # 6 seconds - one block; delegations change only in transactions
+    "tx_search": 6,  # 6 seconds - one block; new blocks add matching transactions
 }
 
 # Security limits
@@ -54,11 +62,47 @@ CONFIRMATION_THRESHOLD = 1_000_000  # 1 SCRT in uscrt - require confirmation abo
 MAX_RETRIES = 3  # Maximum number of retry attempts
 RETRY_BACKOFF_BASE = 2  # Exponential backoff base (seconds)
 RETRY_BACKOFF_MAX = 30  # Maximum backoff time (seconds)
+RETRY_JITTER_BASE = 0.1  # Upper bound (seconds) of the first jittered in-process retry delay
+TRANSIENT_HTTP_STATUSES = frozenset({429, 502, 503, 504})  # LCD statuses worth retrying
+
+# Health check configuration
+HEALTH_CHECK_TIMEOUT = 2.0  # Seconds to wait for node info before giving up
+TX_QUERY_TIMEOUT = 30.0  # Seconds to wait for a transaction query before giving up
+TX_QUERY_CONCURRENCY = 32  # Transaction queries in flight at once, shared by all tools
+HEALTH_CHECK_REFRESH_AGE = 2.0  # Cached result age (seconds) that triggers a background refresh
 
 # Connection pool configuration
 MAX_CONNECTIONS = 10  # Maximum concurrent connections
 IDLE_TIMEOUT = 300  # Idle connection timeout in seconds (5 minutes)
 CONNECTION_KEEPALIVE = True  # Enable HTTP keep-alive
+LCD_CONNECTIONS_PER_HOST = 64  # Maximum open connections per LCD host per client
+LCD_DNS_CACHE_TTL = 300  # Seconds to cache LCD host DNS lookups
+LCD_KEEPALIVE_TIMEOUT = 30  # Seconds an idle LCD connection is kept open for reuse
+SIGNING_CLIENT_POOL_SIZE = 32  # Maximum cached signing clients (wallet, network pairs)
+TX_CODE_WRONG_SEQUENCE = 32  # Cosmos SDK ABCI code for an account sequence mismatch
+
+# Batch execution configuration
+BATCH_SIMULATION_CONCURRENCY = 16  # Maximum in-flight simulations per batch
+BULK_QUERY_CONCURRENCY = 16  # Maximum in-flight queries per bulk read tool call
+WITHDRAW_BATCH_MSGS_PER_TX = 20  # Maximum reward withdrawals packed into one transaction
+PROPOSALS_PAGE_LIMIT = 100  # Default maximum proposals returned per get_proposals call
+PROPOSALS_MAX_LIMIT = 500  # Largest get_proposals page accepted
+VALIDATORS_PAGE_LIMIT = 100  # Default maximum validators returned per get_validators call
+VALIDATORS_MAX_LIMIT = 500  # Largest get_validators page accepted
+TX_SEARCH_PAGE_LIMIT = 100  # Default transactions returned per search_transactions page
+TX_SEARCH_MAX_LIMIT = 500  # Largest search_transactions page accepted
+TX_BULK_MAX_HASHES = 100  # Most hashes accepted per get_transactions call
+PROPOSAL_INDEX_REFRESH_INTERVAL = 30  # Seconds before the finalized-proposal index is refreshed
+
+# Proposal statuses after which a proposal can no longer change
+FINALIZED_PROPOSAL_STATUSES = frozenset({
+    "PROPOSAL_STATUS_PASSED",
+    "PROPOSAL_STATUS_REJECTED",
+    "PROPOSAL_STATUS_FAILED",
+})
+
+# Contract upload configuration
+WASM_DECODE_THREAD_THRESHOLD = 64 * 1024  # Base64 length above which decoding runs in a thread
 
 # Validation patterns (regex)
 ADDRESS_PATTERN = r"^secret1[a-z0-9]{38,45}$"  # Secret Network account address (38-45 chars)
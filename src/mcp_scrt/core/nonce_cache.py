@@ -0,0 +1,134 @@
+"""Account sequence cache for transaction signing.
+
+This module tracks the next account sequence (nonce) per wallet so that
+transactions fetch the sequence from the chain once and then advance it
+locally, instead of re-querying the account before every broadcast.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from ..constants import TX_CODE_WRONG_SEQUENCE
+from ..utils.logging import get_logger
+
+# Module logger
+logger = get_logger(__name__)
+
+# Async callable returning the account's current on-chain sequence
+SequenceFetcher = Callable[[], Awaitable[Any]]
+
+# Async callable broadcasting a transaction signed with the given sequence
+SequenceSender = Callable[[int], Awaitable[Dict[str, Any]]]
+
+
+class NonceCache:
+    """Per-(wallet, network) account sequence cache.
+
+    The first transaction of a wallet fetches its sequence from the chain;
+    later transactions take the cached value, which is advanced as soon as
+    it is handed out. A per-wallet lock makes concurrent transactions from
+    the same wallet get consecutive sequences. Whenever a transaction is
+    rejected or fails the cached value is dropped, so the next one resyncs.
+
+    Example:
+        >>> result = await nonce_cache.submit(
+        ...     "my_wallet",
+        ...     "testnet",
+        ...     signing_client.account_sequence,
+        ...     lambda sequence: signing_client.vote(
+        ...         proposal_id=1, option="VOTE_OPTION_YES", sequence=sequence
+        ...     ),
+        ... )
+    """
+
+    def __init__(self) -> None:
+        """Initialize nonce cache."""
+        self._sequences: Dict[Tuple[str, str], int] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+    async def next_sequence(
+        self, wallet_name: str, network: str, fetch_sequence: SequenceFetcher
+    ) -> int:
+        """Take the next sequence for a wallet, fetching it on first use.
+
+        Args:
+            wallet_name: Wallet identifier
+            network: Network name (e.g., "testnet")
+            fetch_sequence: Fetches the on-chain sequence when none is cached
+
+        Returns:
+            Sequence to sign the next transaction with
+        """
+        key = (wallet_name, network)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+
+        async with lock:
+            sequence = self._sequences.get(key)
+            if sequence is None:
+                sequence = int(await fetch_sequence())
+                logger.debug("Fetched account sequence", wallet=wallet_name, sequence=sequence)
+
+            self._sequences[key] = sequence + 1
+            return sequence
+
+    def reset(self, wallet_name: str, network: str) -> None:
+        """Drop the cached sequence so the next transaction refetches it.
+
+        Args:
+            wallet_name: Wallet identifier
+            network: Network name
+        """
+        self._sequences.pop((wallet_name, network), None)
+
+    async def submit(
+        self,
+        wallet_name: str,
+        network: str,
+        fetch_sequence: SequenceFetcher,
+        send: SequenceSender,
+    ) -> Dict[str, Any]:
+        """Broadcast a transaction with the next cached sequence.
+
+        A rejected transaction does not consume its sequence, so the cache is
+        reset on any non-zero result code or error. On a sequence mismatch
+        (the cache was stale, e.g. after a transaction sent from elsewhere)
+        the transaction is retried once with a freshly fetched sequence.
+
+        Args:
+            wallet_name: Wallet identifier
+            network: Network name
+            fetch_sequence: Fetches the on-chain sequence when none is cached
+            send: Signs and broadcasts the transaction with a sequence
+
+        Returns:
+            Broadcast result
+        """
+        result = await self._send_with_next_sequence(wallet_name, network, fetch_sequence, send)
+        if result.get("code") == TX_CODE_WRONG_SEQUENCE:
+            logger.debug("Account sequence mismatch, resyncing", wallet=wallet_name)
+            result = await self._send_with_next_sequence(
+                wallet_name, network, fetch_sequence, send
+            )
+
+        return result
+
+    async def _send_with_next_sequence(
+        self,
+        wallet_name: str,
+        network: str,
+        fetch_sequence: SequenceFetcher,
+        send: SequenceSender,
+    ) -> Dict[str, Any]:
+        """Send once with the next sequence, resetting the cache on failure."""
+        sequence = await self.next_sequence(wallet_name, network, fetch_sequence)
+        try:
+            result = await send(sequence)
+        except Exception:
+            self.reset(wallet_name, network)
+            raise
+
+        if result.get("code", 0) != 0:
+            # A rejected transaction does not consume its sequence
+            self.reset(wallet_name, network)
+
+        return result
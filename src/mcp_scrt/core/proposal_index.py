@@ -0,0 +1,221 @@
+"""Finalized-proposal index for governance queries.
+
+This module keeps every passed, rejected and failed proposal in memory so
+that list queries for those statuses, and lookups of finalized proposals,
+are answered without a round-trip to the LCD. Finalized proposals never
+change, so the index only grows; a periodic refresh picks up proposals
+that finalized since the last one.
+"""
+
+import asyncio
+import bisect
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..constants import FINALIZED_PROPOSAL_STATUSES, PROPOSAL_INDEX_REFRESH_INTERVAL
+from ..utils.errors import ValidationError
+from ..utils.logging import get_logger
+
+# Module logger
+logger = get_logger(__name__)
+
+# Async callable returning one LCD page of proposals with a status, newest
+# first: fetch_page(status, pagination_key) -> {"proposals": [...], "pagination": {...}}
+ProposalPageFetcher = Callable[[str, Optional[str]], Awaitable[Dict[str, Any]]]
+
+# Prefix of pagination keys handed out for pages served from the index,
+# telling them apart from the LCD's opaque keys
+INDEX_KEY_PREFIX = "index:"
+
+
+class ProposalIndex:
+    """In-memory index of finalized proposals.
+
+    The index becomes ready after its first complete sync; until then,
+    callers should query the LCD directly. Later refreshes page through the
+    newest proposals of each finalized status and stop at the first one
+    already indexed, so a refresh usually costs one request per status.
+
+    Example:
+        >>> index = ProposalIndex()
+        >>> if index.stale:
+        ...     index.schedule_refresh(fetch_page)
+        >>> if index.ready:
+        ...     proposals, next_key, total = index.page("PROPOSAL_STATUS_PASSED", 100)
+    """
+
+    def __init__(self, refresh_interval: float = PROPOSAL_INDEX_REFRESH_INTERVAL) -> None:
+        """Initialize proposal index.
+
+        Args:
+            refresh_interval: Seconds after a sync before the index is stale
+        """
+        self.refresh_interval = refresh_interval
+        self._proposals: Dict[int, Dict[str, Any]] = {}
+        self._ids_by_status: Dict[str, List[int]] = {
+            status: [] for status in FINALIZED_PROPOSAL_STATUSES
+        }
+        self._synced_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether the index has completed a full sync."""
+        return self._synced_at is not None
+
+    @property
+    def stale(self) -> bool:
+        """Whether the index is due for a refresh."""
+        return (
+            self._synced_at is None
+            or time.monotonic() - self._synced_at >= self.refresh_interval
+        )
+
+    @staticmethod
+    def owns_key(pagination_key: Optional[str]) -> bool:
+        """Check whether a pagination key was handed out by the index.
+
+        Args:
+            pagination_key: Pagination key from a previous page (or None)
+
+        Returns:
+            True if the key continues a page served from the index
+        """
+        return isinstance(pagination_key, str) and pagination_key.startswith(INDEX_KEY_PREFIX)
+
+    @staticmethod
+    def key_offset(pagination_key: str) -> int:
+        """Get the position an index pagination key continues from.
+
+        Args:
+            pagination_key: Pagination key handed out by the index
+
+        Returns:
+            Offset of the next proposal in the status listing
+
+        Raises:
+            ValidationError: If the key is not a well-formed index key
+        """
+        offset = pagination_key[len(INDEX_KEY_PREFIX):]
+        if not (
+            pagination_key.startswith(INDEX_KEY_PREFIX) and offset.isascii() and offset.isdigit()
+        ):
+            raise ValidationError(
+                message=f"Invalid pagination_key: {pagination_key}",
+                details={"provided": pagination_key},
+                suggestions=[
+                    "Pass the next_key returned with the previous page unchanged",
+                    "Omit pagination_key to start from the first page",
+                ],
+            )
+        return int(offset)
+
+    def get(self, proposal_id: Any) -> Optional[Dict[str, Any]]:
+        """Get a finalized proposal by ID.
+
+        Args:
+            proposal_id: Proposal ID
+
+        Returns:
+            Proposal dict, or None if the proposal is not indexed
+        """
+        try:
+            return self._proposals.get(int(proposal_id))
+        except (TypeError, ValueError):
+            return None
+
+    def add(self, proposal: Dict[str, Any]) -> bool:
+        """Index a proposal if it is finalized.
+
+        Args:
+            proposal: Proposal dict as returned by the LCD
+
+        Returns:
+            True if the proposal was newly indexed
+        """
+        status = proposal.get("status")
+        if status not in FINALIZED_PROPOSAL_STATUSES:
+            return False
+
+        try:
+            proposal_id = int(proposal["proposal_id"])
+        except (KeyError, TypeError, ValueError):
+            return False
+
+        if proposal_id in self._proposals:
+            return False
+
+        self._proposals[proposal_id] = proposal
+        bisect.insort(self._ids_by_status[status], proposal_id)
+        return True
+
+    def page(
+        self, status: str, limit: int, pagination_key: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], int]:
+        """Get one page of indexed proposals with a status, oldest first.
+
+        Args:
+            status: Finalized proposal status
+            limit: Maximum proposals to return
+            pagination_key: Key returned with the previous page (or None)
+
+        Returns:
+            Tuple of (proposals, next_key or None, total proposals with the status)
+
+        Raises:
+            ValidationError: If pagination_key is not a well-formed index key
+        """
+        ids = self._ids_by_status.get(status, [])
+        offset = self.key_offset(pagination_key) if pagination_key else 0
+        end = offset + limit
+
+        proposals = [self._proposals[proposal_id] for proposal_id in ids[offset:end]]
+        next_key = f"{INDEX_KEY_PREFIX}{end}" if end < len(ids) else None
+        return proposals, next_key, len(ids)
+
+    async def refresh(self, fetch_page: ProposalPageFetcher) -> None:
+        """Sync the index with the chain.
+
+        Args:
+            fetch_page: Fetches one page of proposals with a status, newest first
+        """
+        for status in sorted(FINALIZED_PROPOSAL_STATUSES):
+            pagination_key = None
+            while True:
+                response = await fetch_page(status, pagination_key)
+
+                reached_known = False
+                for proposal in response.get("proposals", []):
+                    if not self.add(proposal):
+                        reached_known = True
+
+                pagination_key = (response.get("pagination") or {}).get("next_key")
+                # Once ready, everything older than a known proposal is indexed
+                if not pagination_key or (reached_known and self.ready):
+                    break
+
+        self._synced_at = time.monotonic()
+        logger.debug("Proposal index refreshed", proposals=len(self._proposals))
+
+    def schedule_refresh(self, fetch_page: ProposalPageFetcher) -> None:
+        """Refresh the index in the background unless a refresh is running.
+
+        Must be called from a running event loop. A failed refresh is logged
+        and leaves the index stale, so the next call schedules another.
+
+        Args:
+            fetch_page: Fetches one page of proposals with a status, newest first
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        self._refresh_task = asyncio.get_running_loop().create_task(
+            self._refresh_logged(fetch_page)
+        )
+
+    async def _refresh_logged(self, fetch_page: ProposalPageFetcher) -> None:
+        """Run a refresh, logging instead of raising on failure."""
+        try:
+            await self.refresh(fetch_page)
+        except Exception as e:
+            logger.warning("Proposal index refresh failed", error=str(e))
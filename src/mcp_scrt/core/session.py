@@ -297,6 +297,19 @@ class Session:
 
             return self._wallet
 
+    @property
+    def current_wallet(self) -> Optional[WalletInfo]:
+        """Currently loaded wallet, read without locking or logging.
+
+        load_wallet() and unload_wallet() replace the wallet reference as a
+        whole under the lock, so reading it is safe without taking the lock.
+        Use this on hot paths that only need the wallet itself.
+
+        Returns:
+            Loaded wallet or None if no wallet loaded
+        """
+        return self._wallet
+
     def get_duration(self) -> float:
         """Get session duration in seconds.
 
@@ -13,8 +13,10 @@ All validation functions come in two forms:
 - validate_*: Raises ValidationError if invalid
 """
 
+import functools
+import logging
 import re
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from ..constants import VALIDATION_PATTERNS
 from ..utils.errors import ValidationError
@@ -23,9 +25,55 @@ from ..utils.logging import get_logger
 # Module logger
 logger = get_logger(__name__)
 
+# Standard library logger behind it, whose level decides what is emitted
+_stdlib_logger = logging.getLogger(__name__)
+
 # Maximum memo length for transactions (Cosmos standard)
 MAX_MEMO_LENGTH = 256
 
+# Precompiled validation patterns
+_ADDRESS_RE = re.compile(VALIDATION_PATTERNS["address"])
+_VALIDATOR_RE = re.compile(VALIDATION_PATTERNS["validator"])
+_HD_PATH_RE = re.compile(r"^m/44'/529'/\d+'/0/\d+$")
+
+# Human-readable prefixes (including the bech32 separator)
+_ADDRESS_PREFIX = "secret1"
+_VALIDATOR_PREFIX = "secretvaloper1"
+
+# Number of recently checked addresses whose result is memoized
+_ADDRESS_CACHE_SIZE = 4096
+
+# Number of recently checked amount strings whose result is memoized
+_AMOUNT_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=_ADDRESS_CACHE_SIZE)
+def _matches_address(address: str) -> bool:
+    """Check an address string against the address format.
+
+    Memoized because the same wallet, voter and contract addresses are
+    validated over and over; only the bool result is cached.
+    """
+    # Cheap prefix check before running the regex
+    if not address.startswith(_ADDRESS_PREFIX):
+        return False
+
+    return _ADDRESS_RE.match(address) is not None
+
+
+@functools.lru_cache(maxsize=_ADDRESS_CACHE_SIZE)
+def _matches_validator_address(address: str) -> bool:
+    """Check an address string against the validator address format.
+
+    Memoized like _matches_address: the same validators are delegated to
+    and queried over and over.
+    """
+    # Cheap prefix check before running the regex
+    if not address.startswith(_VALIDATOR_PREFIX):
+        return False
+
+    return _VALIDATOR_RE.match(address) is not None
+
 
 def is_valid_address(address: Any) -> bool:
     """Check if address is a valid Secret Network address.
@@ -45,12 +93,7 @@ def is_valid_address(address: Any) -> bool:
     if not isinstance(address, str):
         return False
 
-    if not address:
-        return False
-
-    # Check against regex pattern from constants
-    pattern = VALIDATION_PATTERNS["address"]
-    return bool(re.match(pattern, address))
+    return _matches_address(address)
 
 
 def validate_address(address: str, field_name: str = "address") -> None:
@@ -83,7 +126,10 @@ def validate_address(address: str, field_name: str = "address") -> None:
             ],
         )
 
-    logger.debug("Address validation passed", field_name=field_name)
+    # Addresses are validated on nearly every tool call; skip building a log
+    # record that the logging level would discard anyway
+    if _stdlib_logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Address validation passed", field_name=field_name)
 
 
 def is_valid_validator_address(address: Any) -> bool:
@@ -104,11 +150,35 @@ def is_valid_validator_address(address: Any) -> bool:
     if not isinstance(address, str):
         return False
 
-    if not address:
-        return False
+    return _matches_validator_address(address)
+
+
+def invalid_validator_addresses(addresses: Iterable[Any]) -> List[int]:
+    """Find the invalid entries in a list of validator addresses.
 
-    pattern = VALIDATION_PATTERNS["validator"]
-    return bool(re.match(pattern, address))
+    Checks the whole list in one call with the pattern bound once, instead
+    of one is_valid_validator_address() call per entry.
+
+    Args:
+        addresses: Validator addresses to check
+
+    Returns:
+        Indices of the entries that are not valid validator addresses
+
+    Example:
+        >>> invalid_validator_addresses(["secretvaloper1...", "cosmos1..."])
+        [0, 1]
+    """
+    match = _VALIDATOR_RE.match
+    return [
+        index
+        for index, address in enumerate(addresses)
+        if not (
+            isinstance(address, str)
+            and address.startswith(_VALIDATOR_PREFIX)
+            and match(address) is not None
+        )
+    ]
 
 
 def validate_validator_address(address: str, field_name: str = "validator_address") -> None:
@@ -132,7 +202,8 @@ def validate_validator_address(address: str, field_name: str = "validator_addres
             ],
         )
 
-    logger.debug("Validator address validation passed", field_name=field_name)
+    if _stdlib_logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Validator address validation passed", field_name=field_name)
 
 
 def is_valid_contract_address(address: Any) -> bool:
@@ -174,6 +245,46 @@ def validate_contract_address(address: str, field_name: str = "contract_address"
     logger.debug("Contract address validation passed", field_name=field_name)
 
 
+def _amount_in_range(
+    numeric_amount: float, allow_zero: bool, max_amount: Optional[Union[int, float]]
+) -> bool:
+    """Check a numeric amount is non-negative, non-zero unless allowed, and within max."""
+    # Check if negative
+    if numeric_amount < 0:
+        return False
+
+    # Check if zero when not allowed
+    if numeric_amount == 0 and not allow_zero:
+        return False
+
+    # Check max amount
+    if max_amount is not None and numeric_amount > max_amount:
+        return False
+
+    return True
+
+
+@functools.lru_cache(maxsize=_AMOUNT_CACHE_SIZE)
+def _is_valid_amount_string(
+    amount: str, allow_zero: bool, max_amount: Optional[Union[int, float]]
+) -> bool:
+    """Check an amount string against the amount rules.
+
+    Memoized because transactions repeat the same few amount strings; only
+    the bool result is cached.
+    """
+    # Don't allow whitespace
+    if amount != amount.strip():
+        return False
+
+    try:
+        numeric_amount = float(amount)
+    except ValueError:
+        return False
+
+    return _amount_in_range(numeric_amount, allow_zero, max_amount)
+
+
 def is_valid_amount(
     amount: Any,
     allow_zero: bool = False,
@@ -201,31 +312,16 @@ def is_valid_amount(
     if amount is None:
         return False
 
+    if isinstance(amount, str):
+        return _is_valid_amount_string(amount, allow_zero, max_amount)
+
     # Try to convert to float
     try:
-        if isinstance(amount, str):
-            # Don't allow whitespace
-            if amount != amount.strip():
-                return False
-            numeric_amount = float(amount)
-        else:
-            numeric_amount = float(amount)
+        numeric_amount = float(amount)
     except (ValueError, TypeError):
         return False
 
-    # Check if negative
-    if numeric_amount < 0:
-        return False
-
-    # Check if zero when not allowed
-    if numeric_amount == 0 and not allow_zero:
-        return False
-
-    # Check max amount
-    if max_amount is not None and numeric_amount > max_amount:
-        return False
-
-    return True
+    return _amount_in_range(numeric_amount, allow_zero, max_amount)
 
 
 def validate_amount(
@@ -291,11 +387,14 @@ def validate_amount(
             suggestions=suggestions,
         )
 
-    logger.debug(
-        "Amount validation passed",
-        field_name=field_name,
-        amount=amount,
-    )
+    # Amounts are validated on every transaction; skip building a log
+    # record that the logging level would discard anyway
+    if _stdlib_logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Amount validation passed",
+            field_name=field_name,
+            amount=amount,
+        )
 
 
 def is_valid_hd_path(path: Any) -> bool:
@@ -328,8 +427,7 @@ def is_valid_hd_path(path: Any) -> bool:
     # Account: any number with '
     # Change: 0
     # Index: any number
-    pattern = r"^m/44'/529'/\d+'/0/\d+$"
-    return bool(re.match(pattern, path))
+    return _HD_PATH_RE.match(path) is not None
 
 
 def validate_hd_path(path: str, field_name: str = "hd_path") -> None:
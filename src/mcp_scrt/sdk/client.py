@@ -7,7 +7,7 @@ to the Secret Network with health checking, retry logic, and detailed logging.
 import threading
 from contextlib import contextmanager
 from queue import Empty, Queue
-from typing import Any, Dict, Generator, Optional
+from typing import Any, Dict, Generator, List, Optional
 
 from secret_sdk.client.lcd import LCDClient
 
@@ -15,6 +15,7 @@ from ..config import get_settings
 from ..types import NetworkType
 from ..utils.errors import NetworkError
 from ..utils.logging import get_logger
+from .lcd import KeepAliveAsyncLCDClient, KeepAliveLCDClient
 
 # Module logger
 logger = get_logger(__name__)
@@ -69,6 +70,10 @@ class ClientPool:
         self._in_use: set[LCDClient] = set()
         self._lock = threading.RLock()
 
+        # Shared async client for read-only queries awaited on the event
+        # loop (created lazily)
+        self._async_read_client: Optional[KeepAliveAsyncLCDClient] = None
+
         # Statistics
         self._requests_served = 0
         self._closed = False
@@ -115,8 +120,8 @@ class ClientPool:
                     network=self.network.value,
                 )
 
-            # Create client
-            client = LCDClient(url=url, chain_id=chain_id)
+            # Create client; it keeps its HTTP connections open for reuse
+            client = KeepAliveLCDClient(url=url, chain_id=chain_id)
 
             logger.info("LCD client created", network=self.network.value, chain_id=chain_id)
 
@@ -254,6 +259,43 @@ class ClientPool:
                                 in_use=len(self._in_use),
                             )
 
+    @property
+    def async_read_client(self) -> KeepAliveAsyncLCDClient:
+        """Get the shared async client for read-only queries.
+
+        Its queries are coroutines awaited on the caller's event loop, so
+        tools that run queries concurrently (gathered, raced or coalesced)
+        use it instead of handing a synchronous client to worker threads.
+        One client serves every caller: its session spreads concurrent
+        queries over the keep-alive connector. Creating it makes no request.
+
+        Returns:
+            Shared KeepAliveAsyncLCDClient instance
+
+        Raises:
+            RuntimeError: If pool is closed
+
+        Example:
+            >>> validators = await pool.async_read_client.staking.validators()
+        """
+        client = self._async_read_client
+        if client is not None:
+            return client
+
+        with self._lock:
+            if self._closed:
+                logger.error("Attempted to get async read client from closed pool")
+                raise RuntimeError("ClientPool is closed")
+
+            if self._async_read_client is None:
+                self._async_read_client = KeepAliveAsyncLCDClient(
+                    url=self._settings.get_network_url(),
+                    chain_id=self._settings.get_chain_id(),
+                )
+                logger.debug("Created shared async read client", network=self.network.value)
+
+            return self._async_read_client
+
     def get_stats(self) -> Dict[str, Any]:
         """Get pool statistics.
 
@@ -283,7 +325,11 @@ class ClientPool:
             return stats
 
     def reset(self) -> None:
-        """Reset the pool, clearing all connections and statistics."""
+        """Reset the pool, clearing all connections and statistics.
+
+        Clients are dropped without closing their pooled HTTP connections,
+        which are released when the clients are garbage collected.
+        """
         with self._lock:
             logger.debug("Resetting client pool")
 
@@ -305,22 +351,49 @@ class ClientPool:
     def close(self) -> None:
         """Close the pool and all connections.
 
-        After calling close(), the pool cannot be used anymore.
+        After calling close(), the pool cannot be used anymore. The clients'
+        pooled HTTP connections belong to the event loop they ran on, so
+        they are left to garbage collection here; await aclose() on that
+        loop to close them cleanly.
+        """
+        self._close()
+
+    async def aclose(self) -> None:
+        """Close the pool and await closing every client's HTTP connections.
+
+        Await this on the event loop the clients ran on, e.g. from the
+        server's shutdown. After calling aclose(), the pool cannot be used
+        anymore.
+        """
+        for client in self._close():
+            await client.close_connections()
+
+    def _close(self) -> List[Any]:
+        """Close the pool (internal method).
+
+        Returns:
+            Clients dropped from the pool, whose connections are still open
         """
         with self._lock:
             if self._closed:
                 logger.debug("Pool already closed")
-                return
+                return []
 
             logger.debug("Closing client pool")
 
             self._closed = True
-            self._close_all_connections()
+            clients = self._close_all_connections()
 
             logger.info("Client pool closed")
 
-    def _close_all_connections(self) -> None:
-        """Close all connections in the pool (internal method)."""
+            return clients
+
+    def _close_all_connections(self) -> List[Any]:
+        """Drop all connections in the pool (internal method).
+
+        Returns:
+            Clients dropped from the pool, whose connections are still open
+        """
         logger.debug(
             "Closing all connections",
             total_connections=len(self._all_connections),
@@ -333,12 +406,19 @@ class ClientPool:
             except Empty:
                 break
 
-        # Clear all tracking
+        # Clear all tracking; the caller closes the clients' connections
+        clients: List[Any] = list(self._all_connections)
+        if self._async_read_client is not None:
+            clients.append(self._async_read_client)
+
         self._all_connections.clear()
         self._in_use.clear()
+        self._async_read_client = None
 
         logger.debug("All connections closed")
 
+        return clients
+
     def __enter__(self) -> "ClientPool":
         """Enter context manager."""
         logger.debug("Entering ClientPool context manager")
@@ -0,0 +1,236 @@
+"""Keep-alive LCD clients for Secret Network.
+
+The synchronous secret-sdk LCDClient opens a fresh aiohttp session around
+every request and closes it afterwards, tearing down the TCP connection and
+TLS session each time. This module provides a drop-in subclass whose
+per-request sessions share one long-lived connector, so connections to the
+LCD endpoint are reused across requests, and an async client for read-only
+queries that are awaited on the server's event loop.
+"""
+
+import asyncio
+import ssl
+from typing import Any, Callable, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from aiohttp import ClientResponse, ClientSession, TCPConnector
+from secret_sdk.client.lcd import AsyncLCDClient, LCDClient
+from secret_sdk.client.lcd.api.bank import AsyncBankAPI
+from secret_sdk.client.lcd.api.distribution import AsyncDistributionAPI
+from secret_sdk.client.lcd.api.gov import AsyncGovAPI
+from secret_sdk.client.lcd.api.ibc import AsyncIbcAPI
+from secret_sdk.client.lcd.api.ibc_transfer import AsyncIbcTransferAPI
+from secret_sdk.client.lcd.api.registration import AsyncRegistrationAPI
+from secret_sdk.client.lcd.api.staking import AsyncStakingAPI
+from secret_sdk.client.lcd.api.tendermint import AsyncTendermintAPI
+from secret_sdk.client.lcd.api.tx import AsyncTxAPI
+from secret_sdk.client.lcd.api.wasm import AsyncWasmAPI
+from secret_sdk.client.lcd.lcdclient import REQUEST_CONFIG
+from secret_sdk.client.lcd.params import APIParams
+from secret_sdk.util.encrypt_utils import EncryptionUtils
+
+from ..constants import LCD_CONNECTIONS_PER_HOST, LCD_DNS_CACHE_TTL, LCD_KEEPALIVE_TIMEOUT
+from ..utils.logging import get_logger
+
+# Module logger
+logger = get_logger(__name__)
+
+# TLS context shared by every connector, so CA certificates load only once
+_SSL_CONTEXT = ssl.create_default_context()
+
+
+class _FastJSONResponse(ClientResponse):
+    """Client response that decodes JSON bodies with orjson.
+
+    secret-sdk parses every LCD reply with response.json(), which defaults
+    to the stdlib json module; large replies (rewards, delegations,
+    proposals) decode several times faster with orjson.
+    """
+
+    async def json(
+        self,
+        *,
+        encoding: Optional[str] = None,
+        loads: Optional[Callable[[str], Any]] = None,
+        content_type: Optional[str] = "application/json",
+    ) -> Any:
+        if loads is None and encoding is None and content_type is None:
+            # secret-sdk's call: parse the raw UTF-8 body in place instead of
+            # making stripped and decoded text copies of it first
+            body = await self.read()
+            if not body or body.isspace():
+                return None
+            return orjson.loads(body)
+
+        return await super().json(
+            encoding=encoding,
+            loads=loads or orjson.loads,
+            content_type=content_type,
+        )
+
+
+# Response class for request sessions: orjson decoding when installed
+_RESPONSE_CLASS = ClientResponse if orjson is None else _FastJSONResponse
+
+
+def _new_connector() -> TCPConnector:
+    """Create a keep-alive connector on the running event loop."""
+    return TCPConnector(
+        limit_per_host=LCD_CONNECTIONS_PER_HOST,
+        ttl_dns_cache=LCD_DNS_CACHE_TTL,
+        keepalive_timeout=LCD_KEEPALIVE_TIMEOUT,
+        ssl=_SSL_CONTEXT,
+    )
+
+
+class KeepAliveLCDClient(LCDClient):
+    """LCDClient that keeps its HTTP connections open between requests.
+
+    Requests still run one at a time under the client's lock, each in its
+    own short-lived session, but every session borrows the same connector
+    (created lazily on the client's event loop) instead of owning one.
+    Await close_connections() on that loop when the client is discarded.
+    """
+
+    _connector: Optional[TCPConnector] = None
+
+    def _new_session(self) -> ClientSession:
+        """Create a request session on the shared connector."""
+        if self._connector is None or self._connector.closed:
+            self._connector = _new_connector()
+
+        return ClientSession(
+            headers={"Accept": "application/json"},
+            connector=self._connector,
+            connector_owner=False,
+            response_class=_RESPONSE_CLASS,
+        )
+
+    async def _get(self, *args: Any, **kwargs: Any) -> Any:
+        with self.lock:
+            self.session = self._new_session()
+            try:
+                return await AsyncLCDClient._get(self, *args, **kwargs)
+            finally:
+                # Closing a session that does not own its connector leaves
+                # the pooled connections open
+                await self.session.close()
+
+    async def _post(self, *args: Any, **kwargs: Any) -> Any:
+        with self.lock:
+            self.session = self._new_session()
+            try:
+                return await AsyncLCDClient._post(self, *args, **kwargs)
+            finally:
+                await self.session.close()
+
+    async def close_connections(self) -> None:
+        """Close the pooled connections.
+
+        Safe to call more than once; a later request opens new connections.
+        """
+        connector, self._connector = self._connector, None
+        if connector is None or connector.closed:
+            return
+
+        try:
+            await connector.close()
+        except Exception as e:
+            logger.warning("Failed to close LCD connections", error=str(e))
+
+
+class _KeepAliveAsyncTxAPI(AsyncTxAPI):
+    """Transaction queries that load the consensus IO key before decrypting."""
+
+    async def search(self, events: List[list], params: Optional[APIParams] = None) -> dict:
+        await self._c._load_encrypt_utils()
+        return await super().search(events, params)
+
+    async def get_tx(self, hash: str) -> Optional[dict]:
+        # AsyncTxAPI.get_tx calls search() without awaiting it
+        res = await self.search(events=[["tx.hash", hash]])
+        return res["txs"][0] if res["txs"] else None
+
+
+class _KeepAliveAsyncWasmAPI(AsyncWasmAPI):
+    """Contract queries that load the consensus IO key before encrypting."""
+
+    async def contract_query(
+        self, contract_address: str, query: dict, *args: Any, **kwargs: Any
+    ) -> Any:
+        await self._c._load_encrypt_utils()
+        return await super().contract_query(contract_address, query, *args, **kwargs)
+
+
+class KeepAliveAsyncLCDClient(AsyncLCDClient):
+    """AsyncLCDClient for read-only queries awaited on the event loop.
+
+    Queries are coroutines awaited by the caller, so they run on the
+    caller's loop and can be gathered, bounded and cancelled like any other
+    awaitable. Concurrent queries share one session on a keep-alive
+    connector; the session is created by the first query and recreated if
+    a query runs on a different loop. Creating the client makes no request:
+    the consensus IO key, used to decrypt contract messages in transactions,
+    is fetched by the first transaction query. Await close_connections()
+    when the client is discarded.
+    """
+
+    def __init__(self, url: str, chain_id: str) -> None:
+        # AsyncLCDClient.__init__ fetches the consensus IO key with a
+        # blocking request, so set up the read-only query APIs here instead
+        self.url = url
+        self.chain_id = chain_id
+        self._request_config = REQUEST_CONFIG
+        self.last_request_height = None
+        self.encrypt_utils: Optional[EncryptionUtils] = None
+        self._session: Optional[ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.bank = AsyncBankAPI(self)
+        self.distribution = AsyncDistributionAPI(self)
+        self.gov = AsyncGovAPI(self)
+        self.ibc = AsyncIbcAPI(self)
+        self.ibc_transfer = AsyncIbcTransferAPI(self)
+        self.registration = AsyncRegistrationAPI(self)
+        self.staking = AsyncStakingAPI(self)
+        self.tendermint = AsyncTendermintAPI(self)
+        self.tx = _KeepAliveAsyncTxAPI(self)
+        self.wasm = _KeepAliveAsyncWasmAPI(self)
+
+    @property
+    def session(self) -> ClientSession:
+        """Request session for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = ClientSession(
+                headers={"Accept": "application/json"},
+                connector=_new_connector(),
+                response_class=_RESPONSE_CLASS,
+            )
+            self._session_loop = loop
+
+        return self._session
+
+    async def _load_encrypt_utils(self) -> None:
+        """Fetch the consensus IO key on first use."""
+        if self.encrypt_utils is None:
+            consensus_io_pub_key = await self.registration.consensus_io_pub_key()
+            self.encrypt_utils = EncryptionUtils(consensus_io_pub_key, None)
+
+    async def close_connections(self) -> None:
+        """Close the session and its pooled connections.
+
+        Safe to call more than once; a later query opens a new session.
+        """
+        session, self._session = self._session, None
+        if session is None or session.closed:
+            return
+
+        try:
+            await session.close()
+        except Exception as e:
+            logger.warning("Failed to close LCD connections", error=str(e))
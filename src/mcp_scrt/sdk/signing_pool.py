@@ -0,0 +1,127 @@
+"""Signing client cache for Secret Network transactions.
+
+This module keeps signing clients alive between tool calls so that the
+connection setup and key unlock of a signing client happen once per
+(wallet, network) instead of once per transaction.
+"""
+
+import asyncio
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Generator, Hashable, Tuple
+
+from ..constants import SIGNING_CLIENT_POOL_SIZE
+from ..utils.logging import get_logger
+
+# Module logger
+logger = get_logger(__name__)
+
+# Async factory creating a signing client for (wallet_name, network)
+SigningClientFactory = Callable[[str, str], Awaitable[Any]]
+
+
+class SigningClientPool:
+    """LRU cache of signing clients keyed by (wallet, network).
+
+    Clients are created on first use with the factory passed to get() and
+    reused afterwards. The factory is part of the key, so tool modules with
+    different signing client implementations never share clients. When the
+    pool is full the least recently used client is evicted.
+
+    Example:
+        >>> signing_client = await pool.get("my_wallet", "testnet", create_signing_client)
+        >>> with pool.invalidate_on_error("my_wallet", "testnet"):
+        ...     result = await signing_client.vote(proposal_id=1, option="VOTE_OPTION_YES")
+    """
+
+    def __init__(self, max_size: int = SIGNING_CLIENT_POOL_SIZE) -> None:
+        """Initialize signing client pool.
+
+        Args:
+            max_size: Maximum number of cached clients (default: SIGNING_CLIENT_POOL_SIZE)
+
+        Raises:
+            ValueError: If max_size is invalid
+        """
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+
+        self.max_size = max_size
+        self._clients: "OrderedDict[Tuple[Hashable, str, str], Any]" = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    async def get(self, wallet_name: str, network: str, factory: SigningClientFactory) -> Any:
+        """Get a cached signing client, creating it on first use.
+
+        Args:
+            wallet_name: Wallet identifier
+            network: Network name (e.g., "testnet")
+            factory: Async factory used when no client is cached
+
+        Returns:
+            Signing client for the wallet and network
+        """
+        key = (factory, wallet_name, network)
+
+        async with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+
+            client = await factory(wallet_name, network)
+            self._clients[key] = client
+            logger.debug("Created signing client", wallet=wallet_name, network=network)
+
+            if len(self._clients) > self.max_size:
+                (_, evicted_wallet, evicted_network), _ = self._clients.popitem(last=False)
+                logger.debug(
+                    "Evicted signing client",
+                    wallet=evicted_wallet,
+                    network=evicted_network,
+                )
+
+            return client
+
+    def invalidate(self, wallet_name: str, network: str) -> None:
+        """Drop every cached client for a wallet and network.
+
+        Args:
+            wallet_name: Wallet identifier
+            network: Network name
+        """
+        stale = [key for key in self._clients if key[1:] == (wallet_name, network)]
+        for key in stale:
+            del self._clients[key]
+
+        if stale:
+            logger.debug("Invalidated signing client", wallet=wallet_name, network=network)
+
+    @contextmanager
+    def invalidate_on_error(self, wallet_name: str, network: str) -> Generator[None, None, None]:
+        """Invalidate the wallet's clients if the wrapped block raises.
+
+        A client that failed mid-transaction may hold a broken connection or
+        stale account state, so the next call starts with a fresh one.
+
+        Args:
+            wallet_name: Wallet identifier
+            network: Network name
+        """
+        try:
+            yield
+        except Exception:
+            self.invalidate(wallet_name, network)
+            raise
+
+    def clear(self) -> None:
+        """Drop all cached clients."""
+        self._clients.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            Dictionary with the number of cached clients and the maximum size
+        """
+        return {"cached_clients": len(self._clients), "max_size": self.max_size}
@@ -43,6 +43,7 @@ from mcp_scrt.tools.transaction import (
     EstimateGasTool,
     SimulateTransactionTool,
     GetTransactionStatusTool,
+    GetTransactionsBulkTool,
 )
 from mcp_scrt.tools.staking import (
     GetValidatorsTool,
@@ -53,10 +54,12 @@ from mcp_scrt.tools.staking import (
     GetDelegationsTool,
     GetUnbondingTool,
     GetRedelegationsTool,
+    GetStakingSummaryTool,
 )
 from mcp_scrt.tools.rewards import (
     GetRewardsTool,
     WithdrawRewardsTool,
+    WithdrawRewardsBatchTool,
     SetWithdrawAddressTool,
     GetCommunityPoolTool,
 )
@@ -67,6 +70,7 @@ from mcp_scrt.tools.governance import (
     DepositProposalTool,
     VoteProposalTool,
     GetVoteTool,
+    GetVotesBulkTool,
 )
 from mcp_scrt.tools.contract import (
     UploadContractTool,
@@ -82,6 +86,7 @@ from mcp_scrt.tools.contract import (
 )
 from mcp_scrt.tools.ibc import (
     IBCTransferTool,
+    IBCTransferBatchTool,
     GetIBCChannelsTool,
     GetIBCChannelTool,
     GetIBCDenomTraceTool,
@@ -126,6 +131,7 @@ __all__ = [
     "EstimateGasTool",
     "SimulateTransactionTool",
     "GetTransactionStatusTool",
+    "GetTransactionsBulkTool",
     # Staking tools
     "GetValidatorsTool",
     "GetValidatorTool",
@@ -135,9 +141,11 @@ __all__ = [
     "GetDelegationsTool",
     "GetUnbondingTool",
     "GetRedelegationsTool",
+    "GetStakingSummaryTool",
     # Rewards tools
     "GetRewardsTool",
     "WithdrawRewardsTool",
+    "WithdrawRewardsBatchTool",
     "SetWithdrawAddressTool",
     "GetCommunityPoolTool",
     # Governance tools
@@ -147,6 +155,7 @@ __all__ = [
     "DepositProposalTool",
     "VoteProposalTool",
     "GetVoteTool",
+    "GetVotesBulkTool",
     # Contract tools
     "UploadContractTool",
     "GetCodeInfoTool",
@@ -160,6 +169,7 @@ __all__ = [
     "MigrateContractTool",
     # IBC tools
     "IBCTransferTool",
+    "IBCTransferBatchTool",
     "GetIBCChannelsTool",
     "GetIBCChannelTool",
     "GetIBCDenomTraceTool",
@@ -0,0 +1,62 @@
+"""In-flight query coalescing for read-only tools.
+
+Concurrent tool calls that issue the same LCD query share one upstream
+request: the first caller runs it and later callers await its result.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+# Queries currently running, by canonical query key
+_INFLIGHT: Dict[str, asyncio.Future] = {}
+
+
+async def single_flight(key: str, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Run a query once for all concurrent callers with the same key.
+
+    If a query with the same key is already running, wait for its result
+    (or exception) instead of starting another one. If the caller running
+    it is cancelled (e.g. by its own timeout), one of the waiters starts
+    the query again for the rest. The key is released as soon as the query
+    finishes, so results are never reused afterwards; caching them is up to
+    the caller.
+
+    Args:
+        key: Canonical query signature (e.g., "node_info:testnet")
+        coro_factory: Starts the query; only called if none is running
+
+    Returns:
+        Query result
+
+    Raises:
+        Exception: Whatever the query raised
+    """
+    future = _INFLIGHT.get(key)
+    while future is not None:
+        try:
+            # Shield so a cancelled waiter does not cancel the shared query
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # Only the running query was cancelled, not this waiter: take
+            # over (or wait for whichever waiter already did)
+            if not future.cancelled() or asyncio.current_task().cancelling():
+                raise
+        future = _INFLIGHT.get(key)
+
+    future = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = future
+    try:
+        result = await coro_factory()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Mark the exception retrieved in case no other caller was waiting
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _INFLIGHT.pop(key, None)
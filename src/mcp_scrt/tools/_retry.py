@@ -0,0 +1,97 @@
+"""In-process retries for transient LCD query failures.
+
+A rate-limited or briefly unavailable LCD node is retried after a short
+jittered exponential back-off, instead of failing the whole tool call.
+"""
+
+import asyncio
+import random
+from typing import Any, Awaitable, Callable, Optional, Tuple, Type
+
+from aiohttp import ClientConnectionError, ClientError
+from secret_sdk.exceptions import LCDResponseError
+
+from mcp_scrt.constants import (
+    MAX_RETRIES,
+    RETRY_BACKOFF_MAX,
+    RETRY_JITTER_BASE,
+    TRANSIENT_HTTP_STATUSES,
+)
+
+# Failures of the LCD transport itself. Tools wrap these in NetworkError;
+# anything else is a bug and is reported as an unexpected error.
+TRANSPORT_ERRORS: Tuple[Type[BaseException], ...] = (
+    LCDResponseError,
+    ClientError,
+    ConnectionError,
+    asyncio.TimeoutError,
+)
+
+
+def _is_transient(error: Exception) -> bool:
+    """Check whether a failed query is worth retrying.
+
+    Args:
+        error: Exception raised by the query
+
+    Returns:
+        True for rate limiting, gateway errors, timeouts and lost connections
+    """
+    # LCDResponseError is an OSError, so check it before ConnectionError
+    if isinstance(error, LCDResponseError):
+        return getattr(error.response, "status", None) in TRANSIENT_HTTP_STATUSES
+    return isinstance(error, (ClientConnectionError, ConnectionError, asyncio.TimeoutError))
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Read the Retry-After delay (in seconds) from an LCD error response.
+
+    Args:
+        error: Exception raised by the query
+
+    Returns:
+        Delay in seconds, or None if the response did not give one
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    try:
+        return max(float(headers.get("Retry-After")), 0.0)
+    except (TypeError, ValueError):
+        # Missing, or an HTTP date rather than a number of seconds
+        return None
+
+
+async def with_retries(
+    coro_factory: Callable[[], Awaitable[Any]], max_attempts: int = MAX_RETRIES
+) -> Any:
+    """Run a query, retrying transient failures with jittered back-off.
+
+    Before retry n the query sleeps a random delay of up to
+    RETRY_JITTER_BASE * 2**n seconds, or the LCD's Retry-After if it sent
+    one, capped at RETRY_BACKOFF_MAX. Other failures are raised at once.
+
+    Args:
+        coro_factory: Starts the query; called once per attempt
+        max_attempts: Total attempts, including the first
+
+    Returns:
+        Query result
+
+    Raises:
+        Exception: The last failure, or the first non-transient one
+    """
+    attempt = 1
+    while True:
+        try:
+            return await coro_factory()
+        except Exception as e:
+            if attempt >= max_attempts or not _is_transient(e):
+                raise
+
+            delay = _retry_after(e)
+            if delay is None:
+                delay = random.uniform(0, RETRY_JITTER_BASE * 2**attempt)
+            await asyncio.sleep(min(delay, RETRY_BACKOFF_MAX))
+            attempt += 1
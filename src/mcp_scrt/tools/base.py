@@ -3,16 +3,21 @@
 This module provides the base class and common infrastructure for all MCP tools.
 """
 
+import functools
 import traceback
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
 
+from mcp_scrt.constants import NETWORK_CONFIGS
+from mcp_scrt.core.nonce_cache import NonceCache
+from mcp_scrt.core.proposal_index import ProposalIndex
 from mcp_scrt.core.session import Session
 from mcp_scrt.sdk.client import ClientPool
-from mcp_scrt.types import NetworkType
-from mcp_scrt.utils.errors import SecretMCPError, ValidationError, WalletError
+from mcp_scrt.sdk.signing_pool import SigningClientPool
+from mcp_scrt.types import NetworkConfig, NetworkType, WalletInfo
+from mcp_scrt.utils.errors import NetworkError, SecretMCPError, ValidationError, WalletError
 from mcp_scrt.utils.logging import get_logger
 
 # Module logger
@@ -35,17 +40,88 @@ class ToolCategory(Enum):
     ACCOUNTS = "accounts"
 
 
+ExecuteFunc = Callable[[Any, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+def network_error(
+    action: str,
+    details_from: Tuple[str, ...] = (),
+    suggestions: Optional[List[str]] = None,
+) -> Callable[[ExecuteFunc], ExecuteFunc]:
+    """Translate unexpected exceptions raised by ``execute`` into NetworkError.
+
+    SecretMCPError subclasses (wallet, validation, ...) propagate unchanged.
+    Any other exception becomes a NetworkError whose details contain the
+    requested local variables of the failing ``execute`` call.
+
+    Args:
+        action: Action description used in the message ("Failed to {action}: ...")
+        details_from: Names of ``execute`` locals to copy into the error details
+        suggestions: Suggestions attached to the raised error
+
+    Returns:
+        Decorator for async ``execute`` methods
+
+    Example:
+        @network_error("get code info", details_from=("code_id",))
+        async def execute(self, params):
+            ...
+    """
+    suggestion_list = list(suggestions or [])
+
+    def decorator(func: ExecuteFunc) -> ExecuteFunc:
+        @functools.wraps(func)
+        async def wrapper(self: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                return await func(self, params)
+            except SecretMCPError:
+                raise
+            except Exception as e:
+                # Find the frame of the decorated execute() to read its locals
+                tb = e.__traceback__
+                while tb is not None and tb.tb_frame.f_code is not func.__code__:
+                    tb = tb.tb_next
+                frame_locals = tb.tb_frame.f_locals if tb is not None else {}
+
+                details = {name: frame_locals.get(name) for name in details_from}
+                details["error"] = str(e)
+
+                raise NetworkError(
+                    message=f"Failed to {action}: {str(e)}",
+                    details=details,
+                    suggestions=list(suggestion_list),
+                ) from e
+
+        return wrapper
+
+    return decorator
+
+
 @dataclass
 class ToolExecutionContext:
     """Context for tool execution.
 
     Provides access to session, client pool, and network configuration.
+    The network is fixed for the lifetime of a context, so its string name
+    and configuration are resolved once here instead of on every tool call.
+    network_config is None for custom networks, which have no built-in
+    configuration.
     """
 
     session: Session
     client_pool: ClientPool
     network: NetworkType
     metadata: Dict[str, Any] = field(default_factory=dict)
+    verbose_messages: bool = True
+    signing_pool: SigningClientPool = field(default_factory=SigningClientPool)
+    nonce_cache: NonceCache = field(default_factory=NonceCache)
+    proposal_index: ProposalIndex = field(default_factory=ProposalIndex)
+    network_name: str = field(init=False)
+    network_config: Optional[NetworkConfig] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.network_name = self.network.value
+        self.network_config = NETWORK_CONFIGS.get(self.network)
 
 
 class BaseTool(ABC):
@@ -79,6 +155,20 @@ class BaseTool(ABC):
                 return {"result": params["value"]}
     """
 
+    # Tools only hold their context and logger; subclasses that declare
+    # __slots__ = () too get instances without a __dict__
+    __slots__ = ("context", "_logger")
+
+    # Parameters every call must provide, checked by _check_required_params()
+    REQUIRED: FrozenSet[str] = frozenset()
+
+    # Every parameter the tool accepts, checked by _check_unknown_params();
+    # None accepts any keys
+    ALLOWED: Optional[FrozenSet[str]] = None
+
+    # Example parameter payload shown when required parameters are missing
+    PARAMS_EXAMPLE: str = ""
+
     def __init__(self, context: ToolExecutionContext):
         """Initialize tool with execution context.
 
@@ -140,6 +230,104 @@ class BaseTool(ABC):
         """
         pass
 
+    def _check_required_params(self, params: Dict[str, Any]) -> None:
+        """Check that all REQUIRED parameters are present.
+
+        Uses a single set difference against the parameter keys so every
+        missing parameter is reported at once.
+
+        Args:
+            params: Tool parameters to check
+
+        Raises:
+            ValidationError: If any required parameter is missing
+        """
+        missing = self.REQUIRED - params.keys()
+        if not missing:
+            return
+
+        missing_names = sorted(missing)
+        suggestions = [f"Provide '{name}' parameter" for name in missing_names]
+        if self.PARAMS_EXAMPLE:
+            suggestions.append(f"Example: {self.PARAMS_EXAMPLE}")
+
+        plural = "s" if len(missing_names) > 1 else ""
+        raise ValidationError(
+            message=f"Missing required parameter{plural}: {', '.join(missing_names)}",
+            details={
+                "required_params": sorted(self.REQUIRED),
+                "missing_params": missing_names,
+            },
+            suggestions=suggestions,
+        )
+
+    def _check_unknown_params(self, params: Dict[str, Any]) -> None:
+        """Check that no parameter outside ALLOWED was passed.
+
+        Catches misspelt optional parameters (e.g. 'validator_adress') that
+        would otherwise be silently ignored.
+
+        Args:
+            params: Tool parameters to check
+
+        Raises:
+            ValidationError: If any parameter is not accepted by the tool
+        """
+        if self.ALLOWED is None:
+            return
+
+        unknown = params.keys() - self.ALLOWED
+        if not unknown:
+            return
+
+        unknown_names = sorted(unknown)
+        plural = "s" if len(unknown_names) > 1 else ""
+        raise ValidationError(
+            message=f"Unknown parameter{plural}: {', '.join(unknown_names)}",
+            details={
+                "allowed_params": sorted(self.ALLOWED),
+                "unknown_params": unknown_names,
+            },
+            suggestions=["Check the parameter names for typos"],
+        )
+
+    def _require_wallet(self) -> WalletInfo:
+        """Get the session's active wallet.
+
+        Returns:
+            Active wallet
+
+        Raises:
+            WalletError: If no wallet is loaded
+        """
+        wallet_info = self.context.session.current_wallet
+        if not wallet_info:
+            raise WalletError(
+                message="No active wallet set",
+                details={},
+                suggestions=["Load a wallet using load_wallet"],
+            )
+        return wallet_info
+
+    def _with_message(self, response: Dict[str, Any], template: str) -> Dict[str, Any]:
+        """Attach a human-readable message to a response.
+
+        The template is filled from the response's own fields. When the
+        context has verbose_messages disabled, no message is built at all.
+        verbose_messages only affects responses built through this method;
+        tools that set 'message' directly always include it.
+
+        Args:
+            response: Tool response dict
+            template: Message template, e.g. "Code {code_id} retrieved successfully"
+
+        Returns:
+            The same response dict
+        """
+        if self.context.verbose_messages:
+            response["message"] = template.format_map(response)
+        return response
+
     @abstractmethod
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the tool logic.
@@ -4,44 +4,113 @@ This module provides tools for uploading, instantiating, executing, and querying
 """
 
 from typing import Any, Dict, List, Optional
+import asyncio
 import base64
-import json
 
-from mcp_scrt.tools.base import BaseTool, ToolCategory
-from mcp_scrt.utils.errors import ValidationError, NetworkError, WalletError
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+    import json
+
+from mcp_scrt.tools.base import BaseTool, ToolCategory, network_error
+from mcp_scrt.utils.errors import ValidationError, NetworkError
 from mcp_scrt.core.validation import validate_address
+from mcp_scrt.constants import BATCH_SIMULATION_CONCURRENCY, WASM_DECODE_THREAD_THRESHOLD
 
+# Response message templates (filled from the response dict via format_map)
+_MSG_UPLOAD = "Successfully uploaded contract code. Code ID: {code_id}"
+_MSG_CODE_INFO = "Code {code_id} retrieved successfully"
+_MSG_LIST_CODES = "Retrieved {count} code(s)"
+_MSG_INSTANTIATE = "Successfully instantiated contract at {contract_address}"
+_MSG_EXECUTE = "Successfully executed contract {contract_address}"
+_MSG_QUERY = "Successfully queried contract {contract_address}"
+_MSG_BATCH = "Successfully executed {executions_count} contract call(s)"
+_MSG_CONTRACT_INFO = "Contract {contract_address} retrieved successfully"
+_MSG_HISTORY = "Retrieved {count} history entry/entries for {contract_address}"
+_MSG_MIGRATE = "Successfully migrated contract {contract_address} to code ID {new_code_id}"
 
-# Helper function to create a signing client (placeholder for now)
-async def create_signing_client(wallet_name: str, network: str):
-    """Create a signing client for wallet operations.
 
-    This is a placeholder that will be replaced with actual signing client implementation.
+def _serialize_msg(msg: Any) -> bytes:
+    """Serialize a contract message to compact JSON bytes.
+
+    Uses orjson when installed (encodes straight to bytes in C), otherwise
+    falls back to the stdlib json module with the same compact separators
+    and raw UTF-8 output, so both produce identical bytes.
+
+    Args:
+        msg: Contract message (init_msg, msg, or migrate_msg)
+
+    Returns:
+        UTF-8 encoded JSON bytes
     """
-    # This will be implemented with actual Secret Network signing client
-    class MockSigningClient:
-        async def upload(self, wasm_byte_code: bytes):
-            return {"txhash": "mock_hash", "code": 0, "code_id": 1}
+    if orjson is not None:
+        return orjson.dumps(msg, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(msg, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _serialize_executions(executions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Serialize the 'msg' of each batch execution item.
+
+    Args:
+        executions: Batch execution items
+
+    Returns:
+        Copies of the items with 'msg' encoded to JSON bytes
+    """
+    return [
+        {**execution, "msg": _serialize_msg(execution["msg"])} if "msg" in execution else execution
+        for execution in executions
+    ]
 
-        async def instantiate(
-            self, code_id: int, init_msg: dict, label: str, funds: list = None
-        ):
-            return {
-                "txhash": "mock_hash",
-                "code": 0,
-                "contract_address": "secret1contract...",
-            }
 
-        async def execute(self, contract_address: str, msg: dict, funds: list = None):
-            return {"txhash": "mock_hash", "code": 0}
+class MockSigningClient:
+    """Placeholder signing client returning canned transaction results.
 
-        async def batch_execute(self, executions: list):
-            return {"txhash": "mock_hash", "code": 0}
+    It holds no state, so one shared instance serves every wallet.
+    """
+
+    async def account_sequence(self):
+        return 0
+
+    async def upload(self, wasm_byte_code: memoryview):
+        return {"txhash": "mock_hash", "code": 0, "code_id": 1}
+
+    async def instantiate(
+        self, code_id: int, init_msg: bytes, label: str, funds: list = None
+    ):
+        return {
+            "txhash": "mock_hash",
+            "code": 0,
+            "contract_address": "secret1contract...",
+        }
+
+    async def execute(self, contract_address: str, msg: bytes, funds: list = None):
+        return {"txhash": "mock_hash", "code": 0}
+
+    async def batch_execute(self, executions: list):
+        return {"txhash": "mock_hash", "code": 0}
+
+    async def simulate_execute(self, contract_address: str, msg: bytes, funds: list = None):
+        return {"gas_used": 150000}
 
-        async def migrate(self, contract_address: str, new_code_id: int, migrate_msg: dict):
-            return {"txhash": "mock_hash", "code": 0}
+    async def migrate(
+        self, contract_address: str, new_code_id: int, migrate_msg: bytes, sequence: int = None
+    ):
+        return {"txhash": "mock_hash", "code": 0}
 
-    return MockSigningClient()
+
+_MOCK_SIGNING_CLIENT = MockSigningClient()
+
+
+# Helper function to create a signing client (placeholder for now)
+async def create_signing_client(wallet_name: str, network: str):
+    """Create a signing client for wallet operations.
+
+    This is a placeholder that will be replaced with actual signing client implementation.
+    """
+    # This will be implemented with actual Secret Network signing client
+    return _MOCK_SIGNING_CLIENT
 
 
 class UploadContractTool(BaseTool):
@@ -50,6 +119,11 @@ class UploadContractTool(BaseTool):
     Upload WASM bytecode to the blockchain.
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"wasm_byte_code"})
+    PARAMS_EXAMPLE = "{'wasm_byte_code': 'AGFzbQ...'} (base64 encoded)"
+
     @property
     def name(self) -> str:
         return "upload_contract"
@@ -78,16 +152,16 @@ class UploadContractTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "wasm_byte_code" not in params:
-            raise ValidationError(
-                message="Missing required parameter: wasm_byte_code",
-                details={"required_params": ["wasm_byte_code"]},
-                suggestions=[
-                    "Provide 'wasm_byte_code' parameter (base64 encoded)",
-                    "Example: {'wasm_byte_code': 'AGFzbQ...'}",
-                ],
-            )
-
+        self._check_required_params(params)
+
+    @network_error(
+        "upload contract",
+        details_from=("uploader",),
+        suggestions=[
+            "Check that the WASM bytecode is valid",
+            "Verify network connectivity",
+        ],
+    )
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute upload contract.
 
@@ -100,45 +174,40 @@ class UploadContractTool(BaseTool):
         wasm_byte_code = params["wasm_byte_code"]
 
         # Get active wallet
-        wallet_info = self.context.session.get_wallet()
-        if not wallet_info:
-            raise WalletError(
-                message="No active wallet set",
-                details={},
-                suggestions=["Load a wallet using load_wallet"],
-            )
+        wallet_info = self._require_wallet()
 
         wallet_name = wallet_info.wallet_id
         uploader = wallet_info.address
 
-        try:
-            # Decode base64 WASM bytecode
-            wasm_bytes = base64.b64decode(wasm_byte_code)
-
-            # Create signing client
-            signing_client = await create_signing_client(
-                wallet_name, str(self.context.network.value)
+        # Decode base64 WASM bytecode and create the signing client. Large
+        # payloads are decoded in a worker thread while the client is created.
+        network = self.context.network_name
+        signing_pool = self.context.signing_pool
+        if len(wasm_byte_code) > WASM_DECODE_THREAD_THRESHOLD:
+            decoded, signing_client = await asyncio.gather(
+                asyncio.to_thread(base64.b64decode, wasm_byte_code),
+                signing_pool.get(wallet_name, network, create_signing_client),
             )
+        else:
+            decoded = base64.b64decode(wasm_byte_code)
+            signing_client = await signing_pool.get(wallet_name, network, create_signing_client)
+
+        # The memoryview lets the signing client read the multi-MB blob
+        # without another full copy
+        wasm_bytes = memoryview(decoded)
 
-            # Upload contract
+        # Upload contract
+        with signing_pool.invalidate_on_error(wallet_name, network):
             result = await signing_client.upload(wasm_byte_code=wasm_bytes)
 
-            return {
+        return self._with_message(
+            {
                 "uploader": uploader,
                 "code_id": result.get("code_id"),
                 "txhash": result.get("txhash"),
-                "message": f"Successfully uploaded contract code. Code ID: {result.get('code_id')}",
-            }
-
-        except Exception as e:
-            raise NetworkError(
-                message=f"Failed to upload contract: {str(e)}",
-                details={"uploader": uploader, "error": str(e)},
-                suggestions=[
-                    "Check that the WASM bytecode is valid",
-                    "Verify network connectivity",
-                ],
-            )
+            },
+            _MSG_UPLOAD,
+        )
 
 
 class GetCodeInfoTool(BaseTool):
@@ -147,6 +216,11 @@ class GetCodeInfoTool(BaseTool):
     Query information about uploaded contract code.
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"code_id"})
+    PARAMS_EXAMPLE = "{'code_id': '1'}"
+
     @property
     def name(self) -> str:
         return "get_code_info"
@@ -175,16 +249,16 @@ class GetCodeInfoTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "code_id" not in params:
-            raise ValidationError(
-                message="Missing required parameter: code_id",
-                details={"required_params": ["code_id"]},
-                suggestions=[
-                    "Provide 'code_id' parameter",
-                    "Example: {'code_id': '1'}",
-                ],
-            )
-
+        self._check_required_params(params)
+
+    @network_error(
+        "get code info",
+        details_from=("code_id",),
+        suggestions=[
+            "Check that the code ID exists",
+            "Verify network connectivity",
+        ],
+    )
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute get code info.
 
@@ -196,28 +270,19 @@ class GetCodeInfoTool(BaseTool):
         """
         code_id = str(params["code_id"])
 
-        try:
-            # Query code info using client pool
-            with self.context.client_pool.get_client() as client:
-                code_response = client.wasm.code(code_id)
-
-                code_info = code_response.get("code_info", {})
+        # Query code info on the shared async read client
+        client = self.context.client_pool.async_read_client
+        code_response = await client.wasm.code(code_id)
 
-                return {
-                    "code_id": code_id,
-                    "code_info": code_info,
-                    "message": f"Code {code_id} retrieved successfully",
-                }
+        code_info = code_response.get("code_info", {})
 
-        except Exception as e:
-            raise NetworkError(
-                message=f"Failed to get code info: {str(e)}",
-                details={"code_id": code_id, "error": str(e)},
-                suggestions=[
-                    "Check that the code ID exists",
-                    "Verify network connectivity",
-                ],
-            )
+        return self._with_message(
+            {
+                "code_id": code_id,
+                "code_info": code_info,
+            },
+            _MSG_CODE_INFO,
+        )
 
 
 class ListCodesTool(BaseTool):
@@ -226,6 +291,8 @@ class ListCodesTool(BaseTool):
     List all uploaded contract codes.
     """
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "list_codes"
@@ -254,6 +321,13 @@ class ListCodesTool(BaseTool):
         # No required parameters
         pass
 
+    @network_error(
+        "list codes",
+        suggestions=[
+            "Verify network connectivity",
+            "Try again later",
+        ],
+    )
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute list codes.
 
@@ -263,30 +337,21 @@ class ListCodesTool(BaseTool):
         Returns:
             List of code infos
         """
-        try:
-            # Query codes using client pool
-            with self.context.client_pool.get_client() as client:
-                codes_response = client.wasm.codes()
-
-                code_infos = codes_response.get("code_infos", [])
-                pagination = codes_response.get("pagination", {})
-
-                return {
-                    "code_infos": code_infos,
-                    "count": len(code_infos),
-                    "pagination": pagination,
-                    "message": f"Retrieved {len(code_infos)} code(s)",
-                }
-
-        except Exception as e:
-            raise NetworkError(
-                message=f"Failed to list codes: {str(e)}",
-                details={"error": str(e)},
-                suggestions=[
-                    "Verify network connectivity",
-                    "Try again later",
-                ],
-            )
+        # Query codes on the shared async read client
+        client = self.context.client_pool.async_read_client
+        codes_response = await client.wasm.codes()
+
+        code_infos = codes_response.get("code_infos", [])
+        pagination = codes_response.get("pagination", {})
+
+        return self._with_message(
+            {
+                "code_infos": code_infos,
+                "count": len(code_infos),
+                "pagination": pagination,
+            },
+            _MSG_LIST_CODES,
+        )
 
 
 class InstantiateContractTool(BaseTool):
@@ -295,6 +360,11 @@ class InstantiateContractTool(BaseTool):
     Create a new contract instance from uploaded code.
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"code_id", "label", "init_msg"})
+    PARAMS_EXAMPLE = "{'code_id': '1', 'label': 'my_contract', 'init_msg': {}}"
+
     @property
     def name(self) -> str:
         return "instantiate_contract"
@@ -323,36 +393,17 @@ class InstantiateContractTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "code_id" not in params:
-            raise ValidationError(
-                message="Missing required parameter: code_id",
-                details={"required_params": ["code_id", "label", "init_msg"]},
-                suggestions=[
-                    "Provide 'code_id' parameter",
-                    "Example: {'code_id': '1', 'label': 'my_contract', 'init_msg': {}}",
-                ],
-            )
-
-        if "label" not in params:
-            raise ValidationError(
-                message="Missing required parameter: label",
-                details={"required_params": ["code_id", "label", "init_msg"]},
-                suggestions=[
-                    "Provide 'label' parameter",
-                    "Example: {'code_id': '1', 'label': 'my_contract', 'init_msg': {}}",
-                ],
-            )
-
-        if "init_msg" not in params:
-            raise ValidationError(
-                message="Missing required parameter: init_msg",
-                details={"required_params": ["code_id", "label", "init_msg"]},
-                suggestions=[
-                    "Provide 'init_msg' parameter",
-                    "Example: {'code_id': '1', 'label': 'my_contract', 'init_msg': {}}",
-                ],
-            )
-
+        self._check_required_params(params)
+
+    @network_error(
+        "instantiate contract",
+        details_from=("creator", "code_id", "label"),
+        suggestions=[
+            "Check that the code ID exists",
+            "Verify the init_msg format is correct",
+            "Verify network connectivity",
+        ],
+    )
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute instantiate contract.
 
@@ -368,52 +419,33 @@ class InstantiateContractTool(BaseTool):
         funds = params.get("funds", [])
 
         # Get active wallet
-        wallet_info = self.context.session.get_wallet()
-        if not wallet_info:
-            raise WalletError(
-                message="No active wallet set",
-                details={},
-                suggestions=["Load a wallet using load_wallet"],
-            )
+        wallet_info = self._require_wallet()
 
         wallet_name = wallet_info.wallet_id
         creator = wallet_info.address
 
-        try:
-            # Create signing client
-            signing_client = await create_signing_client(
-                wallet_name, str(self.context.network.value)
-            )
+        # Get (cached) signing client
+        network = self.context.network_name
+        signing_client = await self.context.signing_pool.get(
+            wallet_name, network, create_signing_client
+        )
 
-            # Instantiate contract
+        # Instantiate contract
+        with self.context.signing_pool.invalidate_on_error(wallet_name, network):
             result = await signing_client.instantiate(
-                code_id=code_id, init_msg=init_msg, label=label, funds=funds
+                code_id=code_id, init_msg=_serialize_msg(init_msg), label=label, funds=funds
             )
 
-            return {
+        return self._with_message(
+            {
                 "creator": creator,
                 "code_id": code_id,
                 "label": label,
                 "contract_address": result.get("contract_address"),
                 "txhash": result.get("txhash"),
-                "message": f"Successfully instantiated contract at {result.get('contract_address')}",
-            }
-
-        except Exception as e:
-            raise NetworkError(
-                message=f"Failed to instantiate contract: {str(e)}",
-                details={
-                    "creator": creator,
-                    "code_id": code_id,
-                    "label": label,
-                    "error": str(e),
-                },
-                suggestions=[
-                    "Check that the code ID exists",
-                    "Verify the init_msg format is correct",
-                    "Verify network connectivity",
-                ],
-            )
+            },
+            _MSG_INSTANTIATE,
+        )
 
 
 class ExecuteContractTool(BaseTool):
@@ -422,6 +454,11 @@ class ExecuteContractTool(BaseTool):
     Execute a contract function.
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"contract_address", "msg"})
+    PARAMS_EXAMPLE = "{'contract_address': 'secret1...', 'msg': {}}"
+
     @property
     def name(self) -> str:
         return "execute_contract"
@@ -450,29 +487,20 @@ class ExecuteContractTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "contract_address" not in params:
-            raise ValidationError(
-                message="Missing required parameter: contract_address",
-                details={"required_params": ["contract_address", "msg"]},
-                suggestions=[
-                    "Provide 'contract_address' parameter",
-                    "Example: {'contract_address': 'secret1...', 'msg': {}}",
-                ],
-            )
-
-        if "msg" not in params:
-            raise ValidationError(
-                message="Missing required parameter: msg",
-                details={"required_params": ["contract_address", "msg"]},
-                suggestions=[
-                    "Provide 'msg' parameter",
-                    "Example: {'contract_address': 'secret1...', 'msg': {}}",
-                ],
-            )
+        self._check_required_params(params)
 
         # Validate contract address
         validate_address(params["contract_address"])
 
+    @network_error(
+        "execute contract",
+        details_from=("sender", "contract_address"),
+        suggestions=[
+            "Check that the contract address is correct",
+            "Verify the msg format is correct",
+            "Verify network connectivity",
+        ],
+    )
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute execute contract.
 
@@ -487,49 +515,31 @@ class ExecuteContractTool(BaseTool):
         funds = params.get("funds", [])
 
         # Get active wallet
-        wallet_info = self.context.session.get_wallet()
-        if not wallet_info:
-            raise WalletError(
-                message="No active wallet set",
-                details={},
-                suggestions=["Load a wallet using load_wallet"],
-            )
+        wallet_info = self._require_wallet()
 
         wallet_name = wallet_info.wallet_id
         sender = wallet_info.address
 
-        try:
-            # Create signing client
-            signing_client = await create_signing_client(
-                wallet_name, str(self.context.network.value)
-            )
+        # Get (cached) signing client
+        network = self.context.network_name
+        signing_client = await self.context.signing_pool.get(
+            wallet_name, network, create_signing_client
+        )
 
-            # Execute contract
+        # Execute contract
+        with self.context.signing_pool.invalidate_on_error(wallet_name, network):
             result = await signing_client.execute(
-                contract_address=contract_address, msg=msg, funds=funds
+                contract_address=contract_address, msg=_serialize_msg(msg), funds=funds
             )
 
-            return {
+        return self._with_message(
+            {
                 "sender": sender,
                 "contract_address": contract_address,
                 "txhash": result.get("txhash"),
-                "message": f"Successfully executed contract {contract_address}",
-            }
-
-        except Exception as e:
-            raise NetworkError(
-                message=f"Failed to execute contract: {str(e)}",
-                details={
-                    "sender": sender,
-                    "contract_address": contract_address,
-                    "error": str(e),
-                },
-                suggestions=[
-                    "Check that the contract address is correct",
-                    "Verify the msg format is correct",
-                    "Verify network connectivity",
-                ],
-            )
+            },
+            _MSG_EXECUTE,
+        )
 
 
 class QueryContractTool(BaseTool):
@@ -538,6 +548,11 @@ class QueryContractTool(BaseTool):
     Query a contract's state.
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"contract_address", "query_msg"})
+    PARAMS_EXAMPLE = "{'contract_address': 'secret1...', 'query_msg': {}}"
+
     @property
     def name(self) -> str:
         return "query_contract"
@@ -566,29 +581,20 @@ class QueryContractTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "contract_address" not in params:
-            raise ValidationError(
-                message="Missing required parameter: contract_address",
-                details={"required_params": ["contract_address", "query_msg"]},
-                suggestions=[
-                    "Provide 'contract_address' parameter",
-                    "Example: {'contract_address': 'secret1...', 'query_msg': {}}",
-                ],
-            )
-
-        if "query_msg" not in params:
-            raise ValidationError(
-                message="Missing required parameter: query_msg",
-                details={"required_params": ["contract_address", "query_msg"]},
-                suggestions=[
-                    "Provide 'query_msg' parameter",
-                    "Example: {'contract_address': 'secret1...', 'query_msg': {}}",
-                ],
-            )
+        self._check_required_params(params)
 
         # Validate contract address
         validate_address(params["contract_address"])
 
+    @network_error(
+        "query contract",
+        details_from=("contract_address", "query_msg"),
+        suggestions=[
+            "Check that the contract address is correct",
+            "Verify the query_msg format is correct",
+            "Verify network connectivity",
+        ],
+    )
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute query contract.
 
@@ -601,33 +607,17 @@ class QueryContractTool(BaseTool):
         contract_address = params["contract_address"]
         query_msg = params["query_msg"]
 
-        try:
-            # Query contract using client pool
-            with self.context.client_pool.get_client() as client:
-                query_result = client.wasm.contract_query(
-                    contract_address, query_msg
-                )
-
-                return {
-                    "contract_address": contract_address,
-                    "query_result": query_result,
-                    "message": f"Successfully queried contract {contract_address}",
-                }
+        # Query contract on the shared async read client
+        client = self.context.client_pool.async_read_client
+        query_result = await client.wasm.contract_query(contract_address, query_msg)
 
-        except Exception as e:
-            raise NetworkError(
-                message=f"Failed to query contract: {str(e)}",
-                details={
-                    "contract_address": contract_address,
-                    "query_msg": query_msg,
-                    "error": str(e),
-                },
-                suggestions=[
-                    "Check that the contract address is correct",
-                    "Verify the query_msg format is correct",
-                    "Verify network connectivity",
-                ],
-            )
+        return self._with_message(
+            {
+                "contract_address": contract_address,
+                "query_result": query_result,
+            },
+            _MSG_QUERY,
+        )
 
 
 class BatchExecuteTool(BaseTool):
@@ -636,6 +626,11 @@ class BatchExecuteTool(BaseTool):
     Execute multiple contract calls in a single transaction.
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"executions"})
+    PARAMS_EXAMPLE = "{'executions': [{'contract_address': '...', 'msg': {}}]}"
+
     @property
     def name(self) -> str:
         return "batch_execute"
@@ -659,20 +654,13 @@ class BatchExecuteTool(BaseTool):
         """Validate batch execute parameters.
 
         Args:
-            params: Must contain 'executions' (list of contract calls)
+            params: Must contain 'executions' (list of contract calls),
+                optionally 'simulate' to dry-run all calls before signing
 
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "executions" not in params:
-            raise ValidationError(
-                message="Missing required parameter: executions",
-                details={"required_params": ["executions"]},
-                suggestions=[
-                    "Provide 'executions' parameter as a list",
-                    "Example: {'executions': [{'contract_address': '...', 'msg': {}}]}",
-                ],
-            )
+        self._check_required_params(params)
 
         executions = params["executions"]
         if not isinstance(executions, list) or len(executions) == 0:
@@ -685,60 +673,116 @@ class BatchExecuteTool(BaseTool):
                 ],
             )
 
+        # Validate simulate if provided
+        if "simulate" in params and not isinstance(params["simulate"], bool):
+            raise ValidationError(
+                message=f"Invalid simulate: {params['simulate']}",
+                details={"provided_type": type(params["simulate"]).__name__},
+                suggestions=[
+                    "simulate must be true or false",
+                    "Example: {'executions': [...], 'simulate': true}",
+                ],
+            )
+
+    @network_error(
+        "batch execute contracts",
+        details_from=("sender", "executions_count"),
+        suggestions=[
+            "Check that all contract addresses are correct",
+            "Verify all msg formats are correct",
+            "Verify network connectivity",
+        ],
+    )
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute batch execute.
 
         Args:
-            params: Parameters including executions list
+            params: Parameters including executions list and optional simulate flag
 
         Returns:
-            Transaction result
+            Transaction result, with total gas_estimate when simulated
         """
         executions = params["executions"]
+        executions_count = len(executions)
+        simulate = params.get("simulate", False)
 
         # Get active wallet
-        wallet_info = self.context.session.get_wallet()
-        if not wallet_info:
-            raise WalletError(
-                message="No active wallet set",
-                details={},
-                suggestions=["Load a wallet using load_wallet"],
-            )
+        wallet_info = self._require_wallet()
 
         wallet_name = wallet_info.wallet_id
         sender = wallet_info.address
 
-        try:
-            # Create signing client
-            signing_client = await create_signing_client(
-                wallet_name, str(self.context.network.value)
-            )
+        # Get (cached) signing client
+        network = self.context.network_name
+        signing_client = await self.context.signing_pool.get(
+            wallet_name, network, create_signing_client
+        )
 
-            # Batch execute contracts
-            result = await signing_client.batch_execute(executions=executions)
+        serialized = _serialize_executions(executions)
 
-            return {
-                "sender": sender,
-                "executions_count": len(executions),
-                "txhash": result.get("txhash"),
-                "message": f"Successfully executed {len(executions)} contract call(s)",
-            }
+        # Optionally dry-run every item concurrently before signing. A
+        # rejected simulation says nothing about the client, so it stays
+        # outside the invalidation block.
+        gas_estimate = None
+        if simulate:
+            gas_estimate = await self._simulate_executions(signing_client, serialized)
+
+        with self.context.signing_pool.invalidate_on_error(wallet_name, network):
+            # Batch execute contracts with pre-serialized messages
+            result = await signing_client.batch_execute(executions=serialized)
+
+        response = {
+            "sender": sender,
+            "executions_count": executions_count,
+            "txhash": result.get("txhash"),
+        }
+        if gas_estimate is not None:
+            response["gas_estimate"] = gas_estimate
+        return self._with_message(response, _MSG_BATCH)
+
+    async def _simulate_executions(
+        self, signing_client: Any, executions: List[Dict[str, Any]]
+    ) -> int:
+        """Simulate all batch items concurrently and sum their gas usage.
+
+        At most BATCH_SIMULATION_CONCURRENCY simulations are in flight at once,
+        all sharing the same signing client connection.
+
+        Args:
+            signing_client: Signing client used for the batch
+            executions: Batch items with serialized messages
+
+        Returns:
+            Total gas used across all items
+
+        Raises:
+            NetworkError: If any item fails simulation
+        """
+        semaphore = asyncio.Semaphore(BATCH_SIMULATION_CONCURRENCY)
+
+        async def simulate_one(execution: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await signing_client.simulate_execute(
+                    contract_address=execution.get("contract_address"),
+                    msg=execution.get("msg"),
+                    funds=execution.get("funds", []),
+                )
+
+        results = await asyncio.gather(
+            *(simulate_one(execution) for execution in executions),
+            return_exceptions=True,
+        )
 
-        except Exception as e:
+        failed = [index for index, r in enumerate(results) if isinstance(r, BaseException)]
+        if failed:
             raise NetworkError(
-                message=f"Failed to batch execute contracts: {str(e)}",
-                details={
-                    "sender": sender,
-                    "executions_count": len(executions),
-                    "error": str(e),
-                },
-                suggestions=[
-                    "Check that all contract addresses are correct",
-                    "Verify all msg formats are correct",
-                    "Verify network connectivity",
-                ],
+                message=f"Simulation failed for execution(s) {failed}",
+                details={"failed_indices": failed, "error": str(results[failed[0]])},
+                suggestions=["Fix the failing executions before submitting the batch"],
             )
 
+        return sum(int(r.get("gas_used", 0)) for r in results)
+
 
 class GetContractInfoTool(BaseTool):
     """Get contract info.
@@ -746,6 +790,11 @@ class GetContractInfoTool(BaseTool):
     Query information about an instantiated contract.
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"contract_address"})
+    PARAMS_EXAMPLE = "{'contract_address': 'secret1...'}"
+
     @property
     def name(self) -> str:
         return "get_contract_info"
@@ -774,19 +823,20 @@ class GetContractInfoTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "contract_address" not in params:
-            raise ValidationError(
-                message="Missing required parameter: contract_address",
-                details={"required_params": ["contract_address"]},
-                suggestions=[
-                    "Provide 'contract_address' parameter",
-                    "Example: {'contract_address': 'secret1...'}",
-                ],
-            )
+        self._check_required_params(params)
 
         # Validate contract address
         validate_address(params["contract_address"])
 
+    @network_error(
+        "get contract info",
+        details_from=("contract_address",),
+        suggestions=[
+            "Check that the contract address is correct",
+            "Verify the contract exists",
+            "Verify network connectivity",
+        ],
+    )
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute get contract info.
 
@@ -798,29 +848,19 @@ class GetContractInfoTool(BaseTool):
         """
         contract_address = params["contract_address"]
 
-        try:
-            # Query contract info using client pool
-            with self.context.client_pool.get_client() as client:
-                info_response = client.wasm.contract_info(contract_address)
+        # Query contract info on the shared async read client
+        client = self.context.client_pool.async_read_client
+        info_response = await client.wasm.contract_info(contract_address)
 
-                contract_info = info_response.get("contract_info", {})
+        contract_info = info_response.get("contract_info", {})
 
-                return {
-                    "contract_address": contract_address,
-                    "contract_info": contract_info,
-                    "message": f"Contract {contract_address} retrieved successfully",
-                }
-
-        except Exception as e:
-            raise NetworkError(
-                message=f"Failed to get contract info: {str(e)}",
-                details={"contract_address": contract_address, "error": str(e)},
-                suggestions=[
-                    "Check that the contract address is correct",
-                    "Verify the contract exists",
-                    "Verify network connectivity",
-                ],
-            )
+        return self._with_message(
+            {
+                "contract_address": contract_address,
+                "contract_info": contract_info,
+            },
+            _MSG_CONTRACT_INFO,
+        )
 
 
 class GetContractHistoryTool(BaseTool):
@@ -829,6 +869,11 @@ class GetContractHistoryTool(BaseTool):
     Query the history of a contract (init, migrate events).
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"contract_address"})
+    PARAMS_EXAMPLE = "{'contract_address': 'secret1...'}"
+
     @property
     def name(self) -> str:
         return "get_contract_history"
@@ -857,19 +902,20 @@ class GetContractHistoryTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "contract_address" not in params:
-            raise ValidationError(
-                message="Missing required parameter: contract_address",
-                details={"required_params": ["contract_address"]},
-                suggestions=[
-                    "Provide 'contract_address' parameter",
-                    "Example: {'contract_address': 'secret1...'}",
-                ],
-            )
+        self._check_required_params(params)
 
         # Validate contract address
         validate_address(params["contract_address"])
 
+    @network_error(
+        "get contract history",
+        details_from=("contract_address",),
+        suggestions=[
+            "Check that the contract address is correct",
+            "Verify the contract exists",
+            "Verify network connectivity",
+        ],
+    )
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute get contract history.
 
@@ -881,32 +927,22 @@ class GetContractHistoryTool(BaseTool):
         """
         contract_address = params["contract_address"]
 
-        try:
-            # Query contract history using client pool
-            with self.context.client_pool.get_client() as client:
-                history_response = client.wasm.contract_history(contract_address)
-
-                entries = history_response.get("entries", [])
-                pagination = history_response.get("pagination", {})
+        # Query contract history on the shared async read client
+        client = self.context.client_pool.async_read_client
+        history_response = await client.wasm.contract_history(contract_address)
 
-                return {
-                    "contract_address": contract_address,
-                    "entries": entries,
-                    "count": len(entries),
-                    "pagination": pagination,
-                    "message": f"Retrieved {len(entries)} history entry/entries for {contract_address}",
-                }
+        entries = history_response.get("entries", [])
+        pagination = history_response.get("pagination", {})
 
-        except Exception as e:
-            raise NetworkError(
-                message=f"Failed to get contract history: {str(e)}",
-                details={"contract_address": contract_address, "error": str(e)},
-                suggestions=[
-                    "Check that the contract address is correct",
-                    "Verify the contract exists",
-                    "Verify network connectivity",
-                ],
-            )
+        return self._with_message(
+            {
+                "contract_address": contract_address,
+                "entries": entries,
+                "count": len(entries),
+                "pagination": pagination,
+            },
+            _MSG_HISTORY,
+        )
 
 
 class MigrateContractTool(BaseTool):
@@ -915,6 +951,11 @@ class MigrateContractTool(BaseTool):
     Migrate a contract to new code.
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"contract_address", "new_code_id", "migrate_msg"})
+    PARAMS_EXAMPLE = "{'contract_address': 'secret1...', 'new_code_id': '2', 'migrate_msg': {}}"
+
     @property
     def name(self) -> str:
         return "migrate_contract"
@@ -943,57 +984,21 @@ class MigrateContractTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "contract_address" not in params:
-            raise ValidationError(
-                message="Missing required parameter: contract_address",
-                details={
-                    "required_params": [
-                        "contract_address",
-                        "new_code_id",
-                        "migrate_msg",
-                    ]
-                },
-                suggestions=[
-                    "Provide 'contract_address' parameter",
-                    "Example: {'contract_address': 'secret1...', 'new_code_id': '2', 'migrate_msg': {}}",
-                ],
-            )
-
-        if "new_code_id" not in params:
-            raise ValidationError(
-                message="Missing required parameter: new_code_id",
-                details={
-                    "required_params": [
-                        "contract_address",
-                        "new_code_id",
-                        "migrate_msg",
-                    ]
-                },
-                suggestions=[
-                    "Provide 'new_code_id' parameter",
-                    "Example: {'contract_address': 'secret1...', 'new_code_id': '2', 'migrate_msg': {}}",
-                ],
-            )
-
-        if "migrate_msg" not in params:
-            raise ValidationError(
-                message="Missing required parameter: migrate_msg",
-                details={
-                    "required_params": [
-                        "contract_address",
-                        "new_code_id",
-                        "migrate_msg",
-                    ]
-                },
-                suggestions=[
-                    "Provide 'migrate_msg' parameter",
-                    "Example: {'contract_address': 'secret1...', 'new_code_id': '2', 'migrate_msg': {}}",
-                ],
-            )
+        self._check_required_params(params)
 
         # Validate contract address
         validate_address(params["contract_address"])
 
+    @network_error(
+        "migrate contract",
+        details_from=("sender", "contract_address", "new_code_id"),
+        suggestions=[
+            "Check that you are the contract admin",
+            "Verify the new code ID exists",
+            "Verify the migrate_msg format is correct",
+            "Verify network connectivity",
+        ],
+    )
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute migrate contract.
 
@@ -1008,51 +1013,38 @@ class MigrateContractTool(BaseTool):
         migrate_msg = params["migrate_msg"]
 
         # Get active wallet
-        wallet_info = self.context.session.get_wallet()
-        if not wallet_info:
-            raise WalletError(
-                message="No active wallet set",
-                details={},
-                suggestions=["Load a wallet using load_wallet"],
-            )
+        wallet_info = self._require_wallet()
 
         wallet_name = wallet_info.wallet_id
         sender = wallet_info.address
 
-        try:
-            # Create signing client
-            signing_client = await create_signing_client(
-                wallet_name, str(self.context.network.value)
-            )
+        # Get (cached) signing client
+        network = self.context.network_name
+        signing_client = await self.context.signing_pool.get(
+            wallet_name, network, create_signing_client
+        )
 
-            # Migrate contract
-            result = await signing_client.migrate(
-                contract_address=contract_address,
-                new_code_id=new_code_id,
-                migrate_msg=migrate_msg,
+        # Migrate contract with the next cached account sequence
+        serialized_msg = _serialize_msg(migrate_msg)
+        with self.context.signing_pool.invalidate_on_error(wallet_name, network):
+            result = await self.context.nonce_cache.submit(
+                wallet_name,
+                network,
+                signing_client.account_sequence,
+                lambda sequence: signing_client.migrate(
+                    contract_address=contract_address,
+                    new_code_id=new_code_id,
+                    migrate_msg=serialized_msg,
+                    sequence=sequence,
+                ),
             )
 
-            return {
+        return self._with_message(
+            {
                 "sender": sender,
                 "contract_address": contract_address,
                 "new_code_id": new_code_id,
                 "txhash": result.get("txhash"),
-                "message": f"Successfully migrated contract {contract_address} to code ID {new_code_id}",
-            }
-
-        except Exception as e:
-            raise NetworkError(
-                message=f"Failed to migrate contract: {str(e)}",
-                details={
-                    "sender": sender,
-                    "contract_address": contract_address,
-                    "new_code_id": new_code_id,
-                    "error": str(e),
-                },
-                suggestions=[
-                    "Check that you are the contract admin",
-                    "Verify the new code ID exists",
-                    "Verify the migrate_msg format is correct",
-                    "Verify network connectivity",
-                ],
-            )
+            },
+            _MSG_MIGRATE,
+        )
@@ -4,10 +4,202 @@ This module provides tools for proposals, voting, and deposits.
 """
 
 from typing import Any, Dict, Optional
+import asyncio
+
+from secret_sdk.client.lcd.params import PaginationOptions
+from secret_sdk.exceptions import LCDResponseError
 
 from mcp_scrt.tools.base import BaseTool, ToolCategory
-from mcp_scrt.utils.errors import ValidationError, NetworkError, WalletError
+from mcp_scrt.utils.errors import ValidationError, NetworkError
+from mcp_scrt.core.cache import Cache
+from mcp_scrt.core.proposal_index import ProposalIndex
 from mcp_scrt.core.validation import validate_address, validate_amount
+from mcp_scrt.sdk.client import ClientPool
+from mcp_scrt.constants import (
+    BULK_QUERY_CONCURRENCY,
+    CACHE_TTL,
+    FINALIZED_PROPOSAL_STATUSES,
+    PROPOSALS_MAX_LIMIT,
+    PROPOSALS_PAGE_LIMIT,
+)
+
+# Proposal statuses in lifecycle order (the order is kept for error details)
+_PROPOSAL_STATUSES = (
+    "PROPOSAL_STATUS_DEPOSIT_PERIOD",
+    "PROPOSAL_STATUS_VOTING_PERIOD",
+    "PROPOSAL_STATUS_PASSED",
+    "PROPOSAL_STATUS_REJECTED",
+    "PROPOSAL_STATUS_FAILED",
+)
+_VALID_PROPOSAL_STATUSES = frozenset(_PROPOSAL_STATUSES)
+_PROPOSAL_STATUS_SUGGESTION = "Use one of: " + ", ".join(_PROPOSAL_STATUSES)
+
+_VOTE_OPTIONS = (
+    "VOTE_OPTION_YES",
+    "VOTE_OPTION_NO",
+    "VOTE_OPTION_ABSTAIN",
+    "VOTE_OPTION_NO_WITH_VETO",
+)
+_VALID_VOTE_OPTIONS = frozenset(_VOTE_OPTIONS)
+_VOTE_OPTION_SUGGESTION = "Use one of: " + ", ".join(_VOTE_OPTIONS)
+
+# LCD statuses meaning "no such vote": v0.45 gov reports a missing vote as
+# InvalidArgument (400), newer versions as NotFound (404). Proposal IDs and
+# voters are validated first (see _is_proposal_id), so a 400 from the vote
+# query means the vote is missing.
+_VOTE_NOT_FOUND_STATUSES = frozenset({400, 404})
+
+# Response message templates (filled from the response dict via format_map)
+_MSG_PROPOSALS = "Retrieved {count} proposal(s)"
+_MSG_PROPOSAL = "Proposal {proposal_id} retrieved successfully"
+_MSG_SUBMIT = "Successfully submitted proposal: {title}"
+_MSG_DEPOSIT = "Successfully deposited {amount} {denom} to proposal {proposal_id}"
+_MSG_VOTE = "Successfully voted {option} on proposal {proposal_id}"
+_MSG_NO_VOTE = "No vote found for proposal {proposal_id} by {voter}"
+_MSG_GET_VOTE = "Retrieved vote for proposal {proposal_id} by {voter}"
+_MSG_VOTES = "Retrieved {found} vote(s) for {count} query(ies)"
+
+# Proposal cache shared across tool instances (tools are created per call).
+# Finalized proposals use the default TTL, open ones a short TTL.
+_proposal_cache = Cache(default_ttl=CACHE_TTL["proposals"], max_size=1000)
+
+
+def _is_proposal_id(value: Any) -> bool:
+    """Check whether a value is a positive integer proposal ID (int or digits)."""
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return value > 0
+    return isinstance(value, str) and value.isascii() and value.isdigit() and int(value) > 0
+
+
+def _proposal_cache_key(network: str, proposal_id: Any) -> str:
+    """Build the proposal cache key."""
+    return f"proposal:{network}:{proposal_id}"
+
+
+def _cache_proposal(network: str, proposal_id: str, proposal: Dict[str, Any]) -> None:
+    """Store a proposal in the proposal cache.
+
+    Finalized proposals keep the default (long) TTL, open ones a short TTL.
+
+    Args:
+        network: Network name (e.g., "testnet")
+        proposal_id: Proposal ID
+        proposal: Proposal dict
+    """
+    cache_key = _proposal_cache_key(network, proposal_id)
+    if proposal.get("status") in FINALIZED_PROPOSAL_STATUSES:
+        _proposal_cache.set(cache_key, proposal)
+    else:
+        _proposal_cache.set(cache_key, proposal, ttl=CACHE_TTL["active_proposals"])
+
+
+async def _fetch_proposal(
+    client_pool: ClientPool, network: str, proposal_id: str
+) -> Dict[str, Any]:
+    """Fetch a proposal, serving it from the proposal cache when possible.
+
+    Awaits the pool's shared async read client, so several fetches can run
+    concurrently on the event loop.
+
+    Args:
+        client_pool: Client pool to query with on a cache miss
+        network: Network name (e.g., "testnet")
+        proposal_id: Proposal ID
+
+    Returns:
+        Proposal dict (empty if the response has no proposal)
+    """
+    proposal = _proposal_cache.get(_proposal_cache_key(network, proposal_id))
+    if proposal is not None:
+        return proposal
+
+    proposal_response = await client_pool.async_read_client.gov.proposal(proposal_id)
+
+    proposal = proposal_response.get("proposal", {})
+    if proposal:
+        _cache_proposal(network, proposal_id, proposal)
+
+    return proposal
+
+
+def _proposal_page_fetcher(client_pool: ClientPool):
+    """Build the page fetcher the proposal index refreshes with.
+
+    Pages come newest first so a refresh can stop at the first proposal
+    the index already holds.
+
+    Args:
+        client_pool: Client pool to query with
+
+    Returns:
+        Async callable fetching one page of proposals with a status
+    """
+
+    async def fetch_page(status: str, pagination_key: Optional[str]) -> Dict[str, Any]:
+        page = PaginationOptions(key=pagination_key, limit=PROPOSALS_PAGE_LIMIT, reverse=True)
+        return await client_pool.async_read_client.gov.proposals(
+            proposal_status=status, params=page
+        )
+
+    return fetch_page
+
+
+async def _query_vote(client: Any, proposal_id: str, voter: str) -> Optional[Dict[str, Any]]:
+    """Query a vote on an async LCD client.
+
+    Args:
+        client: Async LCD client to query with
+        proposal_id: Proposal ID
+        voter: Voter address
+
+    Returns:
+        Vote dict, or None if the voter has not voted on the proposal
+
+    Raises:
+        Exception: If the query fails for any other reason
+    """
+    try:
+        vote_response = await client.gov.vote(proposal_id=proposal_id, voter=voter)
+    except LCDResponseError as e:
+        if e.response.status not in _VOTE_NOT_FOUND_STATUSES:
+            raise
+        return None
+
+    return vote_response.get("vote", {})
+
+
+def invalidate_proposal(network: str, proposal_id: Any) -> None:
+    """Drop a cached proposal after a transaction changed it.
+
+    Args:
+        network: Network name (e.g., "testnet")
+        proposal_id: Proposal ID
+    """
+    _proposal_cache.delete(_proposal_cache_key(network, proposal_id))
+
+
+class MockSigningClient:
+    """Placeholder signing client returning canned transaction results.
+
+    It holds no state, so one shared instance serves every wallet.
+    """
+
+    async def account_sequence(self):
+        return 0
+
+    async def submit_proposal(self, content: dict, initial_deposit: list, sequence: int = None):
+        return {"txhash": "mock_hash", "code": 0}
+
+    async def deposit(self, proposal_id: int, amount: list, sequence: int = None):
+        return {"txhash": "mock_hash", "code": 0}
+
+    async def vote(self, proposal_id: int, option: str, sequence: int = None):
+        return {"txhash": "mock_hash", "code": 0}
+
+
+_MOCK_SIGNING_CLIENT = MockSigningClient()
 
 
 # Helper function to create a signing client (placeholder for now)
@@ -17,17 +209,7 @@ async def create_signing_client(wallet_name: str, network: str):
     This is a placeholder that will be replaced with actual signing client implementation.
     """
     # This will be implemented with actual Secret Network signing client
-    class MockSigningClient:
-        async def submit_proposal(self, content: dict, initial_deposit: list):
-            return {"txhash": "mock_hash", "code": 0}
-
-        async def deposit(self, proposal_id: int, amount: list):
-            return {"txhash": "mock_hash", "code": 0}
-
-        async def vote(self, proposal_id: int, option: str):
-            return {"txhash": "mock_hash", "code": 0}
-
-    return MockSigningClient()
+    return _MOCK_SIGNING_CLIENT
 
 
 class GetProposalsTool(BaseTool):
@@ -36,6 +218,8 @@ class GetProposalsTool(BaseTool):
     Query all governance proposals with optional status filter.
     """
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "get_proposals"
@@ -43,7 +227,7 @@ class GetProposalsTool(BaseTool):
     @property
     def description(self) -> str:
         return (
-            "Get all governance proposals. "
+            "Get governance proposals, one page of up to max_items at a time. "
             "Optionally filter by status (voting, passed, rejected, deposit)."
         )
 
@@ -59,7 +243,8 @@ class GetProposalsTool(BaseTool):
         """Validate get proposals parameters.
 
         Args:
-            params: Optionally contains 'status'
+            params: Optionally contains 'status', 'include_details',
+                'max_items' and 'pagination_key'
 
         Raises:
             ValidationError: If parameters are invalid
@@ -67,50 +252,137 @@ class GetProposalsTool(BaseTool):
         # Status is optional, but if provided should be valid
         if "status" in params:
             status = params["status"]
-            valid_statuses = [
-                "PROPOSAL_STATUS_DEPOSIT_PERIOD",
-                "PROPOSAL_STATUS_VOTING_PERIOD",
-                "PROPOSAL_STATUS_PASSED",
-                "PROPOSAL_STATUS_REJECTED",
-                "PROPOSAL_STATUS_FAILED",
-            ]
-            if status not in valid_statuses:
+            if status not in _VALID_PROPOSAL_STATUSES:
                 raise ValidationError(
                     message=f"Invalid status: {status}",
-                    details={"provided": status, "valid_values": valid_statuses},
+                    details={"provided": status, "valid_values": list(_PROPOSAL_STATUSES)},
+                    suggestions=[_PROPOSAL_STATUS_SUGGESTION],
+                )
+
+        # Validate max_items if provided
+        if "max_items" in params:
+            max_items = params["max_items"]
+            if (
+                not isinstance(max_items, int)
+                or isinstance(max_items, bool)
+                or not 1 <= max_items <= PROPOSALS_MAX_LIMIT
+            ):
+                raise ValidationError(
+                    message=f"Invalid max_items: {max_items}",
+                    details={"provided": max_items, "max_limit": PROPOSALS_MAX_LIMIT},
+                    suggestions=[
+                        f"max_items must be an integer from 1 to {PROPOSALS_MAX_LIMIT}",
+                        f"Example: {{'max_items': {PROPOSALS_PAGE_LIMIT}}}",
+                    ],
+                )
+
+        # LCD pagination keys are opaque, but keys handed out by the proposal
+        # index must be well formed and continue a finalized-status listing
+        pagination_key = params.get("pagination_key")
+        if ProposalIndex.owns_key(pagination_key):
+            ProposalIndex.key_offset(pagination_key)
+            if params.get("status") not in FINALIZED_PROPOSAL_STATUSES:
+                raise ValidationError(
+                    message="pagination_key continues a listing of finalized proposals",
+                    details={"provided": pagination_key, "status": params.get("status")},
                     suggestions=[
-                        "Use one of: PROPOSAL_STATUS_DEPOSIT_PERIOD, PROPOSAL_STATUS_VOTING_PERIOD, "
-                        "PROPOSAL_STATUS_PASSED, PROPOSAL_STATUS_REJECTED, PROPOSAL_STATUS_FAILED",
+                        "Pass the same status as the request that returned the key",
+                        "Omit pagination_key to start from the first page",
                     ],
                 )
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute get proposals.
 
+        Returns at most max_items proposals; pass the returned next_key as
+        pagination_key to fetch the following page.
+
         Args:
-            params: Parameters optionally including status
+            params: Parameters optionally including status, include_details,
+                max_items and pagination_key
 
         Returns:
-            List of proposals
+            Page of proposals (with full details if include_details is set)
         """
         status = params.get("status", "")
-
-        try:
-            # Query proposals using client pool
-            with self.context.client_pool.get_client() as client:
-                proposals_response = client.gov.proposals(
-                    proposal_status=status
+        include_details = params.get("include_details", False)
+        pagination_key = params.get("pagination_key")
+        max_items = params.get("max_items", PROPOSALS_PAGE_LIMIT)
+
+        if status in FINALIZED_PROPOSAL_STATUSES:
+            # Finalized proposals never change: answer from the in-memory
+            # index once it has synced, refreshing it in the background
+            index = self.context.proposal_index
+            if index.stale:
+                index.schedule_refresh(_proposal_page_fetcher(self.context.client_pool))
+            if index.ready and (pagination_key is None or index.owns_key(pagination_key)):
+                proposals, next_key, total = index.page(status, max_items, pagination_key)
+                return self._with_message(
+                    {
+                        "proposals": proposals,
+                        "count": len(proposals),
+                        "pagination": {"next_key": next_key, "total": str(total)},
+                        "next_key": next_key,
+                    },
+                    _MSG_PROPOSALS,
                 )
 
-                proposals = proposals_response.get("proposals", [])
-                pagination = proposals_response.get("pagination", {})
+        if ProposalIndex.owns_key(pagination_key):
+            # The key came from an index that is not ready (e.g. the server
+            # restarted since); the LCD cannot continue it
+            raise ValidationError(
+                message="pagination_key has expired: the proposal index is not ready",
+                details={"provided": pagination_key},
+                suggestions=[
+                    "Omit pagination_key to start from the first page",
+                    "Try again shortly, once the proposal index has synced",
+                ],
+            )
 
-                return {
+        page = PaginationOptions(key=pagination_key, limit=max_items)
+
+        try:
+            # Query proposals on the shared async read client, awaited on
+            # the event loop
+            client = self.context.client_pool.async_read_client
+            proposals_response = await client.gov.proposals(proposal_status=status, params=page)
+
+            proposals = proposals_response.get("proposals", [])
+            pagination = proposals_response.get("pagination", {})
+
+            network = self.context.network_name
+            if include_details and proposals:
+                # Fetch every proposal concurrently instead of one round-trip
+                # after another
+                proposals = list(
+                    await asyncio.gather(
+                        *(
+                            _fetch_proposal(
+                                self.context.client_pool,
+                                network,
+                                str(proposal.get("proposal_id")),
+                            )
+                            for proposal in proposals
+                        )
+                    )
+                )
+            else:
+                # The list already carries every proposal in full; cache them
+                # so follow-up get_proposal calls need no round-trip
+                for proposal in proposals:
+                    if "proposal_id" in proposal:
+                        _cache_proposal(network, str(proposal["proposal_id"]), proposal)
+                        self.context.proposal_index.add(proposal)
+
+            return self._with_message(
+                {
                     "proposals": proposals,
                     "count": len(proposals),
                     "pagination": pagination,
-                    "message": f"Retrieved {len(proposals)} proposal(s)",
-                }
+                    "next_key": pagination.get("next_key"),
+                },
+                _MSG_PROPOSALS,
+            )
 
         except Exception as e:
             raise NetworkError(
@@ -129,6 +401,11 @@ class GetProposalTool(BaseTool):
     Query details for a specific proposal by ID.
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"proposal_id"})
+    PARAMS_EXAMPLE = "{'proposal_id': '1'}"
+
     @property
     def name(self) -> str:
         return "get_proposal"
@@ -157,15 +434,7 @@ class GetProposalTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "proposal_id" not in params:
-            raise ValidationError(
-                message="Missing required parameter: proposal_id",
-                details={"required_params": ["proposal_id"]},
-                suggestions=[
-                    "Provide 'proposal_id' parameter",
-                    "Example: {'proposal_id': '1'}",
-                ],
-            )
+        self._check_required_params(params)
 
         proposal_id = params["proposal_id"]
         if not isinstance(proposal_id, (str, int)):
@@ -174,7 +443,7 @@ class GetProposalTool(BaseTool):
                 details={"provided": proposal_id},
                 suggestions=[
                     "Provide a valid proposal ID",
-                    "Example: {'proposal_id': '1'}",
+                    f"Example: {self.PARAMS_EXAMPLE}",
                 ],
             )
 
@@ -190,17 +459,22 @@ class GetProposalTool(BaseTool):
         proposal_id = str(params["proposal_id"])
 
         try:
-            # Query proposal using client pool
-            with self.context.client_pool.get_client() as client:
-                proposal_response = client.gov.proposal(proposal_id)
-
-                proposal = proposal_response.get("proposal", {})
-
-                return {
+            # Serve index and cache hits inline; only a miss queries the LCD
+            network = self.context.network_name
+            proposal = self.context.proposal_index.get(proposal_id)
+            if proposal is None:
+                proposal = _proposal_cache.get(_proposal_cache_key(network, proposal_id))
+            if proposal is None:
+                proposal = await _fetch_proposal(self.context.client_pool, network, proposal_id)
+                self.context.proposal_index.add(proposal)
+
+            return self._with_message(
+                {
                     "proposal_id": proposal_id,
                     "proposal": proposal,
-                    "message": f"Proposal {proposal_id} retrieved successfully",
-                }
+                },
+                _MSG_PROPOSAL,
+            )
 
         except Exception as e:
             raise NetworkError(
@@ -220,6 +494,11 @@ class SubmitProposalTool(BaseTool):
     Submit a new governance proposal.
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"title", "description", "initial_deposit"})
+    PARAMS_EXAMPLE = "{'title': 'My Proposal', 'description': '...', 'initial_deposit': '1000000'}"
+
     @property
     def name(self) -> str:
         return "submit_proposal"
@@ -248,41 +527,7 @@ class SubmitProposalTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "title" not in params:
-            raise ValidationError(
-                message="Missing required parameter: title",
-                details={
-                    "required_params": ["title", "description", "initial_deposit"]
-                },
-                suggestions=[
-                    "Provide 'title' parameter",
-                    "Example: {'title': 'My Proposal', 'description': '...', 'initial_deposit': '1000000'}",
-                ],
-            )
-
-        if "description" not in params:
-            raise ValidationError(
-                message="Missing required parameter: description",
-                details={
-                    "required_params": ["title", "description", "initial_deposit"]
-                },
-                suggestions=[
-                    "Provide 'description' parameter",
-                    "Example: {'title': 'My Proposal', 'description': '...', 'initial_deposit': '1000000'}",
-                ],
-            )
-
-        if "initial_deposit" not in params:
-            raise ValidationError(
-                message="Missing required parameter: initial_deposit",
-                details={
-                    "required_params": ["title", "description", "initial_deposit"]
-                },
-                suggestions=[
-                    "Provide 'initial_deposit' parameter",
-                    "Example: {'title': 'My Proposal', 'description': '...', 'initial_deposit': '1000000'}",
-                ],
-            )
+        self._check_required_params(params)
 
         # Validate initial deposit
         validate_amount(params["initial_deposit"], params.get("denom", "uscrt"))
@@ -302,21 +547,16 @@ class SubmitProposalTool(BaseTool):
         denom = params.get("denom", "uscrt")
 
         # Get active wallet
-        wallet_info = self.context.session.get_wallet()
-        if not wallet_info:
-            raise WalletError(
-                message="No active wallet set",
-                details={},
-                suggestions=["Load a wallet using load_wallet"],
-            )
+        wallet_info = self._require_wallet()
 
         wallet_name = wallet_info.wallet_id
         proposer = wallet_info.address
 
         try:
-            # Create signing client
-            signing_client = await create_signing_client(
-                wallet_name, str(self.context.network.value)
+            # Get (cached) signing client
+            network = self.context.network_name
+            signing_client = await self.context.signing_pool.get(
+                wallet_name, network, create_signing_client
             )
 
             # Create proposal content
@@ -326,20 +566,29 @@ class SubmitProposalTool(BaseTool):
                 "description": description,
             }
 
-            # Submit proposal
-            result = await signing_client.submit_proposal(
-                content=content,
-                initial_deposit=[{"denom": denom, "amount": initial_deposit}],
-            )
+            # Submit proposal with the next cached account sequence
+            with self.context.signing_pool.invalidate_on_error(wallet_name, network):
+                result = await self.context.nonce_cache.submit(
+                    wallet_name,
+                    network,
+                    signing_client.account_sequence,
+                    lambda sequence: signing_client.submit_proposal(
+                        content=content,
+                        initial_deposit=[{"denom": denom, "amount": initial_deposit}],
+                        sequence=sequence,
+                    ),
+                )
 
-            return {
-                "title": title,
-                "proposer": proposer,
-                "initial_deposit": initial_deposit,
-                "denom": denom,
-                "txhash": result.get("txhash"),
-                "message": f"Successfully submitted proposal: {title}",
-            }
+            return self._with_message(
+                {
+                    "title": title,
+                    "proposer": proposer,
+                    "initial_deposit": initial_deposit,
+                    "denom": denom,
+                    "txhash": result.get("txhash"),
+                },
+                _MSG_SUBMIT,
+            )
 
         except Exception as e:
             raise NetworkError(
@@ -362,6 +611,11 @@ class DepositProposalTool(BaseTool):
     Deposit tokens to a governance proposal.
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"proposal_id", "amount"})
+    PARAMS_EXAMPLE = "{'proposal_id': '1', 'amount': '1000000'}"
+
     @property
     def name(self) -> str:
         return "deposit_proposal"
@@ -390,25 +644,7 @@ class DepositProposalTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "proposal_id" not in params:
-            raise ValidationError(
-                message="Missing required parameter: proposal_id",
-                details={"required_params": ["proposal_id", "amount"]},
-                suggestions=[
-                    "Provide 'proposal_id' parameter",
-                    "Example: {'proposal_id': '1', 'amount': '1000000'}",
-                ],
-            )
-
-        if "amount" not in params:
-            raise ValidationError(
-                message="Missing required parameter: amount",
-                details={"required_params": ["proposal_id", "amount"]},
-                suggestions=[
-                    "Provide 'amount' parameter",
-                    "Example: {'proposal_id': '1', 'amount': '1000000'}",
-                ],
-            )
+        self._check_required_params(params)
 
         # Validate amount
         validate_amount(params["amount"], params.get("denom", "uscrt"))
@@ -427,37 +663,44 @@ class DepositProposalTool(BaseTool):
         denom = params.get("denom", "uscrt")
 
         # Get active wallet
-        wallet_info = self.context.session.get_wallet()
-        if not wallet_info:
-            raise WalletError(
-                message="No active wallet set",
-                details={},
-                suggestions=["Load a wallet using load_wallet"],
-            )
+        wallet_info = self._require_wallet()
 
         wallet_name = wallet_info.wallet_id
         depositor = wallet_info.address
 
         try:
-            # Create signing client
-            signing_client = await create_signing_client(
-                wallet_name, str(self.context.network.value)
+            # Get (cached) signing client
+            network = self.context.network_name
+            signing_client = await self.context.signing_pool.get(
+                wallet_name, network, create_signing_client
             )
 
-            # Deposit to proposal
-            result = await signing_client.deposit(
-                proposal_id=proposal_id,
-                amount=[{"denom": denom, "amount": amount}],
-            )
+            # Deposit to proposal with the next cached account sequence
+            with self.context.signing_pool.invalidate_on_error(wallet_name, network):
+                result = await self.context.nonce_cache.submit(
+                    wallet_name,
+                    network,
+                    signing_client.account_sequence,
+                    lambda sequence: signing_client.deposit(
+                        proposal_id=proposal_id,
+                        amount=[{"denom": denom, "amount": amount}],
+                        sequence=sequence,
+                    ),
+                )
 
-            return {
-                "proposal_id": proposal_id,
-                "depositor": depositor,
-                "amount": amount,
-                "denom": denom,
-                "txhash": result.get("txhash"),
-                "message": f"Successfully deposited {amount} {denom} to proposal {proposal_id}",
-            }
+            # The deposit changes the proposal's total deposit and maybe its status
+            invalidate_proposal(network, proposal_id)
+
+            return self._with_message(
+                {
+                    "proposal_id": proposal_id,
+                    "depositor": depositor,
+                    "amount": amount,
+                    "denom": denom,
+                    "txhash": result.get("txhash"),
+                },
+                _MSG_DEPOSIT,
+            )
 
         except Exception as e:
             raise NetworkError(
@@ -482,6 +725,11 @@ class VoteProposalTool(BaseTool):
     Vote on a governance proposal.
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"proposal_id", "option"})
+    PARAMS_EXAMPLE = "{'proposal_id': '1', 'option': 'VOTE_OPTION_YES'}"
+
     @property
     def name(self) -> str:
         return "vote_proposal"
@@ -510,41 +758,15 @@ class VoteProposalTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "proposal_id" not in params:
-            raise ValidationError(
-                message="Missing required parameter: proposal_id",
-                details={"required_params": ["proposal_id", "option"]},
-                suggestions=[
-                    "Provide 'proposal_id' parameter",
-                    "Example: {'proposal_id': '1', 'option': 'VOTE_OPTION_YES'}",
-                ],
-            )
-
-        if "option" not in params:
-            raise ValidationError(
-                message="Missing required parameter: option",
-                details={"required_params": ["proposal_id", "option"]},
-                suggestions=[
-                    "Provide 'option' parameter",
-                    "Example: {'proposal_id': '1', 'option': 'VOTE_OPTION_YES'}",
-                ],
-            )
+        self._check_required_params(params)
 
         # Validate vote option
         option = params["option"]
-        valid_options = [
-            "VOTE_OPTION_YES",
-            "VOTE_OPTION_NO",
-            "VOTE_OPTION_ABSTAIN",
-            "VOTE_OPTION_NO_WITH_VETO",
-        ]
-        if option not in valid_options:
+        if option not in _VALID_VOTE_OPTIONS:
             raise ValidationError(
                 message=f"Invalid option: {option}",
-                details={"provided": option, "valid_values": valid_options},
-                suggestions=[
-                    "Use one of: VOTE_OPTION_YES, VOTE_OPTION_NO, VOTE_OPTION_ABSTAIN, VOTE_OPTION_NO_WITH_VETO",
-                ],
+                details={"provided": option, "valid_values": list(_VOTE_OPTIONS)},
+                suggestions=[_VOTE_OPTION_SUGGESTION],
             )
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -560,35 +782,41 @@ class VoteProposalTool(BaseTool):
         option = params["option"]
 
         # Get active wallet
-        wallet_info = self.context.session.get_wallet()
-        if not wallet_info:
-            raise WalletError(
-                message="No active wallet set",
-                details={},
-                suggestions=["Load a wallet using load_wallet"],
-            )
+        wallet_info = self._require_wallet()
 
         wallet_name = wallet_info.wallet_id
         voter = wallet_info.address
 
         try:
-            # Create signing client
-            signing_client = await create_signing_client(
-                wallet_name, str(self.context.network.value)
+            # Get (cached) signing client
+            network = self.context.network_name
+            signing_client = await self.context.signing_pool.get(
+                wallet_name, network, create_signing_client
             )
 
-            # Vote on proposal
-            result = await signing_client.vote(
-                proposal_id=proposal_id, option=option
-            )
+            # Vote on proposal with the next cached account sequence
+            with self.context.signing_pool.invalidate_on_error(wallet_name, network):
+                result = await self.context.nonce_cache.submit(
+                    wallet_name,
+                    network,
+                    signing_client.account_sequence,
+                    lambda sequence: signing_client.vote(
+                        proposal_id=proposal_id, option=option, sequence=sequence
+                    ),
+                )
 
-            return {
-                "proposal_id": proposal_id,
-                "voter": voter,
-                "option": option,
-                "txhash": result.get("txhash"),
-                "message": f"Successfully voted {option} on proposal {proposal_id}",
-            }
+            # The vote changes the proposal's tally
+            invalidate_proposal(network, proposal_id)
+
+            return self._with_message(
+                {
+                    "proposal_id": proposal_id,
+                    "voter": voter,
+                    "option": option,
+                    "txhash": result.get("txhash"),
+                },
+                _MSG_VOTE,
+            )
 
         except Exception as e:
             raise NetworkError(
@@ -613,6 +841,11 @@ class GetVoteTool(BaseTool):
     Query a specific vote for a proposal.
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"proposal_id", "voter"})
+    PARAMS_EXAMPLE = "{'proposal_id': '1', 'voter': 'secret1...'}"
+
     @property
     def name(self) -> str:
         return "get_vote"
@@ -641,23 +874,16 @@ class GetVoteTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "proposal_id" not in params:
-            raise ValidationError(
-                message="Missing required parameter: proposal_id",
-                details={"required_params": ["proposal_id", "voter"]},
-                suggestions=[
-                    "Provide 'proposal_id' parameter",
-                    "Example: {'proposal_id': '1', 'voter': 'secret1...'}",
-                ],
-            )
+        self._check_required_params(params)
 
-        if "voter" not in params:
+        proposal_id = params["proposal_id"]
+        if not _is_proposal_id(proposal_id):
             raise ValidationError(
-                message="Missing required parameter: voter",
-                details={"required_params": ["proposal_id", "voter"]},
+                message=f"Invalid proposal_id: {proposal_id}",
+                details={"provided": proposal_id},
                 suggestions=[
-                    "Provide 'voter' parameter",
-                    "Example: {'proposal_id': '1', 'voter': 'secret1...'}",
+                    "proposal_id must be a positive integer",
+                    f"Example: {self.PARAMS_EXAMPLE}",
                 ],
             )
 
@@ -677,32 +903,32 @@ class GetVoteTool(BaseTool):
         voter = params["voter"]
 
         try:
-            # Query vote using client pool
-            with self.context.client_pool.get_client() as client:
-                vote_response = client.gov.vote(
-                    proposal_id=proposal_id, voter=voter
-                )
+            # Query vote on the shared async read client
+            vote = await _query_vote(
+                self.context.client_pool.async_read_client, proposal_id, voter
+            )
 
-                vote = vote_response.get("vote", {})
+            # If vote not found, return appropriate message
+            if vote is None:
+                return self._with_message(
+                    {
+                        "proposal_id": proposal_id,
+                        "voter": voter,
+                        "vote": None,
+                    },
+                    _MSG_NO_VOTE,
+                )
 
-                return {
+            return self._with_message(
+                {
                     "proposal_id": proposal_id,
                     "voter": voter,
                     "vote": vote,
-                    "message": f"Retrieved vote for proposal {proposal_id} by {voter}",
-                }
+                },
+                _MSG_GET_VOTE,
+            )
 
         except Exception as e:
-            # If vote not found, return appropriate message
-            error_msg = str(e).lower()
-            if "not found" in error_msg or "does not exist" in error_msg:
-                return {
-                    "proposal_id": proposal_id,
-                    "voter": voter,
-                    "vote": None,
-                    "message": f"No vote found for proposal {proposal_id} by {voter}",
-                }
-
             raise NetworkError(
                 message=f"Failed to get vote: {str(e)}",
                 details={"proposal_id": proposal_id, "voter": voter, "error": str(e)},
@@ -712,3 +938,135 @@ class GetVoteTool(BaseTool):
                     "Verify network connectivity",
                 ],
             )
+
+
+class GetVotesBulkTool(BaseTool):
+    """Get votes in bulk.
+
+    Query many (proposal, voter) votes concurrently.
+    """
+
+    __slots__ = ()
+
+    REQUIRED = frozenset({"queries"})
+    PARAMS_EXAMPLE = "{'queries': [{'proposal_id': '1', 'voter': 'secret1...'}]}"
+
+    @property
+    def name(self) -> str:
+        return "get_votes"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Get votes for many proposal and voter pairs at once. "
+            "Queries run concurrently; missing votes are returned as null."
+        )
+
+    @property
+    def category(self) -> ToolCategory:
+        return ToolCategory.GOVERNANCE
+
+    @property
+    def requires_wallet(self) -> bool:
+        return False  # Read-only query
+
+    def validate_params(self, params: Dict[str, Any]) -> None:
+        """Validate get votes parameters.
+
+        Args:
+            params: Must contain 'queries', a list of {'proposal_id', 'voter'}
+
+        Raises:
+            ValidationError: If parameters are invalid
+        """
+        self._check_required_params(params)
+
+        queries = params["queries"]
+        if not isinstance(queries, list) or len(queries) == 0:
+            raise ValidationError(
+                message="Queries must be a non-empty list",
+                details={"provided_type": type(queries).__name__},
+                suggestions=[
+                    "Provide at least one query",
+                    f"Example: {self.PARAMS_EXAMPLE}",
+                ],
+            )
+
+        invalid = [
+            index
+            for index, query in enumerate(queries)
+            if not isinstance(query, dict)
+            or not {"proposal_id", "voter"} <= query.keys()
+            or not _is_proposal_id(query["proposal_id"])
+        ]
+        if invalid:
+            raise ValidationError(
+                message=f"Invalid query at index(es) {invalid}",
+                details={"invalid_indices": invalid},
+                suggestions=[
+                    "Each query needs 'proposal_id' (a positive integer) and 'voter'",
+                    f"Example: {self.PARAMS_EXAMPLE}",
+                ],
+            )
+
+        # Validate voter addresses
+        for query in queries:
+            validate_address(query["voter"])
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute get votes.
+
+        Queries are awaited concurrently on the shared async read client, at
+        most BULK_QUERY_CONCURRENCY at once.
+
+        Args:
+            params: Parameters including queries
+
+        Returns:
+            One result per query, in query order
+        """
+        queries = params["queries"]
+        client = self.context.client_pool.async_read_client
+        semaphore = asyncio.Semaphore(BULK_QUERY_CONCURRENCY)
+
+        async def query_one(query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await _query_vote(client, str(query["proposal_id"]), query["voter"])
+
+        results = await asyncio.gather(
+            *(query_one(query) for query in queries),
+            return_exceptions=True,
+        )
+
+        votes = []
+        failed = 0
+        for query, result in zip(queries, results):
+            entry = {"proposal_id": str(query["proposal_id"]), "voter": query["voter"]}
+            if isinstance(result, BaseException):
+                entry["vote"] = None
+                entry["error"] = str(result)
+                failed += 1
+            else:
+                entry["vote"] = result
+            votes.append(entry)
+
+        if failed == len(votes):
+            raise NetworkError(
+                message=f"Failed to get votes: {votes[0]['error']}",
+                details={"queries_count": len(votes), "error": votes[0]["error"]},
+                suggestions=[
+                    "Check that the proposal IDs are correct",
+                    "Verify network connectivity",
+                ],
+            )
+
+        found = sum(1 for entry in votes if entry["vote"] is not None)
+        return self._with_message(
+            {
+                "votes": votes,
+                "count": len(votes),
+                "found": found,
+                "failed": failed,
+            },
+            _MSG_VOTES,
+        )
@@ -6,10 +6,61 @@ This module provides tools for IBC operations including:
 - IBC denom trace queries
 """
 
-from typing import Any, Dict
+import asyncio
+from typing import Any, Dict, List
 
+from mcp_scrt.tools._inflight import single_flight
+from mcp_scrt.tools._retry import with_retries
 from mcp_scrt.tools.base import BaseTool, ToolCategory
-from mcp_scrt.utils.errors import ValidationError, NetworkError, WalletError
+from mcp_scrt.utils.errors import ValidationError, NetworkError
+from mcp_scrt.core.cache import Cache
+from mcp_scrt.constants import CACHE_TTL
+
+# IBC channel query results shared across tool instances (tools are created
+# per call). Channels change rarely, so a short TTL keeps them fresh enough.
+_ibc_cache = Cache(default_ttl=CACHE_TTL["ibc_channels"], max_size=1024)
+
+# Denom traces by hash. The hash is the SHA256 of the trace path, so a trace
+# never changes; the long TTL and size bound only keep the cache from growing
+# without limit.
+_denom_trace_cache = Cache(default_ttl=CACHE_TTL["denom_traces"], max_size=1024)
+
+# Response message templates (filled from the response dict via format_map)
+_MSG_TRANSFER = "Successfully transferred {amount} {denom} to {recipient} via {channel_id}"
+_MSG_TRANSFER_BATCH = "Successfully sent {transfers_count} IBC transfer(s) in one transaction"
+_MSG_DENOM_TRACE = "Retrieved denom trace for hash {hash}"
+
+
+class MockSigningClient:
+    """Placeholder signing client returning canned transaction results.
+
+    It holds no state, so one shared instance serves every wallet.
+    """
+
+    async def account_sequence(self):
+        return 0
+
+    async def ibc_transfer(
+        self,
+        channel_id: str,
+        recipient: str,
+        amount: Dict[str, str],
+        timeout_height: str = None,
+        timeout_timestamp: str = None,
+        memo: str = "",
+        sequence: int = None,
+    ):
+        return {"txhash": "mock_hash", "code": 0}
+
+    async def broadcast_tx(self, msgs: List[Dict[str, Any]], memo: str = "", sequence: int = None):
+        return {
+            "txhash": "mock_hash",
+            "code": 0,
+            "logs": [{"msg_index": index, "events": []} for index in range(len(msgs))],
+        }
+
+
+_MOCK_SIGNING_CLIENT = MockSigningClient()
 
 
 # Helper function to create a signing client (placeholder for now)
@@ -19,19 +70,33 @@ async def create_signing_client(wallet_name: str, network: str):
     This is a placeholder that will be replaced with actual signing client implementation.
     """
     # This will be implemented with actual Secret Network signing client
-    class MockSigningClient:
-        async def ibc_transfer(
-            self,
-            channel_id: str,
-            recipient: str,
-            amount: Dict[str, str],
-            timeout_height: str = None,
-            timeout_timestamp: str = None,
-            memo: str = "",
-        ):
-            return {"txhash": "mock_hash", "code": 0}
+    return _MOCK_SIGNING_CLIENT
+
+
+def _transfer_msg(sender: str, transfer: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a MsgTransfer message for one batch entry.
+
+    Args:
+        sender: Sender address
+        transfer: Batch entry with channel_id, recipient, amount and optional
+            denom, port_id, timeout_height, timeout_timestamp and memo
 
-    return MockSigningClient()
+    Returns:
+        MsgTransfer message dict
+    """
+    msg: Dict[str, Any] = {
+        "source_port": transfer.get("port_id", "transfer"),
+        "source_channel": transfer["channel_id"],
+        "token": {"denom": transfer.get("denom", "uscrt"), "amount": transfer["amount"]},
+        "sender": sender,
+        "receiver": transfer["recipient"],
+    }
+
+    for field in ("timeout_height", "timeout_timestamp", "memo"):
+        if transfer.get(field):
+            msg[field] = transfer[field]
+
+    return msg
 
 
 class IBCTransferTool(BaseTool):
@@ -40,6 +105,11 @@ class IBCTransferTool(BaseTool):
     Performs cross-chain token transfers using the IBC protocol.
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"channel_id", "recipient", "amount"})
+    PARAMS_EXAMPLE = "{'channel_id': 'channel-0', 'recipient': 'cosmos1...', 'amount': '1000000'}"
+
     @property
     def name(self) -> str:
         return "ibc_transfer"
@@ -68,35 +138,7 @@ class IBCTransferTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "channel_id" not in params:
-            raise ValidationError(
-                message="Missing required parameter: channel_id",
-                details={"required_params": ["channel_id", "recipient", "amount"]},
-                suggestions=[
-                    "Provide 'channel_id' parameter",
-                    "Example: {'channel_id': 'channel-0', 'recipient': 'cosmos1...', 'amount': '1000000'}",
-                ],
-            )
-
-        if "recipient" not in params:
-            raise ValidationError(
-                message="Missing required parameter: recipient",
-                details={"required_params": ["channel_id", "recipient", "amount"]},
-                suggestions=[
-                    "Provide 'recipient' parameter",
-                    "Example: {'channel_id': 'channel-0', 'recipient': 'cosmos1...', 'amount': '1000000'}",
-                ],
-            )
-
-        if "amount" not in params:
-            raise ValidationError(
-                message="Missing required parameter: amount",
-                details={"required_params": ["channel_id", "recipient", "amount"]},
-                suggestions=[
-                    "Provide 'amount' parameter",
-                    "Example: {'channel_id': 'channel-0', 'recipient': 'cosmos1...', 'amount': '1000000'}",
-                ],
-            )
+        self._check_required_params(params)
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute IBC transfer.
@@ -120,51 +162,53 @@ class IBCTransferTool(BaseTool):
         memo = params.get("memo", "")
 
         # Get active wallet
-        wallet_info = self.context.session.get_wallet()
-        if not wallet_info:
-            raise WalletError(
-                message="No active wallet set",
-                details={},
-                suggestions=["Load a wallet using load_wallet"],
-            )
+        wallet_info = self._require_wallet()
 
         wallet_name = wallet_info.wallet_id
         sender = wallet_info.address
+        network = self.context.network_name
 
         try:
-            # Create signing client
-            signing_client = await create_signing_client(
-                wallet_name, str(self.context.network.value)
+            # Get (cached) signing client
+            signing_client = await self.context.signing_pool.get(
+                wallet_name, network, create_signing_client
             )
 
-            # Prepare IBC transfer parameters
+            # Prepare IBC transfer parameters, leaving out unset optional ones
+            optional = {
+                "timeout_height": timeout_height,
+                "timeout_timestamp": timeout_timestamp,
+                "memo": memo,
+            }
             transfer_params: Dict[str, Any] = {
                 "channel_id": channel_id,
                 "recipient": recipient,
                 "amount": {"denom": denom, "amount": amount},
+                **{key: value for key, value in optional.items() if value},
             }
 
-            if timeout_height:
-                transfer_params["timeout_height"] = timeout_height
-
-            if timeout_timestamp:
-                transfer_params["timeout_timestamp"] = timeout_timestamp
-
-            if memo:
-                transfer_params["memo"] = memo
-
-            # Execute IBC transfer
-            result = await signing_client.ibc_transfer(**transfer_params)
+            # Execute IBC transfer with the next cached account sequence
+            with self.context.signing_pool.invalidate_on_error(wallet_name, network):
+                result = await self.context.nonce_cache.submit(
+                    wallet_name,
+                    network,
+                    signing_client.account_sequence,
+                    lambda sequence: signing_client.ibc_transfer(
+                        **transfer_params, sequence=sequence
+                    ),
+                )
 
-            return {
-                "sender": sender,
-                "recipient": recipient,
-                "channel_id": channel_id,
-                "amount": amount,
-                "denom": denom,
-                "txhash": result.get("txhash"),
-                "message": f"Successfully transferred {amount} {denom} to {recipient} via {channel_id}",
-            }
+            return self._with_message(
+                {
+                    "sender": sender,
+                    "recipient": recipient,
+                    "channel_id": channel_id,
+                    "amount": amount,
+                    "denom": denom,
+                    "txhash": result.get("txhash"),
+                },
+                _MSG_TRANSFER,
+            )
 
         except Exception as e:
             raise NetworkError(
@@ -185,12 +229,172 @@ class IBCTransferTool(BaseTool):
             )
 
 
+class IBCTransferBatchTool(BaseTool):
+    """Transfer tokens to several recipients via IBC.
+
+    Sends every transfer as a MsgTransfer in one transaction.
+    """
+
+    __slots__ = ()
+
+    REQUIRED = frozenset({"transfers"})
+    PARAMS_EXAMPLE = (
+        "{'transfers': [{'channel_id': 'channel-0', 'recipient': 'cosmos1...', "
+        "'amount': '1000000'}]}"
+    )
+
+    # Keys every batch entry must have
+    _TRANSFER_KEYS = frozenset({"channel_id", "recipient", "amount"})
+
+    # Validation error suggestions, built once instead of on every failure
+    _EMPTY_SUGGESTIONS = ("Provide at least one transfer", f"Example: {PARAMS_EXAMPLE}")
+    _INVALID_SUGGESTIONS = (
+        "Each transfer needs 'channel_id', 'recipient' and 'amount'",
+        f"Example: {PARAMS_EXAMPLE}",
+    )
+
+    @property
+    def name(self) -> str:
+        return "ibc_transfer_batch"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Transfer tokens to several recipients via IBC in a single transaction. "
+            "Requires active wallet. All transfers succeed or fail together."
+        )
+
+    @property
+    def category(self) -> ToolCategory:
+        return ToolCategory.IBC
+
+    @property
+    def requires_wallet(self) -> bool:
+        return True
+
+    def validate_params(self, params: Dict[str, Any]) -> None:
+        """Validate IBC batch transfer parameters.
+
+        Every entry is checked, so one error reports all invalid entries.
+
+        Args:
+            params: Must contain 'transfers', a list of {'channel_id',
+                'recipient', 'amount'} entries (optionally 'denom',
+                'port_id', 'timeout_height', 'timeout_timestamp', 'memo')
+
+        Raises:
+            ValidationError: If parameters are invalid
+        """
+        self._check_required_params(params)
+
+        transfers = params["transfers"]
+        if not isinstance(transfers, list) or len(transfers) == 0:
+            raise ValidationError(
+                message="Transfers must be a non-empty list",
+                details={"provided_type": type(transfers).__name__},
+                suggestions=list(self._EMPTY_SUGGESTIONS),
+            )
+
+        invalid = [
+            index
+            for index, transfer in enumerate(transfers)
+            if not isinstance(transfer, dict) or not self._TRANSFER_KEYS <= transfer.keys()
+        ]
+        if invalid:
+            raise ValidationError(
+                message=f"Invalid transfer at index(es) {invalid}",
+                details={"invalid_indices": invalid},
+                suggestions=list(self._INVALID_SUGGESTIONS),
+            )
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute IBC batch transfer.
+
+        Args:
+            params: Parameters including transfers and optional memo
+
+        Returns:
+            Transaction hash and one result per transfer, in transfer order
+
+        Raises:
+            WalletError: If no wallet is available
+            NetworkError: If the transaction fails
+        """
+        transfers = params["transfers"]
+        memo = params.get("memo", "")
+
+        wallet_info = self._require_wallet()
+        wallet_name = wallet_info.wallet_id
+        sender = wallet_info.address
+
+        network = self.context.network_name
+
+        msgs = [_transfer_msg(sender, transfer) for transfer in transfers]
+
+        try:
+            # One (cached) signing client and one broadcast for the whole
+            # batch, signed with the next cached account sequence
+            signing_client = await self.context.signing_pool.get(
+                wallet_name, network, create_signing_client
+            )
+            with self.context.signing_pool.invalidate_on_error(wallet_name, network):
+                result = await self.context.nonce_cache.submit(
+                    wallet_name,
+                    network,
+                    signing_client.account_sequence,
+                    lambda sequence: signing_client.broadcast_tx(
+                        msgs=msgs, memo=memo, sequence=sequence
+                    ),
+                )
+
+        except Exception as e:
+            raise NetworkError(
+                message=f"Failed to execute IBC batch transfer: {str(e)}",
+                details={
+                    "sender": sender,
+                    "transfers_count": len(transfers),
+                    "error": str(e),
+                },
+                suggestions=[
+                    "Verify every channel ID is correct and active",
+                    "Ensure each recipient address is valid for its destination chain",
+                    "Check that you have sufficient balance for all transfers",
+                    "Verify network connectivity",
+                ],
+            )
+
+        events_by_index = {
+            int(log.get("msg_index", index)): log.get("events", [])
+            for index, log in enumerate(result.get("logs") or [])
+        }
+
+        response = {
+            "sender": sender,
+            "transfers_count": len(transfers),
+            "txhash": result.get("txhash"),
+            "results": [
+                {
+                    "index": index,
+                    "channel_id": msg["source_channel"],
+                    "recipient": msg["receiver"],
+                    "amount": msg["token"]["amount"],
+                    "denom": msg["token"]["denom"],
+                    "events": events_by_index.get(index, []),
+                }
+                for index, msg in enumerate(msgs)
+            ],
+        }
+        return self._with_message(response, _MSG_TRANSFER_BATCH)
+
+
 class GetIBCChannelsTool(BaseTool):
     """Get all IBC channels.
 
     Query all IBC channels on the network.
     """
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "get_ibc_channels"
@@ -235,32 +439,47 @@ class GetIBCChannelsTool(BaseTool):
         pagination_offset = params.get("pagination_offset")
         pagination_key = params.get("pagination_key")
 
-        try:
-            with self.context.client_pool.get_client() as client:
-                # Prepare query parameters
-                query_params: Dict[str, Any] = {}
+        cache_key = (
+            f"ibc_channels:{self.context.network_name}:"
+            f"{pagination_limit}:{pagination_offset}:{pagination_key}"
+        )
+        cached = _ibc_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-                if pagination_limit:
-                    query_params["pagination_limit"] = pagination_limit
+        # Prepare query parameters
+        query_params: Dict[str, Any] = {}
 
-                if pagination_offset:
-                    query_params["pagination_offset"] = pagination_offset
+        if pagination_limit:
+            query_params["pagination_limit"] = pagination_limit
 
-                if pagination_key:
-                    query_params["pagination_key"] = pagination_key
+        if pagination_offset:
+            query_params["pagination_offset"] = pagination_offset
 
-                # Query IBC channels
-                response = client.ibc.channels(**query_params)
+        if pagination_key:
+            query_params["pagination_key"] = pagination_key
 
-                channels = response.get("channels", [])
-                pagination = response.get("pagination", {})
+        client = self.context.client_pool.async_read_client
 
-                return {
-                    "channels": channels,
-                    "pagination": pagination,
-                    "count": len(channels),
-                    "message": f"Found {len(channels)} IBC channel(s)",
-                }
+        try:
+            # Query IBC channels on the shared async read client, sharing the
+            # request with any concurrent identical query and retrying
+            # transient failures
+            response = await single_flight(
+                cache_key, lambda: with_retries(lambda: client.ibc.channels(**query_params))
+            )
+
+            channels = response.get("channels", [])
+            pagination = response.get("pagination", {})
+
+            result = {
+                "channels": channels,
+                "pagination": pagination,
+                "count": len(channels),
+                "message": f"Found {len(channels)} IBC channel(s)",
+            }
+            _ibc_cache.set(cache_key, result)
+            return result
 
         except Exception as e:
             raise NetworkError(
@@ -279,6 +498,11 @@ class GetIBCChannelTool(BaseTool):
     Query details of a specific IBC channel.
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"channel_id"})
+    PARAMS_EXAMPLE = "{'channel_id': 'channel-0'}"
+
     @property
     def name(self) -> str:
         return "get_ibc_channel"
@@ -307,15 +531,7 @@ class GetIBCChannelTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "channel_id" not in params:
-            raise ValidationError(
-                message="Missing required parameter: channel_id",
-                details={"required_params": ["channel_id"]},
-                suggestions=[
-                    "Provide 'channel_id' parameter",
-                    "Example: {'channel_id': 'channel-0'}",
-                ],
-            )
+        self._check_required_params(params)
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute get IBC channel.
@@ -332,22 +548,34 @@ class GetIBCChannelTool(BaseTool):
         channel_id = params["channel_id"]
         port_id = params.get("port_id", "transfer")
 
+        cache_key = f"ibc_channel:{self.context.network_name}:{channel_id}:{port_id}"
+        cached = _ibc_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        client = self.context.client_pool.async_read_client
+
         try:
-            with self.context.client_pool.get_client() as client:
-                # Query IBC channel
-                response = client.ibc.channel(
-                    channel_id=channel_id,
-                    port_id=port_id,
-                )
+            # Query IBC channel on the shared async read client, sharing the
+            # request with any concurrent identical query and retrying
+            # transient failures
+            response = await single_flight(
+                cache_key,
+                lambda: with_retries(
+                    lambda: client.ibc.channel(channel_id=channel_id, port_id=port_id)
+                ),
+            )
 
-                channel = response.get("channel", {})
+            channel = response.get("channel", {})
 
-                return {
-                    "channel": channel,
-                    "channel_id": channel_id,
-                    "port_id": port_id,
-                    "message": f"Retrieved IBC channel {channel_id}",
-                }
+            result = {
+                "channel": channel,
+                "channel_id": channel_id,
+                "port_id": port_id,
+                "message": f"Retrieved IBC channel {channel_id}",
+            }
+            _ibc_cache.set(cache_key, result)
+            return result
 
         except Exception as e:
             raise NetworkError(
@@ -371,6 +599,12 @@ class GetIBCDenomTraceTool(BaseTool):
     Query the origin information of an IBC denomination.
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"hash"})
+    # The hash is the SHA256 of the IBC denomination path
+    PARAMS_EXAMPLE = "{'hash': '27394FB092D2ECCD56123C74F36E4C1F926001CEADA9CA97EA622B25F41E5EB2'}"
+
     @property
     def name(self) -> str:
         return "get_ibc_denom_trace"
@@ -399,16 +633,7 @@ class GetIBCDenomTraceTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "hash" not in params:
-            raise ValidationError(
-                message="Missing required parameter: hash",
-                details={"required_params": ["hash"]},
-                suggestions=[
-                    "Provide 'hash' parameter",
-                    "Example: {'hash': '27394FB092D2ECCD56123C74F36E4C1F926001CEADA9CA97EA622B25F41E5EB2'}",
-                    "The hash is the SHA256 of the IBC denomination path",
-                ],
-            )
+        self._check_required_params(params)
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute get IBC denom trace.
@@ -425,21 +650,35 @@ class GetIBCDenomTraceTool(BaseTool):
         denom_hash = params["hash"]
 
         try:
-            with self.context.client_pool.get_client() as client:
-                # Query IBC denom trace
-                response = client.ibc.denom_trace(hash=denom_hash)
+            # Denom traces never change; only query the node on a miss
+            denom_trace = _denom_trace_cache.get(denom_hash)
+            if denom_trace is None:
+                client = self.context.client_pool.async_read_client
+
+                # Query IBC denom trace on the shared async read client,
+                # sharing the request with any concurrent query for the same
+                # hash and retrying transient failures
+                response = await single_flight(
+                    f"denom_trace:{denom_hash}",
+                    lambda: with_retries(lambda: client.ibc.denom_trace(hash=denom_hash)),
+                )
 
                 denom_trace = response.get("denom_trace", {})
-                path = denom_trace.get("path", "")
-                base_denom = denom_trace.get("base_denom", "")
+                if denom_trace:
+                    _denom_trace_cache.set(denom_hash, denom_trace)
 
-                return {
+            path = denom_trace.get("path", "")
+            base_denom = denom_trace.get("base_denom", "")
+
+            return self._with_message(
+                {
                     "denom_trace": denom_trace,
                     "hash": denom_hash,
                     "path": path,
                     "base_denom": base_denom,
-                    "message": f"Retrieved denom trace for hash {denom_hash}",
-                }
+                },
+                _MSG_DENOM_TRACE,
+            )
 
         except Exception as e:
             raise NetworkError(
@@ -3,13 +3,123 @@
 This module provides tools for network configuration and information.
 """
 
-from typing import Any, Dict
+import asyncio
+import functools
+import time
+from typing import Any, Dict, Set, Tuple
 
+from mcp_scrt.tools._inflight import single_flight
+from mcp_scrt.tools._retry import with_retries
 from mcp_scrt.tools.base import BaseTool, ToolCategory
 from mcp_scrt.types import NetworkType
-from mcp_scrt.utils.errors import ValidationError, NetworkError
-from mcp_scrt.config import get_settings
-from mcp_scrt.constants import GAS_PRICES, NETWORK_CONFIGS
+from mcp_scrt.utils.errors import ValidationError
+from mcp_scrt.constants import (
+    CACHE_TTL,
+    GAS_PRICES,
+    HEALTH_CHECK_REFRESH_AGE,
+    HEALTH_CHECK_TIMEOUT,
+    NETWORK_CONFIGS,
+)
+
+# Built-in networks by configure_network name
+_NETWORK_MAP: Dict[str, NetworkType] = {
+    "testnet": NetworkType.TESTNET,
+    "mainnet": NetworkType.MAINNET,
+}
+
+# Accepted network names (the order is kept for error details)
+_NETWORK_NAMES = (*_NETWORK_MAP, "custom")
+_VALID_NETWORKS = frozenset(_NETWORK_NAMES)
+
+# Validation error payloads, built once instead of on every failure
+_NETWORK_SUGGESTIONS = (
+    f"Use one of: {', '.join(_NETWORK_NAMES)}",
+    "testnet: Secret Network testnet (pulsar-3)",
+    "mainnet: Secret Network mainnet (secret-4)",
+)
+_CUSTOM_NETWORK_SUGGESTIONS = (
+    "Provide LCD endpoint URL and chain ID",
+    "Example: {'network': 'custom', 'lcd_url': 'https://lcd.example.com', "
+    "'chain_id': 'secret-custom-1'}",
+)
+
+# Response message templates (filled from the response dict via format_map)
+_MSG_CONFIGURED = "Network configured: {network} ({chain_id})"
+_MSG_CUSTOM_CONFIGURED = "Custom network configured: {chain_id}"
+_MSG_HEALTHY = "Network is healthy and responsive"
+_MSG_STALE = "{error}; returning the last healthy result"
+_MSG_UNHEALTHY = "Unable to connect to network"
+
+# Last healthy health_check response per network: (monotonic time, response)
+_health_cache: Dict[NetworkType, Tuple[float, Dict[str, Any]]] = {}
+
+# Background health refreshes, referenced until they finish
+_health_refreshes: Set[asyncio.Task] = set()
+
+
+@functools.lru_cache(maxsize=None)
+def _configure_response(network: NetworkType) -> Dict[str, Any]:
+    """Build the configure_network response for a built-in network once.
+
+    Args:
+        network: Built-in network
+
+    Returns:
+        Configured network information (shared; callers must copy it)
+    """
+    config = NETWORK_CONFIGS[network]
+    return {
+        "network": network.value,
+        "lcd_url": config.lcd_url,
+        "chain_id": config.chain_id,
+        "status": "configured",
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _network_info_response(network: NetworkType) -> Dict[str, Any]:
+    """Build the get_network_info response for a network once.
+
+    Args:
+        network: Built-in network
+
+    Returns:
+        Network information (shared; callers must copy it)
+    """
+    config = NETWORK_CONFIGS[network]
+    return {
+        "network": network.value,
+        "chain_id": config.chain_id,
+        "lcd_url": config.lcd_url,
+        "bech32_prefix": config.bech32_prefix,
+        "coin_type": config.coin_type,
+        "denom": config.denom,
+        "decimals": config.decimals,
+        "description": f"Secret Network {network.value}",
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _gas_prices_response(network: NetworkType) -> Dict[str, Any]:
+    """Build the get_gas_prices response for a network once.
+
+    Args:
+        network: Built-in network
+
+    Returns:
+        Gas prices (shared; callers must copy it)
+    """
+    return {
+        "denom": NETWORK_CONFIGS[network].denom,
+        "gas_prices": {
+            "default": GAS_PRICES["DEFAULT"],
+            "low": GAS_PRICES["LOW"],
+            "average": GAS_PRICES["AVERAGE"],
+            "high": GAS_PRICES["HIGH"],
+        },
+        "description": "Gas prices in uscrt per gas unit",
+        "recommendation": "Use 'average' for normal transactions, 'high' for urgent transactions",
+    }
 
 
 class ConfigureNetworkTool(BaseTool):
@@ -18,6 +128,15 @@ class ConfigureNetworkTool(BaseTool):
     This tool allows switching between different Secret Network networks.
     """
 
+    __slots__ = ()
+
+    REQUIRED = frozenset({"network"})
+    PARAMS_EXAMPLE = "{'network': 'testnet'}"
+
+    # Extra parameters a custom network must provide
+    CUSTOM_REQUIRED = frozenset({"lcd_url", "chain_id"})
+    CUSTOM_REQUIRED_NAMES = tuple(sorted(CUSTOM_REQUIRED))
+
     @property
     def name(self) -> str:
         return "configure_network"
@@ -46,53 +165,31 @@ class ConfigureNetworkTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "network" not in params:
-            raise ValidationError(
-                message="Missing required parameter: network",
-                details={"required_params": ["network"]},
-                suggestions=[
-                    "Provide 'network' parameter with value: testnet, mainnet, or custom",
-                    "Example: {'network': 'testnet'}",
-                ],
-            )
+        self._check_required_params(params)
 
         network = params["network"].lower()
-        valid_networks = ["testnet", "mainnet", "custom"]
 
-        if network not in valid_networks:
+        if network not in _VALID_NETWORKS:
             raise ValidationError(
                 message=f"Invalid network: {network}",
                 details={
                     "provided": network,
-                    "valid_networks": valid_networks,
+                    "valid_networks": list(_NETWORK_NAMES),
                 },
-                suggestions=[
-                    f"Use one of: {', '.join(valid_networks)}",
-                    "testnet: Secret Network testnet (pulsar-3)",
-                    "mainnet: Secret Network mainnet (secret-4)",
-                ],
+                suggestions=list(_NETWORK_SUGGESTIONS),
             )
 
         # If custom, validate URL and chain_id
         if network == "custom":
-            if "lcd_url" not in params:
+            missing = sorted(self.CUSTOM_REQUIRED - params.keys())
+            if missing:
                 raise ValidationError(
-                    message="Custom network requires 'lcd_url' parameter",
-                    details={"required_for_custom": ["lcd_url", "chain_id"]},
-                    suggestions=[
-                        "Provide LCD endpoint URL",
-                        "Example: {'network': 'custom', 'lcd_url': 'https://lcd.example.com', 'chain_id': 'secret-custom-1'}",
-                    ],
-                )
-
-            if "chain_id" not in params:
-                raise ValidationError(
-                    message="Custom network requires 'chain_id' parameter",
-                    details={"required_for_custom": ["lcd_url", "chain_id"]},
-                    suggestions=[
-                        "Provide chain ID",
-                        "Example: {'network': 'custom', 'lcd_url': 'https://lcd.example.com', 'chain_id': 'secret-custom-1'}",
-                    ],
+                    message=f"Custom network requires parameter(s): {', '.join(missing)}",
+                    details={
+                        "required_for_custom": list(self.CUSTOM_REQUIRED_NAMES),
+                        "missing_params": missing,
+                    },
+                    suggestions=list(_CUSTOM_NETWORK_SUGGESTIONS),
                 )
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -105,31 +202,22 @@ class ConfigureNetworkTool(BaseTool):
             Configured network information
         """
         network = params["network"].lower()
-        settings = get_settings()
 
         if network == "custom":
             lcd_url = params["lcd_url"]
             chain_id = params["chain_id"]
 
-            return {
-                "network": "custom",
-                "lcd_url": lcd_url,
-                "chain_id": chain_id,
-                "status": "configured",
-                "message": f"Custom network configured: {chain_id}",
-            }
-
-        # Get network configuration
-        network_type = NetworkType.TESTNET if network == "testnet" else NetworkType.MAINNET
-        config = NETWORK_CONFIGS[network_type]
+            return self._with_message(
+                {
+                    "network": "custom",
+                    "lcd_url": lcd_url,
+                    "chain_id": chain_id,
+                    "status": "configured",
+                },
+                _MSG_CUSTOM_CONFIGURED,
+            )
 
-        return {
-            "network": network,
-            "lcd_url": config.lcd_url,
-            "chain_id": config.chain_id,
-            "status": "configured",
-            "message": f"Network configured: {network} ({config.chain_id})",
-        }
+        return self._with_message(dict(_configure_response(_NETWORK_MAP[network])), _MSG_CONFIGURED)
 
 
 class GetNetworkInfoTool(BaseTool):
@@ -138,6 +226,8 @@ class GetNetworkInfoTool(BaseTool):
     This tool returns information about the currently configured network.
     """
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "get_network_info"
@@ -168,20 +258,9 @@ class GetNetworkInfoTool(BaseTool):
         Returns:
             Current network information
         """
-        network = self.context.network
-        config = NETWORK_CONFIGS[network]
-        settings = get_settings()
-
-        return {
-            "network": network.value,
-            "chain_id": config.chain_id,
-            "lcd_url": config.lcd_url,
-            "bech32_prefix": config.bech32_prefix,
-            "coin_type": config.coin_type,
-            "denom": config.denom,
-            "decimals": config.decimals,
-            "description": f"Secret Network {network.value}",
-        }
+        # The response only depends on the (fixed) network; copy the
+        # prebuilt one so callers cannot alter it
+        return dict(_network_info_response(self.context.network))
 
 
 class GetGasPricesTool(BaseTool):
@@ -190,6 +269,8 @@ class GetGasPricesTool(BaseTool):
     This tool returns the current gas prices for transactions.
     """
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "get_gas_prices"
@@ -220,20 +301,11 @@ class GetGasPricesTool(BaseTool):
         Returns:
             Current gas prices
         """
-        network = self.context.network
-        config = NETWORK_CONFIGS[network]
-
-        return {
-            "denom": config.denom,
-            "gas_prices": {
-                "default": GAS_PRICES["DEFAULT"],
-                "low": GAS_PRICES["LOW"],
-                "average": GAS_PRICES["AVERAGE"],
-                "high": GAS_PRICES["HIGH"],
-            },
-            "description": "Gas prices in uscrt per gas unit",
-            "recommendation": "Use 'average' for normal transactions, 'high' for urgent transactions",
-        }
+        # The response only depends on the (fixed) network; copy the
+        # prebuilt one so callers cannot alter it
+        response = dict(_gas_prices_response(self.context.network))
+        response["gas_prices"] = dict(response["gas_prices"])
+        return response
 
 
 class HealthCheckTool(BaseTool):
@@ -242,6 +314,8 @@ class HealthCheckTool(BaseTool):
     This tool performs a health check on the network connection.
     """
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "health_check"
@@ -269,49 +343,107 @@ class HealthCheckTool(BaseTool):
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute health check.
 
+        A healthy result is reused for CACHE_TTL["health_check"] seconds and
+        refreshed in the background once it is older than
+        HEALTH_CHECK_REFRESH_AGE. If the node does not answer within
+        HEALTH_CHECK_TIMEOUT, the last healthy result is returned with
+        status "stale".
+
         Returns:
             Network health status
         """
         network = self.context.network
-        config = NETWORK_CONFIGS[network]
+        config = self.context.network_config
+
+        cached = _health_cache.get(network)
+        if cached is not None:
+            age = time.monotonic() - cached[0]
+            if age < CACHE_TTL["health_check"]:
+                if age >= HEALTH_CHECK_REFRESH_AGE:
+                    task = asyncio.get_running_loop().create_task(self._refresh())
+                    _health_refreshes.add(task)
+                    task.add_done_callback(_health_refreshes.discard)
+                return self._with_message(dict(cached[1]), _MSG_HEALTHY)
 
         try:
-            # Try to get node info from the client pool
-            with self.context.client_pool.get_client() as client:
-                node_info = client.tendermint.node_info()
-
-                return {
-                    "status": "healthy",
-                    "network": network.value,
-                    "lcd_url": config.lcd_url,
-                    "chain_id": config.chain_id,
-                    "node_connected": True,
-                    "node_info": {
-                        "network": node_info.get("node_info", {}).get("network"),
-                        "version": node_info.get("application_version", {}).get("version"),
-                    },
-                    "message": "Network is healthy and responsive",
-                }
+            return await self._check()
+
+        except asyncio.TimeoutError:
+            error = f"Node did not respond within {HEALTH_CHECK_TIMEOUT}s"
+            if cached is not None:
+                stale = dict(cached[1])
+                stale["status"] = "stale"
+                stale["error"] = error
+                return self._with_message(stale, _MSG_STALE)
 
         except Exception as e:
-            # Health check should not fail completely, just report unhealthy
-            self._logger.warning(
-                "Health check failed",
-                error=str(e),
-                network=network.value,
-            )
+            error = str(e)
+
+        # Health check should not fail completely, just report unhealthy
+        self._logger.warning(
+            "Health check failed",
+            error=error,
+            network=network.value,
+        )
 
-            return {
+        return self._with_message(
+            {
                 "status": "unhealthy",
                 "network": network.value,
                 "lcd_url": config.lcd_url,
                 "chain_id": config.chain_id,
                 "node_connected": False,
-                "error": str(e),
-                "message": "Unable to connect to network",
+                "error": error,
                 "suggestions": [
                     "Check your internet connection",
                     "Verify the LCD endpoint is accessible",
                     "Try switching to a different network",
                 ],
-            }
+            },
+            _MSG_UNHEALTHY,
+        )
+
+    async def _check(self) -> Dict[str, Any]:
+        """Query node info and cache the healthy response.
+
+        Returns:
+            Healthy response
+
+        Raises:
+            asyncio.TimeoutError: If the node does not answer in time
+            Exception: If the query fails
+        """
+        network = self.context.network
+        config = self.context.network_config
+
+        # Concurrent health checks share one bounded request on the shared
+        # async read client; a transient failure is retried once
+        client = self.context.client_pool.async_read_client
+        node_info = await single_flight(
+            f"node_info:{network.value}",
+            lambda: asyncio.wait_for(
+                with_retries(client.tendermint.node_info, max_attempts=2),
+                timeout=HEALTH_CHECK_TIMEOUT,
+            ),
+        )
+
+        response = {
+            "status": "healthy",
+            "network": network.value,
+            "lcd_url": config.lcd_url,
+            "chain_id": config.chain_id,
+            "node_connected": True,
+            "node_info": {
+                "network": node_info.get("node_info", {}).get("network"),
+                "version": node_info.get("application_version", {}).get("version"),
+            },
+        }
+        _health_cache[network] = (time.monotonic(), response)
+        return self._with_message(dict(response), _MSG_HEALTHY)
+
+    async def _refresh(self) -> None:
+        """Refresh the cached health in the background, logging failures."""
+        try:
+            await self._check()
+        except Exception as e:
+            self._logger.debug("Background health refresh failed", error=str(e))
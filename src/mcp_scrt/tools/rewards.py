@@ -3,11 +3,53 @@
 This module provides tools for querying and withdrawing staking rewards.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional
 
+from mcp_scrt.tools._retry import TRANSPORT_ERRORS
 from mcp_scrt.tools.base import BaseTool, ToolCategory
-from mcp_scrt.utils.errors import ValidationError, NetworkError, WalletError
-from mcp_scrt.core.validation import validate_address
+from mcp_scrt.utils.errors import ValidationError, NetworkError, TransactionError
+from mcp_scrt.core.validation import invalid_validator_addresses, validate_address
+from mcp_scrt.core.cache import Cache
+from mcp_scrt.constants import CACHE_TTL, WITHDRAW_BATCH_MSGS_PER_TX
+
+# Rewards and community pool query results shared across tool instances
+# (tools are created per call). Both change every block, so entries live
+# for about one block time; polls within a block reuse the last response.
+_rewards_cache = Cache(default_ttl=CACHE_TTL["rewards"], max_size=512)
+
+# Response message templates (filled from the response dict via format_map)
+_MSG_REWARDS = "Retrieved rewards for {address} from {validators_count} validator(s)"
+_MSG_WITHDRAW = "Successfully withdrew rewards from {validator_address}"
+_MSG_NO_REWARDS = "No rewards to withdraw"
+_MSG_WITHDRAW_ALL = "Successfully withdrew rewards from {validators_count} validator(s)"
+_MSG_WITHDRAW_BATCH = (
+    "Successfully withdrew rewards from {validators_count} validator(s) "
+    "in {transactions_count} transaction(s)"
+)
+_MSG_SET_WITHDRAW_ADDRESS = "Successfully set withdraw address to {withdraw_address}"
+_MSG_COMMUNITY_POOL = "Retrieved community pool with {count} denom(s)"
+
+
+class MockSigningClient:
+    """Placeholder signing client returning canned transaction results.
+
+    It holds no state, so one shared instance serves every wallet.
+    """
+
+    async def account_sequence(self):
+        return 0
+
+    async def withdraw_delegator_reward(self, validator_address: str, sequence: int = None):
+        return {"txhash": "mock_hash", "code": 0}
+
+    async def withdraw_all_rewards(self, validators: list, sequence: int = None):
+        return {"txhash": "mock_hash", "code": 0}
+
+    async def set_withdraw_address(self, withdraw_address: str, sequence: int = None):
+        return {"txhash": "mock_hash", "code": 0}
+
+
+_MOCK_SIGNING_CLIENT = MockSigningClient()
 
 
 # Helper function to create a signing client (placeholder for now)
@@ -17,17 +59,7 @@ async def create_signing_client(wallet_name: str, network: str):
     This is a placeholder that will be replaced with actual signing client implementation.
     """
     # This will be implemented with actual Secret Network signing client
-    class MockSigningClient:
-        async def withdraw_delegator_reward(self, validator_address: str):
-            return {"txhash": "mock_hash", "code": 0}
-
-        async def withdraw_all_rewards(self, validators: list):
-            return {"txhash": "mock_hash", "code": 0}
-
-        async def set_withdraw_address(self, withdraw_address: str):
-            return {"txhash": "mock_hash", "code": 0}
-
-    return MockSigningClient()
+    return _MOCK_SIGNING_CLIENT
 
 
 class GetRewardsTool(BaseTool):
@@ -36,24 +68,19 @@ class GetRewardsTool(BaseTool):
     Query staking rewards for a delegator address.
     """
 
-    @property
-    def name(self) -> str:
-        return "get_rewards"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Get staking rewards for a delegator address. "
-            "Returns rewards per validator and total rewards."
-        )
+    __slots__ = ()
 
-    @property
-    def category(self) -> ToolCategory:
-        return ToolCategory.REWARDS
+    REQUIRED = frozenset({"address"})
+    ALLOWED = REQUIRED
+    PARAMS_EXAMPLE = "{'address': 'secret1...'}"
 
-    @property
-    def requires_wallet(self) -> bool:
-        return False  # Read-only query
+    name = "get_rewards"
+    description = (
+        "Get staking rewards for a delegator address. "
+        "Returns rewards per validator and total rewards."
+    )
+    category = ToolCategory.REWARDS
+    requires_wallet = False  # Read-only query
 
     def validate_params(self, params: Dict[str, Any]) -> None:
         """Validate get rewards parameters.
@@ -64,15 +91,8 @@ class GetRewardsTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "address" not in params:
-            raise ValidationError(
-                message="Missing required parameter: address",
-                details={"required_params": ["address"]},
-                suggestions=[
-                    "Provide 'address' parameter",
-                    "Example: {'address': 'secret1...'}",
-                ],
-            )
+        self._check_required_params(params)
+        self._check_unknown_params(params)
 
         # Validate address format
         validate_address(params["address"])
@@ -88,23 +108,32 @@ class GetRewardsTool(BaseTool):
         """
         address = params["address"]
 
+        cache_key = f"rewards:{self.context.network_name}:{address}"
+        cached = _rewards_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            # Query rewards using client pool
-            with self.context.client_pool.get_client() as client:
-                rewards_response = client.distribution.rewards(address)
+            # Query rewards on the pool's shared async read client
+            client = self.context.client_pool.async_read_client
+            rewards_response = await client.distribution.rewards(address)
 
-                rewards = rewards_response.get("rewards", [])
-                total = rewards_response.get("total", [])
+            rewards = rewards_response.get("rewards", [])
+            validators_count = len(rewards)
 
-                return {
+            result = self._with_message(
+                {
                     "address": address,
                     "rewards": rewards,
-                    "total": total,
-                    "validators_count": len(rewards),
-                    "message": f"Retrieved rewards for {address} from {len(rewards)} validator(s)",
-                }
+                    "total": rewards_response.get("total", []),
+                    "validators_count": validators_count,
+                },
+                _MSG_REWARDS,
+            )
+            _rewards_cache.set(cache_key, result)
+            return result
 
-        except Exception as e:
+        except TRANSPORT_ERRORS as e:
             raise NetworkError(
                 message=f"Failed to get rewards: {str(e)}",
                 details={"address": address, "error": str(e)},
@@ -112,7 +141,7 @@ class GetRewardsTool(BaseTool):
                     "Check that the address is correct",
                     "Verify network connectivity",
                 ],
-            )
+            ) from e
 
 
 class WithdrawRewardsTool(BaseTool):
@@ -121,24 +150,23 @@ class WithdrawRewardsTool(BaseTool):
     Withdraw staking rewards from one or all validators.
     """
 
-    @property
-    def name(self) -> str:
-        return "withdraw_rewards"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return (
-            "Withdraw staking rewards from validators. "
-            "Requires active wallet. Can withdraw from specific validator or all validators."
-        )
+    ALLOWED = frozenset({"validator_address"})
 
-    @property
-    def category(self) -> ToolCategory:
-        return ToolCategory.REWARDS
+    # Validation error suggestions, built once instead of on every failure
+    _VALIDATOR_SUGGESTIONS = (
+        "Provide a valid validator address",
+        "Example: {'validator_address': 'secretvaloper1...'}",
+    )
 
-    @property
-    def requires_wallet(self) -> bool:
-        return True  # Requires wallet to sign transaction
+    name = "withdraw_rewards"
+    description = (
+        "Withdraw staking rewards from validators. "
+        "Requires active wallet. Can withdraw from specific validator or all validators."
+    )
+    category = ToolCategory.REWARDS
+    requires_wallet = True  # Requires wallet to sign transaction
 
     def validate_params(self, params: Dict[str, Any]) -> None:
         """Validate withdraw rewards parameters.
@@ -149,6 +177,8 @@ class WithdrawRewardsTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
+        self._check_unknown_params(params)
+
         # validator_address is optional
         # If provided, validate it
         if "validator_address" in params:
@@ -157,10 +187,7 @@ class WithdrawRewardsTool(BaseTool):
                 raise ValidationError(
                     message="Invalid validator_address: must be a non-empty string",
                     details={"provided": validator_address},
-                    suggestions=[
-                        "Provide a valid validator address",
-                        "Example: {'validator_address': 'secretvaloper1...'}",
-                    ],
+                    suggestions=list(self._VALIDATOR_SUGGESTIONS),
                 )
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -175,63 +202,84 @@ class WithdrawRewardsTool(BaseTool):
         validator_address = params.get("validator_address")
 
         # Get active wallet
-        wallet_info = self.context.session.get_wallet()
-        if not wallet_info:
-            raise WalletError(
-                message="No active wallet set",
-                details={},
-                suggestions=["Load a wallet using load_wallet"],
-            )
+        wallet_info = self._require_wallet()
 
         wallet_name = wallet_info.wallet_id
         delegator_address = wallet_info.address
 
-        try:
-            # Create signing client
-            signing_client = await create_signing_client(
-                wallet_name, str(self.context.network.value)
-            )
+        network = self.context.network_name
 
+        try:
             if validator_address:
-                # Withdraw from specific validator
-                result = await signing_client.withdraw_delegator_reward(
-                    validator_address=validator_address
+                # Get (cached) signing client
+                signing_client = await self.context.signing_pool.get(
+                    wallet_name, network, create_signing_client
                 )
 
-                return {
-                    "validator_address": validator_address,
-                    "delegator_address": delegator_address,
-                    "txhash": result.get("txhash"),
-                    "message": f"Successfully withdrew rewards from {validator_address}",
-                }
-            else:
-                # Withdraw from all validators
-                # First get all delegations
-                with self.context.client_pool.get_client() as client:
-                    rewards_response = client.distribution.rewards(
-                        delegator_address
+                # Withdraw from specific validator with the next cached account sequence
+                with self.context.signing_pool.invalidate_on_error(wallet_name, network):
+                    result = await self.context.nonce_cache.submit(
+                        wallet_name,
+                        network,
+                        signing_client.account_sequence,
+                        lambda sequence: signing_client.withdraw_delegator_reward(
+                            validator_address=validator_address, sequence=sequence
+                        ),
                     )
-                    rewards = rewards_response.get("rewards", [])
-                    validators = [r["validator_address"] for r in rewards if r.get("reward")]
+                # The delegator's cached rewards are now out of date
+                _rewards_cache.delete(f"rewards:{network}:{delegator_address}")
 
-                if not validators:
-                    return {
+                return self._with_message(
+                    {
+                        "validator_address": validator_address,
                         "delegator_address": delegator_address,
-                        "validators_count": 0,
-                        "message": "No rewards to withdraw",
-                    }
+                        "txhash": result.get("txhash"),
+                    },
+                    _MSG_WITHDRAW,
+                )
+            else:
+                # Withdraw from all validators. The listing goes through the
+                # same shared async read client as GetRewardsTool.
+                client = self.context.client_pool.async_read_client
+                rewards_response = await client.distribution.rewards(delegator_address)
+                rewards = rewards_response.get("rewards", [])
+                validators = [r["validator_address"] for r in rewards if r.get("reward")]
 
-                # Withdraw from all validators
-                result = await signing_client.withdraw_all_rewards(validators)
+                # Nothing to withdraw: return before any signing setup
+                if not validators:
+                    return self._with_message(
+                        {
+                            "delegator_address": delegator_address,
+                            "validators_count": 0,
+                        },
+                        _MSG_NO_REWARDS,
+                    )
 
-                return {
-                    "delegator_address": delegator_address,
-                    "validators_count": len(validators),
-                    "txhash": result.get("txhash"),
-                    "message": f"Successfully withdrew rewards from {len(validators)} validator(s)",
-                }
+                # Get (cached) signing client and withdraw from all validators
+                signing_client = await self.context.signing_pool.get(
+                    wallet_name, network, create_signing_client
+                )
+                with self.context.signing_pool.invalidate_on_error(wallet_name, network):
+                    result = await self.context.nonce_cache.submit(
+                        wallet_name,
+                        network,
+                        signing_client.account_sequence,
+                        lambda sequence: signing_client.withdraw_all_rewards(
+                            validators, sequence=sequence
+                        ),
+                    )
+                _rewards_cache.delete(f"rewards:{network}:{delegator_address}")
+
+                return self._with_message(
+                    {
+                        "delegator_address": delegator_address,
+                        "validators_count": len(validators),
+                        "txhash": result.get("txhash"),
+                    },
+                    _MSG_WITHDRAW_ALL,
+                )
 
-        except Exception as e:
+        except TRANSPORT_ERRORS as e:
             raise NetworkError(
                 message=f"Failed to withdraw rewards: {str(e)}",
                 details={
@@ -244,8 +292,160 @@ class WithdrawRewardsTool(BaseTool):
                     "Verify the validator address is correct (if specified)",
                     "Verify network connectivity",
                 ],
+            ) from e
+
+
+class WithdrawRewardsBatchTool(BaseTool):
+    """Withdraw staking rewards from a list of validators.
+
+    Packs up to WITHDRAW_BATCH_MSGS_PER_TX withdrawals into each transaction,
+    so N validators take ceil(N / WITHDRAW_BATCH_MSGS_PER_TX) broadcasts.
+    """
+
+    __slots__ = ()
+
+    REQUIRED = frozenset({"validator_addresses"})
+    ALLOWED = REQUIRED
+    PARAMS_EXAMPLE = "{'validator_addresses': ['secretvaloper1...', 'secretvaloper1...']}"
+
+    # Validation error suggestions, built once instead of on every failure
+    _LIST_SUGGESTIONS = ("Provide at least one validator address", f"Example: {PARAMS_EXAMPLE}")
+    _INVALID_SUGGESTIONS = (
+        "Ensure every address starts with 'secretvaloper1'",
+        f"Example: {PARAMS_EXAMPLE}",
+    )
+
+    name = "withdraw_rewards_batch"
+    description = (
+        "Withdraw staking rewards from several validators, packing the withdrawals "
+        "into as few transactions as possible. Requires active wallet."
+    )
+    category = ToolCategory.REWARDS
+    requires_wallet = True  # Requires wallet to sign transactions
+
+    def validate_params(self, params: Dict[str, Any]) -> None:
+        """Validate batch withdraw rewards parameters.
+
+        Args:
+            params: Must contain 'validator_addresses', a non-empty list of
+                validator addresses
+
+        Raises:
+            ValidationError: If parameters are invalid
+        """
+        self._check_required_params(params)
+        self._check_unknown_params(params)
+
+        validator_addresses = params["validator_addresses"]
+        if not isinstance(validator_addresses, list) or not validator_addresses:
+            raise ValidationError(
+                message="validator_addresses must be a non-empty list",
+                details={"provided_type": type(validator_addresses).__name__},
+                suggestions=list(self._LIST_SUGGESTIONS),
             )
 
+        invalid = invalid_validator_addresses(validator_addresses)
+        if invalid:
+            raise ValidationError(
+                message=f"Invalid validator address at index(es) {invalid}",
+                details={"invalid_indices": invalid},
+                suggestions=list(self._INVALID_SUGGESTIONS),
+            )
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute batch withdraw rewards.
+
+        Args:
+            params: Parameters including validator_addresses
+
+        Returns:
+            One transaction hash per broadcast batch
+        """
+        # Drop repeated validators, keeping the caller's order
+        validators = list(dict.fromkeys(params["validator_addresses"]))
+
+        wallet_info = self._require_wallet()
+        wallet_name = wallet_info.wallet_id
+        delegator_address = wallet_info.address
+        network = self.context.network_name
+
+        batches = [
+            validators[start : start + WITHDRAW_BATCH_MSGS_PER_TX]
+            for start in range(0, len(validators), WITHDRAW_BATCH_MSGS_PER_TX)
+        ]
+        txhashes = []
+
+        try:
+            # One signing client for every batch
+            signing_client = await self.context.signing_pool.get(
+                wallet_name, network, create_signing_client
+            )
+
+            # Batches go out one after another, each with the next cached
+            # account sequence
+            with self.context.signing_pool.invalidate_on_error(wallet_name, network):
+                for batch in batches:
+                    result = await self.context.nonce_cache.submit(
+                        wallet_name,
+                        network,
+                        signing_client.account_sequence,
+                        lambda sequence, batch=batch: signing_client.withdraw_all_rewards(
+                            batch, sequence=sequence
+                        ),
+                    )
+                    code = result.get("code", 0)
+                    if code != 0:
+                        # Later batches would go out with a stale view of the
+                        # account, so stop at the first rejected transaction
+                        raise TransactionError(
+                            message=f"Batch withdrawal transaction failed with code {code}",
+                            details={
+                                "delegator_address": delegator_address,
+                                "validators_count": len(validators),
+                                "completed_txhashes": txhashes,
+                                "failed_txhash": result.get("txhash"),
+                                "code": code,
+                                "raw_log": result.get("raw_log"),
+                            },
+                            suggestions=[
+                                "Check completed_txhashes; those batches were already broadcast",
+                                "Check raw_log for the rejection reason",
+                                "Retry the remaining validators once the cause is fixed",
+                            ],
+                        )
+                    txhashes.append(result.get("txhash"))
+
+        except TRANSPORT_ERRORS as e:
+            raise NetworkError(
+                message=f"Failed to withdraw rewards in batch: {str(e)}",
+                details={
+                    "delegator_address": delegator_address,
+                    "validators_count": len(validators),
+                    "completed_txhashes": txhashes,
+                    "error": str(e),
+                },
+                suggestions=[
+                    "Check completed_txhashes; those batches were already broadcast",
+                    "Verify every validator address is correct",
+                    "Verify network connectivity",
+                ],
+            ) from e
+
+        finally:
+            # Any broadcast batch leaves the cached rewards out of date
+            if txhashes:
+                _rewards_cache.delete(f"rewards:{network}:{delegator_address}")
+
+        return self._with_message(
+            {
+                "delegator_address": delegator_address,
+                "validators_count": len(validators),
+                "transactions_count": len(txhashes),
+                "txhashes": txhashes,
+            },
+            _MSG_WITHDRAW_BATCH,
+        )
+
 
 class SetWithdrawAddressTool(BaseTool):
     """Set withdraw address for rewards.
@@ -253,24 +453,19 @@ class SetWithdrawAddressTool(BaseTool):
     Set a different address to receive staking rewards.
     """
 
-    @property
-    def name(self) -> str:
-        return "set_withdraw_address"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Set withdraw address for receiving staking rewards. "
-            "Requires active wallet. Rewards will be sent to the specified address."
-        )
+    __slots__ = ()
 
-    @property
-    def category(self) -> ToolCategory:
-        return ToolCategory.REWARDS
+    REQUIRED = frozenset({"withdraw_address"})
+    ALLOWED = REQUIRED
+    PARAMS_EXAMPLE = "{'withdraw_address': 'secret1...'}"
 
-    @property
-    def requires_wallet(self) -> bool:
-        return True  # Requires wallet to sign transaction
+    name = "set_withdraw_address"
+    description = (
+        "Set withdraw address for receiving staking rewards. "
+        "Requires active wallet. Rewards will be sent to the specified address."
+    )
+    category = ToolCategory.REWARDS
+    requires_wallet = True  # Requires wallet to sign transaction
 
     def validate_params(self, params: Dict[str, Any]) -> None:
         """Validate set withdraw address parameters.
@@ -281,15 +476,8 @@ class SetWithdrawAddressTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "withdraw_address" not in params:
-            raise ValidationError(
-                message="Missing required parameter: withdraw_address",
-                details={"required_params": ["withdraw_address"]},
-                suggestions=[
-                    "Provide 'withdraw_address' parameter",
-                    "Example: {'withdraw_address': 'secret1...'}",
-                ],
-            )
+        self._check_required_params(params)
+        self._check_unknown_params(params)
 
         # Validate address format
         validate_address(params["withdraw_address"])
@@ -306,36 +494,40 @@ class SetWithdrawAddressTool(BaseTool):
         withdraw_address = params["withdraw_address"]
 
         # Get active wallet
-        wallet_info = self.context.session.get_wallet()
-        if not wallet_info:
-            raise WalletError(
-                message="No active wallet set",
-                details={},
-                suggestions=["Load a wallet using load_wallet"],
-            )
+        wallet_info = self._require_wallet()
 
         wallet_name = wallet_info.wallet_id
         delegator_address = wallet_info.address
 
+        network = self.context.network_name
+
         try:
-            # Create signing client
-            signing_client = await create_signing_client(
-                wallet_name, str(self.context.network.value)
+            # Get (cached) signing client
+            signing_client = await self.context.signing_pool.get(
+                wallet_name, network, create_signing_client
             )
 
-            # Set withdraw address
-            result = await signing_client.set_withdraw_address(
-                withdraw_address=withdraw_address
-            )
+            # Set withdraw address with the next cached account sequence
+            with self.context.signing_pool.invalidate_on_error(wallet_name, network):
+                result = await self.context.nonce_cache.submit(
+                    wallet_name,
+                    network,
+                    signing_client.account_sequence,
+                    lambda sequence: signing_client.set_withdraw_address(
+                        withdraw_address=withdraw_address, sequence=sequence
+                    ),
+                )
 
-            return {
-                "delegator_address": delegator_address,
-                "withdraw_address": withdraw_address,
-                "txhash": result.get("txhash"),
-                "message": f"Successfully set withdraw address to {withdraw_address}",
-            }
+            return self._with_message(
+                {
+                    "delegator_address": delegator_address,
+                    "withdraw_address": withdraw_address,
+                    "txhash": result.get("txhash"),
+                },
+                _MSG_SET_WITHDRAW_ADDRESS,
+            )
 
-        except Exception as e:
+        except TRANSPORT_ERRORS as e:
             raise NetworkError(
                 message=f"Failed to set withdraw address: {str(e)}",
                 details={
@@ -347,7 +539,7 @@ class SetWithdrawAddressTool(BaseTool):
                     "Check that the withdraw address is valid",
                     "Verify network connectivity",
                 ],
-            )
+            ) from e
 
 
 class GetCommunityPoolTool(BaseTool):
@@ -356,24 +548,17 @@ class GetCommunityPoolTool(BaseTool):
     Query the community pool balance.
     """
 
-    @property
-    def name(self) -> str:
-        return "get_community_pool"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Get community pool balance. "
-            "Returns the current balance of the community pool."
-        )
+    __slots__ = ()
 
-    @property
-    def category(self) -> ToolCategory:
-        return ToolCategory.REWARDS
+    ALLOWED: FrozenSet[str] = frozenset()
 
-    @property
-    def requires_wallet(self) -> bool:
-        return False  # Read-only query
+    name = "get_community_pool"
+    description = (
+        "Get community pool balance. "
+        "Returns the current balance of the community pool."
+    )
+    category = ToolCategory.REWARDS
+    requires_wallet = False  # Read-only query
 
     def validate_params(self, params: Dict[str, Any]) -> None:
         """Validate get community pool parameters.
@@ -384,8 +569,8 @@ class GetCommunityPoolTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        # No parameters required
-        pass
+        # No parameters accepted
+        self._check_unknown_params(params)
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute get community pool.
@@ -396,19 +581,29 @@ class GetCommunityPoolTool(BaseTool):
         Returns:
             Community pool balance
         """
+        cache_key = f"community_pool:{self.context.network_name}"
+        cached = _rewards_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Query community pool using client pool
             with self.context.client_pool.get_client() as client:
                 pool_response = client.distribution.community_pool()
 
-                pool = pool_response.get("pool", [])
+            pool = pool_response.get("pool", [])
 
-                return {
+            result = self._with_message(
+                {
                     "pool": pool,
-                    "message": f"Retrieved community pool with {len(pool)} denom(s)",
-                }
+                    "count": len(pool),
+                },
+                _MSG_COMMUNITY_POOL,
+            )
+            _rewards_cache.set(cache_key, result)
+            return result
 
-        except Exception as e:
+        except TRANSPORT_ERRORS as e:
             raise NetworkError(
                 message=f"Failed to get community pool: {str(e)}",
                 details={"error": str(e)},
@@ -416,4 +611,4 @@ class GetCommunityPoolTool(BaseTool):
                     "Verify network connectivity",
                     "Try again later",
                 ],
-            )
+            ) from e
@@ -3,11 +3,101 @@
 This module provides tools for validators, delegations, and staking operations.
 """
 
+import asyncio
 from typing import Any, Dict, Optional
 
+from secret_sdk.client.lcd.params import PaginationOptions
+
+from mcp_scrt.tools._inflight import single_flight
+from mcp_scrt.tools._retry import with_retries
 from mcp_scrt.tools.base import BaseTool, ToolCategory
-from mcp_scrt.utils.errors import ValidationError, NetworkError, WalletError
+from mcp_scrt.utils.errors import ValidationError, NetworkError
 from mcp_scrt.core.validation import validate_address, validate_amount
+from mcp_scrt.core.cache import Cache
+from mcp_scrt.constants import CACHE_TTL, VALIDATORS_MAX_LIMIT, VALIDATORS_PAGE_LIMIT
+
+# Validator and delegation query results shared across tool instances (tools
+# are created per call). Delegations change at most once per block, so they
+# live for about one block time; validator queries use the validators TTL.
+_staking_cache = Cache(default_ttl=CACHE_TTL["delegations"], max_size=1024)
+
+# Validator bond statuses accepted by get_validators
+_BOND_STATUSES = (
+    "BOND_STATUS_BONDED",
+    "BOND_STATUS_UNBONDING",
+    "BOND_STATUS_UNBONDED",
+)
+_VALID_BOND_STATUSES = frozenset(_BOND_STATUSES)
+_BOND_STATUS_SUGGESTION = "Use one of: " + ", ".join(_BOND_STATUSES)
+
+# Query and transaction failure suggestions, built once instead of on every
+# failure (the same failure tends to repeat throughout a network outage)
+_RETRY_SUGGESTIONS = ("Verify network connectivity", "Try again later")
+_ADDRESS_QUERY_SUGGESTIONS = ("Check that the address is correct", "Verify network connectivity")
+_VALIDATOR_QUERY_SUGGESTIONS = (
+    "Check that the validator address is correct",
+    "Verify the validator exists on the network",
+    "Verify network connectivity",
+)
+_DELEGATE_SUGGESTIONS = (
+    "Check that you have sufficient balance",
+    "Verify the validator address is correct",
+    "Verify network connectivity",
+)
+_UNDELEGATE_SUGGESTIONS = (
+    "Check that you have sufficient delegated balance",
+    "Verify the validator address is correct",
+    "Verify network connectivity",
+)
+_REDELEGATE_SUGGESTIONS = (
+    "Check that you have sufficient delegated balance",
+    "Verify both validator addresses are correct",
+    "Note: You cannot redelegate to the same validator pair within 21 days",
+    "Verify network connectivity",
+)
+
+# Response message templates (filled from the response dict via format_map)
+_MSG_DELEGATE = "Successfully delegated {amount} {denom} to {validator_address}"
+_MSG_UNDELEGATE = "Successfully undelegated {amount} {denom} from {validator_address}"
+_MSG_REDELEGATE = (
+    "Successfully redelegated {amount} {denom} "
+    "from {src_validator_address} to {dst_validator_address}"
+)
+
+
+def _invalidate_delegations(network: str, delegator_address: str) -> None:
+    """Drop a delegator's cached delegation queries after it changes them.
+
+    Args:
+        network: Network name
+        delegator_address: Delegator whose delegations changed
+    """
+    for kind in ("delegations", "unbonding", "redelegations", "staking_summary"):
+        _staking_cache.delete(f"{kind}:{network}:{delegator_address}")
+
+
+class MockSigningClient:
+    """Placeholder signing client returning canned transaction results.
+
+    It holds no state, so one shared instance serves every wallet.
+    """
+
+    async def delegate(self, validator_address: str, amount: Dict[str, str]):
+        return {"txhash": "mock_hash", "code": 0}
+
+    async def undelegate(self, validator_address: str, amount: Dict[str, str]):
+        return {"txhash": "mock_hash", "code": 0}
+
+    async def redelegate(
+        self,
+        src_validator: str,
+        dst_validator: str,
+        amount: Dict[str, str],
+    ):
+        return {"txhash": "mock_hash", "code": 0}
+
+
+_MOCK_SIGNING_CLIENT = MockSigningClient()
 
 
 # Helper function to create a signing client (placeholder for now)
@@ -17,22 +107,7 @@ async def create_signing_client(wallet_name: str, network: str):
     This is a placeholder that will be replaced with actual signing client implementation.
     """
     # This will be implemented with actual Secret Network signing client
-    class MockSigningClient:
-        async def delegate(self, validator_address: str, amount: Dict[str, str]):
-            return {"txhash": "mock_hash", "code": 0}
-
-        async def undelegate(self, validator_address: str, amount: Dict[str, str]):
-            return {"txhash": "mock_hash", "code": 0}
-
-        async def redelegate(
-            self,
-            src_validator: str,
-            dst_validator: str,
-            amount: Dict[str, str],
-        ):
-            return {"txhash": "mock_hash", "code": 0}
-
-    return MockSigningClient()
+    return _MOCK_SIGNING_CLIENT
 
 
 class GetValidatorsTool(BaseTool):
@@ -41,85 +116,107 @@ class GetValidatorsTool(BaseTool):
     Query all validators on the network with optional status filter.
     """
 
-    @property
-    def name(self) -> str:
-        return "get_validators"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Get all validators on Secret Network. "
-            "Optionally filter by status (bonded, unbonded, unbonding)."
-        )
-
-    @property
-    def category(self) -> ToolCategory:
-        return ToolCategory.STAKING
+    __slots__ = ()
 
-    @property
-    def requires_wallet(self) -> bool:
-        return False  # Read-only query
+    name = "get_validators"
+    description = (
+        "Get validators on Secret Network, one page of up to max_items at a time. "
+        "Optionally filter by status (bonded, unbonded, unbonding)."
+    )
+    category = ToolCategory.STAKING
+    requires_wallet = False  # Read-only query
 
     def validate_params(self, params: Dict[str, Any]) -> None:
         """Validate get validators parameters.
 
         Args:
-            params: Optionally contains 'status' and pagination params
+            params: Optionally contains 'status', 'max_items' and
+                'pagination_key'
 
         Raises:
             ValidationError: If parameters are invalid
         """
         # Status is optional, but if provided should be valid
-        if "status" in params:
-            status = params["status"]
-            valid_statuses = [
-                "BOND_STATUS_BONDED",
-                "BOND_STATUS_UNBONDING",
-                "BOND_STATUS_UNBONDED",
-            ]
-            if status not in valid_statuses:
+        status = params.get("status")
+        if status is not None and status not in _VALID_BOND_STATUSES:
+            raise ValidationError(
+                message=f"Invalid status: {status}",
+                details={"provided": status, "valid_values": list(_BOND_STATUSES)},
+                suggestions=[_BOND_STATUS_SUGGESTION],
+            )
+
+        # Validate max_items if provided
+        if "max_items" in params:
+            max_items = params["max_items"]
+            if (
+                not isinstance(max_items, int)
+                or isinstance(max_items, bool)
+                or not 1 <= max_items <= VALIDATORS_MAX_LIMIT
+            ):
                 raise ValidationError(
-                    message=f"Invalid status: {status}",
-                    details={"provided": status, "valid_values": valid_statuses},
+                    message=f"Invalid max_items: {max_items}",
+                    details={"provided": max_items, "max_limit": VALIDATORS_MAX_LIMIT},
                     suggestions=[
-                        "Use one of: BOND_STATUS_BONDED, BOND_STATUS_UNBONDING, BOND_STATUS_UNBONDED",
+                        f"max_items must be an integer from 1 to {VALIDATORS_MAX_LIMIT}",
+                        f"Example: {{'max_items': {VALIDATORS_PAGE_LIMIT}}}",
                     ],
                 )
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute get validators.
 
+        Returns at most max_items validators; pass the returned next_key as
+        pagination_key to fetch the following page.
+
         Args:
-            params: Parameters including optional status
+            params: Parameters including optional status, max_items and
+                pagination_key
 
         Returns:
-            List of validators
+            Page of validators
         """
-        status = params.get("status", "")
+        status = params.get("status") or ""
+        pagination_key = params.get("pagination_key")
+        max_items = params.get("max_items", VALIDATORS_PAGE_LIMIT)
+
+        cache_key = (
+            f"validators:{self.context.network_name}:{status}:{max_items}:{pagination_key or ''}"
+        )
+        cached = _staking_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        page = PaginationOptions(key=pagination_key, limit=max_items)
+
+        client = self.context.client_pool.async_read_client
 
         try:
-            # Query validators using client pool
-            with self.context.client_pool.get_client() as client:
-                validators_response = client.staking.validators(status=status)
+            # Query one page of validators on the shared async read client,
+            # sharing the request with any concurrent identical query and
+            # retrying transient failures
+            validators_response = await single_flight(
+                cache_key,
+                lambda: with_retries(lambda: client.staking.validators(status=status, params=page)),
+            )
 
-                validators = validators_response.get("validators", [])
-                pagination = validators_response.get("pagination", {})
+            validators = validators_response.get("validators", [])
+            pagination = validators_response.get("pagination", {})
 
-                return {
-                    "validators": validators,
-                    "count": len(validators),
-                    "pagination": pagination,
-                    "message": f"Retrieved {len(validators)} validator(s)",
-                }
+            result = {
+                "validators": validators,
+                "count": len(validators),
+                "pagination": pagination,
+                "next_key": pagination.get("next_key"),
+                "message": f"Retrieved {len(validators)} validator(s)",
+            }
+            _staking_cache.set(cache_key, result, ttl=CACHE_TTL["validators"])
+            return result
 
         except Exception as e:
             raise NetworkError(
                 message=f"Failed to get validators: {str(e)}",
                 details={"status": status, "error": str(e)},
-                suggestions=[
-                    "Verify network connectivity",
-                    "Try again later",
-                ],
+                suggestions=list(_RETRY_SUGGESTIONS),
             )
 
 
@@ -129,24 +226,21 @@ class GetValidatorTool(BaseTool):
     Query details for a specific validator by address.
     """
 
-    @property
-    def name(self) -> str:
-        return "get_validator"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return (
-            "Get details for a specific validator by address. "
-            "Returns validator information including commission, status, and voting power."
-        )
+    REQUIRED = frozenset({"validator_address"})
+    PARAMS_EXAMPLE = "{'validator_address': 'secretvaloper1...'}"
 
-    @property
-    def category(self) -> ToolCategory:
-        return ToolCategory.STAKING
+    # Validation error suggestions, built once instead of on every failure
+    _VALIDATOR_SUGGESTIONS = ("Provide a valid validator address", f"Example: {PARAMS_EXAMPLE}")
 
-    @property
-    def requires_wallet(self) -> bool:
-        return False  # Read-only query
+    name = "get_validator"
+    description = (
+        "Get details for a specific validator by address. "
+        "Returns validator information including commission, status, and voting power."
+    )
+    category = ToolCategory.STAKING
+    requires_wallet = False  # Read-only query
 
     def validate_params(self, params: Dict[str, Any]) -> None:
         """Validate get validator parameters.
@@ -157,25 +251,14 @@ class GetValidatorTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "validator_address" not in params:
-            raise ValidationError(
-                message="Missing required parameter: validator_address",
-                details={"required_params": ["validator_address"]},
-                suggestions=[
-                    "Provide 'validator_address' parameter",
-                    "Example: {'validator_address': 'secretvaloper1...'}",
-                ],
-            )
+        self._check_required_params(params)
 
         validator_address = params["validator_address"]
         if not isinstance(validator_address, str) or not validator_address:
             raise ValidationError(
                 message="Invalid validator_address: must be a non-empty string",
                 details={"provided": validator_address},
-                suggestions=[
-                    "Provide a valid validator address",
-                    "Example: {'validator_address': 'secretvaloper1...'}",
-                ],
+                suggestions=list(self._VALIDATOR_SUGGESTIONS),
             )
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -189,28 +272,36 @@ class GetValidatorTool(BaseTool):
         """
         validator_address = params["validator_address"]
 
+        cache_key = f"validator:{self.context.network_name}:{validator_address}"
+        cached = _staking_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        client = self.context.client_pool.async_read_client
+
         try:
-            # Query validator using client pool
-            with self.context.client_pool.get_client() as client:
-                validator_response = client.staking.validator(validator_address)
+            # Query the validator on the shared async read client, sharing the
+            # request with any concurrent identical query and retrying
+            # transient failures
+            validator_response = await single_flight(
+                cache_key, lambda: with_retries(lambda: client.staking.validator(validator_address))
+            )
 
-                validator = validator_response.get("validator", {})
+            validator = validator_response.get("validator", {})
 
-                return {
-                    "validator_address": validator_address,
-                    "validator": validator,
-                    "message": f"Validator {validator_address} retrieved successfully",
-                }
+            result = {
+                "validator_address": validator_address,
+                "validator": validator,
+                "message": f"Validator {validator_address} retrieved successfully",
+            }
+            _staking_cache.set(cache_key, result, ttl=CACHE_TTL["validators"])
+            return result
 
         except Exception as e:
             raise NetworkError(
                 message=f"Failed to get validator: {str(e)}",
                 details={"validator_address": validator_address, "error": str(e)},
-                suggestions=[
-                    "Check that the validator address is correct",
-                    "Verify the validator exists on the network",
-                    "Verify network connectivity",
-                ],
+                suggestions=list(_VALIDATOR_QUERY_SUGGESTIONS),
             )
 
 
@@ -220,24 +311,18 @@ class DelegateTool(BaseTool):
     Delegate tokens from your account to a validator.
     """
 
-    @property
-    def name(self) -> str:
-        return "delegate"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return (
-            "Delegate tokens to a validator. "
-            "Requires active wallet. Tokens become bonded and earn staking rewards."
-        )
-
-    @property
-    def category(self) -> ToolCategory:
-        return ToolCategory.STAKING
+    REQUIRED = frozenset({"validator_address", "amount"})
+    PARAMS_EXAMPLE = "{'validator_address': 'secretvaloper1...', 'amount': '1000000'}"
 
-    @property
-    def requires_wallet(self) -> bool:
-        return True  # Requires wallet to sign transaction
+    name = "delegate"
+    description = (
+        "Delegate tokens to a validator. "
+        "Requires active wallet. Tokens become bonded and earn staking rewards."
+    )
+    category = ToolCategory.STAKING
+    requires_wallet = True  # Requires wallet to sign transaction
 
     def validate_params(self, params: Dict[str, Any]) -> None:
         """Validate delegate parameters.
@@ -248,25 +333,7 @@ class DelegateTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "validator_address" not in params:
-            raise ValidationError(
-                message="Missing required parameter: validator_address",
-                details={"required_params": ["validator_address", "amount"]},
-                suggestions=[
-                    "Provide 'validator_address' parameter",
-                    "Example: {'validator_address': 'secretvaloper1...', 'amount': '1000000'}",
-                ],
-            )
-
-        if "amount" not in params:
-            raise ValidationError(
-                message="Missing required parameter: amount",
-                details={"required_params": ["validator_address", "amount"]},
-                suggestions=[
-                    "Provide 'amount' parameter",
-                    "Example: {'validator_address': 'secretvaloper1...', 'amount': '1000000'}",
-                ],
-            )
+        self._check_required_params(params)
 
         # Validate amount
         validate_amount(params["amount"], params.get("denom", "uscrt"))
@@ -285,35 +352,34 @@ class DelegateTool(BaseTool):
         denom = params.get("denom", "uscrt")
 
         # Get active wallet
-        wallet_info = self.context.session.get_wallet()
-        if not wallet_info:
-            raise WalletError(
-                message="No active wallet set",
-                details={},
-                suggestions=["Load a wallet using load_wallet"],
-            )
+        wallet_info = self._require_wallet()
 
         wallet_name = wallet_info.wallet_id
+        network = self.context.network_name
+        signing_pool = self.context.signing_pool
 
         try:
-            # Create signing client
-            signing_client = await create_signing_client(
-                wallet_name, str(self.context.network.value)
-            )
+            # Get (cached) signing client
+            signing_client = await signing_pool.get(wallet_name, network, create_signing_client)
 
             # Delegate tokens
-            result = await signing_client.delegate(
-                validator_address=validator_address,
-                amount={"denom": denom, "amount": amount},
-            )
+            with signing_pool.invalidate_on_error(wallet_name, network):
+                result = await signing_client.delegate(
+                    validator_address=validator_address,
+                    amount={"denom": denom, "amount": amount},
+                )
+            # The delegator's cached delegation queries are now out of date
+            _invalidate_delegations(network, wallet_info.address)
 
-            return {
-                "validator_address": validator_address,
-                "amount": amount,
-                "denom": denom,
-                "txhash": result.get("txhash"),
-                "message": f"Successfully delegated {amount} {denom} to {validator_address}",
-            }
+            return self._with_message(
+                {
+                    "validator_address": validator_address,
+                    "amount": amount,
+                    "denom": denom,
+                    "txhash": result.get("txhash"),
+                },
+                _MSG_DELEGATE,
+            )
 
         except Exception as e:
             raise NetworkError(
@@ -323,11 +389,7 @@ class DelegateTool(BaseTool):
                     "amount": amount,
                     "error": str(e),
                 },
-                suggestions=[
-                    "Check that you have sufficient balance",
-                    "Verify the validator address is correct",
-                    "Verify network connectivity",
-                ],
+                suggestions=list(_DELEGATE_SUGGESTIONS),
             )
 
 
@@ -337,24 +399,18 @@ class UndelegateTool(BaseTool):
     Undelegate tokens from a validator. Tokens enter unbonding period.
     """
 
-    @property
-    def name(self) -> str:
-        return "undelegate"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return (
-            "Undelegate tokens from a validator. "
-            "Requires active wallet. Tokens enter 21-day unbonding period."
-        )
+    REQUIRED = frozenset({"validator_address", "amount"})
+    PARAMS_EXAMPLE = "{'validator_address': 'secretvaloper1...', 'amount': '1000000'}"
 
-    @property
-    def category(self) -> ToolCategory:
-        return ToolCategory.STAKING
-
-    @property
-    def requires_wallet(self) -> bool:
-        return True  # Requires wallet to sign transaction
+    name = "undelegate"
+    description = (
+        "Undelegate tokens from a validator. "
+        "Requires active wallet. Tokens enter 21-day unbonding period."
+    )
+    category = ToolCategory.STAKING
+    requires_wallet = True  # Requires wallet to sign transaction
 
     def validate_params(self, params: Dict[str, Any]) -> None:
         """Validate undelegate parameters.
@@ -365,25 +421,7 @@ class UndelegateTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "validator_address" not in params:
-            raise ValidationError(
-                message="Missing required parameter: validator_address",
-                details={"required_params": ["validator_address", "amount"]},
-                suggestions=[
-                    "Provide 'validator_address' parameter",
-                    "Example: {'validator_address': 'secretvaloper1...', 'amount': '1000000'}",
-                ],
-            )
-
-        if "amount" not in params:
-            raise ValidationError(
-                message="Missing required parameter: amount",
-                details={"required_params": ["validator_address", "amount"]},
-                suggestions=[
-                    "Provide 'amount' parameter",
-                    "Example: {'validator_address': 'secretvaloper1...', 'amount': '1000000'}",
-                ],
-            )
+        self._check_required_params(params)
 
         # Validate amount
         validate_amount(params["amount"], params.get("denom", "uscrt"))
@@ -402,35 +440,34 @@ class UndelegateTool(BaseTool):
         denom = params.get("denom", "uscrt")
 
         # Get active wallet
-        wallet_info = self.context.session.get_wallet()
-        if not wallet_info:
-            raise WalletError(
-                message="No active wallet set",
-                details={},
-                suggestions=["Load a wallet using load_wallet"],
-            )
+        wallet_info = self._require_wallet()
 
         wallet_name = wallet_info.wallet_id
+        network = self.context.network_name
+        signing_pool = self.context.signing_pool
 
         try:
-            # Create signing client
-            signing_client = await create_signing_client(
-                wallet_name, str(self.context.network.value)
-            )
+            # Get (cached) signing client
+            signing_client = await signing_pool.get(wallet_name, network, create_signing_client)
 
             # Undelegate tokens
-            result = await signing_client.undelegate(
-                validator_address=validator_address,
-                amount={"denom": denom, "amount": amount},
-            )
+            with signing_pool.invalidate_on_error(wallet_name, network):
+                result = await signing_client.undelegate(
+                    validator_address=validator_address,
+                    amount={"denom": denom, "amount": amount},
+                )
+            # The delegator's cached delegation queries are now out of date
+            _invalidate_delegations(network, wallet_info.address)
 
-            return {
-                "validator_address": validator_address,
-                "amount": amount,
-                "denom": denom,
-                "txhash": result.get("txhash"),
-                "message": f"Successfully undelegated {amount} {denom} from {validator_address}",
-            }
+            return self._with_message(
+                {
+                    "validator_address": validator_address,
+                    "amount": amount,
+                    "denom": denom,
+                    "txhash": result.get("txhash"),
+                },
+                _MSG_UNDELEGATE,
+            )
 
         except Exception as e:
             raise NetworkError(
@@ -440,11 +477,7 @@ class UndelegateTool(BaseTool):
                     "amount": amount,
                     "error": str(e),
                 },
-                suggestions=[
-                    "Check that you have sufficient delegated balance",
-                    "Verify the validator address is correct",
-                    "Verify network connectivity",
-                ],
+                suggestions=list(_UNDELEGATE_SUGGESTIONS),
             )
 
 
@@ -454,24 +487,21 @@ class RedelegateTool(BaseTool):
     Move delegated tokens from one validator to another without unbonding.
     """
 
-    @property
-    def name(self) -> str:
-        return "redelegate"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Redelegate tokens from one validator to another. "
-            "Requires active wallet. No unbonding period, but limited frequency."
-        )
+    __slots__ = ()
 
-    @property
-    def category(self) -> ToolCategory:
-        return ToolCategory.STAKING
+    REQUIRED = frozenset({"src_validator_address", "dst_validator_address", "amount"})
+    PARAMS_EXAMPLE = (
+        "{'src_validator_address': 'secretvaloper1...', "
+        "'dst_validator_address': 'secretvaloper1...', 'amount': '1000000'}"
+    )
 
-    @property
-    def requires_wallet(self) -> bool:
-        return True  # Requires wallet to sign transaction
+    name = "redelegate"
+    description = (
+        "Redelegate tokens from one validator to another. "
+        "Requires active wallet. No unbonding period, but limited frequency."
+    )
+    category = ToolCategory.STAKING
+    requires_wallet = True  # Requires wallet to sign transaction
 
     def validate_params(self, params: Dict[str, Any]) -> None:
         """Validate redelegate parameters.
@@ -482,53 +512,7 @@ class RedelegateTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "src_validator_address" not in params:
-            raise ValidationError(
-                message="Missing required parameter: src_validator_address",
-                details={
-                    "required_params": [
-                        "src_validator_address",
-                        "dst_validator_address",
-                        "amount",
-                    ]
-                },
-                suggestions=[
-                    "Provide 'src_validator_address' parameter",
-                    "Example: {'src_validator_address': 'secretvaloper1...', 'dst_validator_address': 'secretvaloper2...', 'amount': '1000000'}",
-                ],
-            )
-
-        if "dst_validator_address" not in params:
-            raise ValidationError(
-                message="Missing required parameter: dst_validator_address",
-                details={
-                    "required_params": [
-                        "src_validator_address",
-                        "dst_validator_address",
-                        "amount",
-                    ]
-                },
-                suggestions=[
-                    "Provide 'dst_validator_address' parameter",
-                    "Example: {'src_validator_address': 'secretvaloper1...', 'dst_validator_address': 'secretvaloper2...', 'amount': '1000000'}",
-                ],
-            )
-
-        if "amount" not in params:
-            raise ValidationError(
-                message="Missing required parameter: amount",
-                details={
-                    "required_params": [
-                        "src_validator_address",
-                        "dst_validator_address",
-                        "amount",
-                    ]
-                },
-                suggestions=[
-                    "Provide 'amount' parameter",
-                    "Example: {'src_validator_address': 'secretvaloper1...', 'dst_validator_address': 'secretvaloper2...', 'amount': '1000000'}",
-                ],
-            )
+        self._check_required_params(params)
 
         # Validate amount
         validate_amount(params["amount"], params.get("denom", "uscrt"))
@@ -548,37 +532,36 @@ class RedelegateTool(BaseTool):
         denom = params.get("denom", "uscrt")
 
         # Get active wallet
-        wallet_info = self.context.session.get_wallet()
-        if not wallet_info:
-            raise WalletError(
-                message="No active wallet set",
-                details={},
-                suggestions=["Load a wallet using load_wallet"],
-            )
+        wallet_info = self._require_wallet()
 
         wallet_name = wallet_info.wallet_id
+        network = self.context.network_name
+        signing_pool = self.context.signing_pool
 
         try:
-            # Create signing client
-            signing_client = await create_signing_client(
-                wallet_name, str(self.context.network.value)
-            )
+            # Get (cached) signing client
+            signing_client = await signing_pool.get(wallet_name, network, create_signing_client)
 
             # Redelegate tokens
-            result = await signing_client.redelegate(
-                src_validator=src_validator,
-                dst_validator=dst_validator,
-                amount={"denom": denom, "amount": amount},
-            )
+            with signing_pool.invalidate_on_error(wallet_name, network):
+                result = await signing_client.redelegate(
+                    src_validator=src_validator,
+                    dst_validator=dst_validator,
+                    amount={"denom": denom, "amount": amount},
+                )
+            # The delegator's cached delegation queries are now out of date
+            _invalidate_delegations(network, wallet_info.address)
 
-            return {
-                "src_validator_address": src_validator,
-                "dst_validator_address": dst_validator,
-                "amount": amount,
-                "denom": denom,
-                "txhash": result.get("txhash"),
-                "message": f"Successfully redelegated {amount} {denom} from {src_validator} to {dst_validator}",
-            }
+            return self._with_message(
+                {
+                    "src_validator_address": src_validator,
+                    "dst_validator_address": dst_validator,
+                    "amount": amount,
+                    "denom": denom,
+                    "txhash": result.get("txhash"),
+                },
+                _MSG_REDELEGATE,
+            )
 
         except Exception as e:
             raise NetworkError(
@@ -589,12 +572,7 @@ class RedelegateTool(BaseTool):
                     "amount": amount,
                     "error": str(e),
                 },
-                suggestions=[
-                    "Check that you have sufficient delegated balance",
-                    "Verify both validator addresses are correct",
-                    "Note: You cannot redelegate to the same validator pair within 21 days",
-                    "Verify network connectivity",
-                ],
+                suggestions=list(_REDELEGATE_SUGGESTIONS),
             )
 
 
@@ -604,24 +582,18 @@ class GetDelegationsTool(BaseTool):
     Query all delegations for a specific address.
     """
 
-    @property
-    def name(self) -> str:
-        return "get_delegations"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return (
-            "Get all delegations for an address. "
-            "Returns list of validators and delegated amounts."
-        )
+    REQUIRED = frozenset({"address"})
+    PARAMS_EXAMPLE = "{'address': 'secret1...'}"
 
-    @property
-    def category(self) -> ToolCategory:
-        return ToolCategory.STAKING
-
-    @property
-    def requires_wallet(self) -> bool:
-        return False  # Read-only query
+    name = "get_delegations"
+    description = (
+        "Get all delegations for an address. "
+        "Returns list of validators and delegated amounts."
+    )
+    category = ToolCategory.STAKING
+    requires_wallet = False  # Read-only query
 
     def validate_params(self, params: Dict[str, Any]) -> None:
         """Validate get delegations parameters.
@@ -632,15 +604,7 @@ class GetDelegationsTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "address" not in params:
-            raise ValidationError(
-                message="Missing required parameter: address",
-                details={"required_params": ["address"]},
-                suggestions=[
-                    "Provide 'address' parameter",
-                    "Example: {'address': 'secret1...'}",
-                ],
-            )
+        self._check_required_params(params)
 
         # Validate address format
         validate_address(params["address"])
@@ -656,32 +620,39 @@ class GetDelegationsTool(BaseTool):
         """
         address = params["address"]
 
+        cache_key = f"delegations:{self.context.network_name}:{address}"
+        cached = _staking_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        client = self.context.client_pool.async_read_client
+
         try:
-            # Query delegations using client pool
-            with self.context.client_pool.get_client() as client:
-                delegations_response = client.staking.delegations(address)
+            # Query delegations on the shared async read client, sharing the
+            # request with any concurrent identical query and retrying
+            # transient failures
+            delegations_response = await single_flight(
+                cache_key, lambda: with_retries(lambda: client.staking.delegations(address))
+            )
 
-                delegation_responses = delegations_response.get(
-                    "delegation_responses", []
-                )
-                pagination = delegations_response.get("pagination", {})
+            delegation_responses = delegations_response.get("delegation_responses", [])
+            pagination = delegations_response.get("pagination", {})
 
-                return {
-                    "address": address,
-                    "delegations": delegation_responses,
-                    "count": len(delegation_responses),
-                    "pagination": pagination,
-                    "message": f"Retrieved {len(delegation_responses)} delegation(s) for {address}",
-                }
+            result = {
+                "address": address,
+                "delegations": delegation_responses,
+                "count": len(delegation_responses),
+                "pagination": pagination,
+                "message": f"Retrieved {len(delegation_responses)} delegation(s) for {address}",
+            }
+            _staking_cache.set(cache_key, result)
+            return result
 
         except Exception as e:
             raise NetworkError(
                 message=f"Failed to get delegations: {str(e)}",
                 details={"address": address, "error": str(e)},
-                suggestions=[
-                    "Check that the address is correct",
-                    "Verify network connectivity",
-                ],
+                suggestions=list(_ADDRESS_QUERY_SUGGESTIONS),
             )
 
 
@@ -691,24 +662,18 @@ class GetUnbondingTool(BaseTool):
     Query unbonding delegations for a specific address.
     """
 
-    @property
-    def name(self) -> str:
-        return "get_unbonding"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Get unbonding delegations for an address. "
-            "Returns delegations currently in the unbonding period."
-        )
+    __slots__ = ()
 
-    @property
-    def category(self) -> ToolCategory:
-        return ToolCategory.STAKING
+    REQUIRED = frozenset({"address"})
+    PARAMS_EXAMPLE = "{'address': 'secret1...'}"
 
-    @property
-    def requires_wallet(self) -> bool:
-        return False  # Read-only query
+    name = "get_unbonding"
+    description = (
+        "Get unbonding delegations for an address. "
+        "Returns delegations currently in the unbonding period."
+    )
+    category = ToolCategory.STAKING
+    requires_wallet = False  # Read-only query
 
     def validate_params(self, params: Dict[str, Any]) -> None:
         """Validate get unbonding parameters.
@@ -719,15 +684,7 @@ class GetUnbondingTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "address" not in params:
-            raise ValidationError(
-                message="Missing required parameter: address",
-                details={"required_params": ["address"]},
-                suggestions=[
-                    "Provide 'address' parameter",
-                    "Example: {'address': 'secret1...'}",
-                ],
-            )
+        self._check_required_params(params)
 
         # Validate address format
         validate_address(params["address"])
@@ -743,32 +700,40 @@ class GetUnbondingTool(BaseTool):
         """
         address = params["address"]
 
+        cache_key = f"unbonding:{self.context.network_name}:{address}"
+        cached = _staking_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        client = self.context.client_pool.async_read_client
+
         try:
-            # Query unbonding delegations using client pool
-            with self.context.client_pool.get_client() as client:
-                unbonding_response = client.staking.unbonding_delegations(
-                    address
-                )
+            # Query unbonding delegations on the shared async read client,
+            # sharing the request with any concurrent identical query and
+            # retrying transient failures
+            unbonding_response = await single_flight(
+                cache_key,
+                lambda: with_retries(lambda: client.staking.unbonding_delegations(address)),
+            )
 
-                unbonding_responses = unbonding_response.get("unbonding_responses", [])
-                pagination = unbonding_response.get("pagination", {})
+            unbonding_responses = unbonding_response.get("unbonding_responses", [])
+            pagination = unbonding_response.get("pagination", {})
 
-                return {
-                    "address": address,
-                    "unbonding_delegations": unbonding_responses,
-                    "count": len(unbonding_responses),
-                    "pagination": pagination,
-                    "message": f"Retrieved {len(unbonding_responses)} unbonding delegation(s) for {address}",
-                }
+            result = {
+                "address": address,
+                "unbonding_delegations": unbonding_responses,
+                "count": len(unbonding_responses),
+                "pagination": pagination,
+                "message": f"Retrieved {len(unbonding_responses)} unbonding delegation(s) for {address}",
+            }
+            _staking_cache.set(cache_key, result)
+            return result
 
         except Exception as e:
             raise NetworkError(
                 message=f"Failed to get unbonding delegations: {str(e)}",
                 details={"address": address, "error": str(e)},
-                suggestions=[
-                    "Check that the address is correct",
-                    "Verify network connectivity",
-                ],
+                suggestions=list(_ADDRESS_QUERY_SUGGESTIONS),
             )
 
 
@@ -778,24 +743,18 @@ class GetRedelegationsTool(BaseTool):
     Query redelegations for a specific address.
     """
 
-    @property
-    def name(self) -> str:
-        return "get_redelegations"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return (
-            "Get redelegations for an address. "
-            "Returns active redelegation records."
-        )
-
-    @property
-    def category(self) -> ToolCategory:
-        return ToolCategory.STAKING
+    REQUIRED = frozenset({"address"})
+    PARAMS_EXAMPLE = "{'address': 'secret1...'}"
 
-    @property
-    def requires_wallet(self) -> bool:
-        return False  # Read-only query
+    name = "get_redelegations"
+    description = (
+        "Get redelegations for an address. "
+        "Returns active redelegation records."
+    )
+    category = ToolCategory.STAKING
+    requires_wallet = False  # Read-only query
 
     def validate_params(self, params: Dict[str, Any]) -> None:
         """Validate get redelegations parameters.
@@ -806,15 +765,7 @@ class GetRedelegationsTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "address" not in params:
-            raise ValidationError(
-                message="Missing required parameter: address",
-                details={"required_params": ["address"]},
-                suggestions=[
-                    "Provide 'address' parameter",
-                    "Example: {'address': 'secret1...'}",
-                ],
-            )
+        self._check_required_params(params)
 
         # Validate address format
         validate_address(params["address"])
@@ -830,32 +781,128 @@ class GetRedelegationsTool(BaseTool):
         """
         address = params["address"]
 
+        cache_key = f"redelegations:{self.context.network_name}:{address}"
+        cached = _staking_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        client = self.context.client_pool.async_read_client
+
         try:
-            # Query redelegations using client pool
-            with self.context.client_pool.get_client() as client:
-                redelegations_response = client.staking.redelegations(
-                    delegator_addr=address
-                )
+            # Query redelegations on the shared async read client, sharing the
+            # request with any concurrent identical query and retrying
+            # transient failures
+            redelegations_response = await single_flight(
+                cache_key,
+                lambda: with_retries(lambda: client.staking.redelegations(delegator_addr=address)),
+            )
 
-                redelegation_responses = redelegations_response.get(
-                    "redelegation_responses", []
-                )
-                pagination = redelegations_response.get("pagination", {})
+            redelegation_responses = redelegations_response.get("redelegation_responses", [])
+            pagination = redelegations_response.get("pagination", {})
 
-                return {
-                    "address": address,
-                    "redelegations": redelegation_responses,
-                    "count": len(redelegation_responses),
-                    "pagination": pagination,
-                    "message": f"Retrieved {len(redelegation_responses)} redelegation(s) for {address}",
-                }
+            result = {
+                "address": address,
+                "redelegations": redelegation_responses,
+                "count": len(redelegation_responses),
+                "pagination": pagination,
+                "message": f"Retrieved {len(redelegation_responses)} redelegation(s) for {address}",
+            }
+            _staking_cache.set(cache_key, result)
+            return result
 
         except Exception as e:
             raise NetworkError(
                 message=f"Failed to get redelegations: {str(e)}",
                 details={"address": address, "error": str(e)},
-                suggestions=[
-                    "Check that the address is correct",
-                    "Verify network connectivity",
-                ],
+                suggestions=list(_ADDRESS_QUERY_SUGGESTIONS),
             )
+
+
+class GetStakingSummaryTool(BaseTool):
+    """Get a staking summary for address.
+
+    Query delegations, unbonding delegations and redelegations for an
+    address in one call, with the three queries running concurrently.
+    """
+
+    __slots__ = ()
+
+    REQUIRED = frozenset({"address"})
+    PARAMS_EXAMPLE = "{'address': 'secret1...'}"
+
+    name = "get_staking_summary"
+    description = (
+        "Get delegations, unbonding delegations and redelegations for an address "
+        "in a single call."
+    )
+    category = ToolCategory.STAKING
+    requires_wallet = False  # Read-only query
+
+    def validate_params(self, params: Dict[str, Any]) -> None:
+        """Validate get staking summary parameters.
+
+        Args:
+            params: Must contain 'address'
+
+        Raises:
+            ValidationError: If parameters are invalid
+        """
+        self._check_required_params(params)
+
+        # Validate address format
+        validate_address(params["address"])
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute get staking summary.
+
+        Args:
+            params: Parameters including address
+
+        Returns:
+            Delegations, unbonding delegations and redelegations
+        """
+        address = params["address"]
+
+        cache_key = f"staking_summary:{self.context.network_name}:{address}"
+        cached = _staking_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        client = self.context.client_pool.async_read_client
+
+        try:
+            # Await the three queries at once on the shared async read client
+            delegations_response, unbonding_response, redelegations_response = (
+                await asyncio.gather(
+                    client.staking.delegations(address),
+                    client.staking.unbonding_delegations(address),
+                    client.staking.redelegations(delegator_addr=address),
+                )
+            )
+
+        except Exception as e:
+            raise NetworkError(
+                message=f"Failed to get staking summary: {str(e)}",
+                details={"address": address, "error": str(e)},
+                suggestions=list(_ADDRESS_QUERY_SUGGESTIONS),
+            )
+
+        delegations = delegations_response.get("delegation_responses", [])
+        unbonding = unbonding_response.get("unbonding_responses", [])
+        redelegations = redelegations_response.get("redelegation_responses", [])
+
+        result = {
+            "address": address,
+            "delegations": delegations,
+            "unbonding_delegations": unbonding,
+            "redelegations": redelegations,
+            "delegations_count": len(delegations),
+            "unbonding_count": len(unbonding),
+            "redelegations_count": len(redelegations),
+            "message": (
+                f"Retrieved {len(delegations)} delegation(s), {len(unbonding)} unbonding "
+                f"delegation(s) and {len(redelegations)} redelegation(s) for {address}"
+            ),
+        }
+        _staking_cache.set(cache_key, result)
+        return result
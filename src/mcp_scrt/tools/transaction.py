@@ -3,10 +3,156 @@
 This module provides tools for querying, searching, and simulating transactions.
 """
 
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List
 
+from secret_sdk.client.lcd.params import PaginationOptions
+from secret_sdk.exceptions import LCDResponseError
+
+from mcp_scrt.tools._inflight import single_flight
 from mcp_scrt.tools.base import BaseTool, ToolCategory
 from mcp_scrt.utils.errors import ValidationError, NetworkError
+from mcp_scrt.core.cache import Cache
+from mcp_scrt.sdk.client import ClientPool
+from mcp_scrt.constants import (
+    BULK_QUERY_CONCURRENCY,
+    CACHE_TTL,
+    TX_BULK_MAX_HASHES,
+    TX_QUERY_CONCURRENCY,
+    TX_QUERY_TIMEOUT,
+    TX_SEARCH_MAX_LIMIT,
+    TX_SEARCH_PAGE_LIMIT,
+)
+
+# Query slots shared by every transaction tool: at most TX_QUERY_CONCURRENCY
+# queries reach the node at once and the rest wait for a free slot
+_query_slots = asyncio.Semaphore(TX_QUERY_CONCURRENCY)
+
+# Transactions included in a block never change; keep the most recently
+# queried ones so status polling and repeated lookups skip the LCD
+_tx_cache = Cache(default_ttl=CACHE_TTL["tx_results"], max_size=4096)
+
+# Parameter examples and validation error suggestions, built once instead of
+# on every failure
+_HASH_EXAMPLE = "{'hash': 'ABC123...'}"
+_HASHES_EXAMPLE = "{'hashes': ['ABC123...', 'DEF456...']}"
+_MESSAGES_EXAMPLE = "{'messages': [{'type': 'MsgSend', ...}]}"
+_INVALID_HASH_SUGGESTIONS = ("Provide a valid transaction hash", f"Example: {_HASH_EXAMPLE}")
+_EMPTY_MESSAGES_SUGGESTIONS = (
+    "Provide at least one message",
+    "Example: {'messages': [{'type': 'MsgSend'}]}",
+)
+
+# Simplified gas model shared by estimate_gas and simulate_transaction
+_BASE_GAS = 100000
+_GAS_PER_MESSAGE = 50000
+_GAS_WANTED_BUFFER = 1.2  # Simulated gas_wanted adds 20% to gas_used
+_ESTIMATE_NOTE = (
+    "This is a simplified estimation. For accurate gas estimation, use simulate_transaction."
+)
+_SIMULATION_NOTE = "This is a test implementation. Real simulation requires full SDK integration."
+
+# Response message templates (filled from the response dict via format_map)
+_MSG_TRANSACTION = "Transaction {hash:.8}... retrieved successfully"
+
+# LCD status for a hash with no transaction (yet): GetTx reports NotFound
+_TX_NOT_FOUND_STATUS = 404
+
+# Transaction search pages, kept for about one block so repeated searches
+# (e.g. paging back and forth) skip the LCD
+_search_cache = Cache(default_ttl=CACHE_TTL["tx_search"], max_size=512)
+
+
+async def _run_query(query: Callable[..., Awaitable[Any]], **kwargs: Any) -> Any:
+    """Await an LCD query while holding one of the shared query slots.
+
+    The query gets TX_QUERY_TIMEOUT seconds once it holds a slot; time spent
+    waiting for a free slot does not count. A query that runs out of time is
+    cancelled and its slot released.
+
+    Args:
+        query: Async LCD client method performing the query
+        **kwargs: Arguments for the query
+
+    Returns:
+        Query result
+
+    Raises:
+        NetworkError: If the query did not finish in time
+    """
+    async with _query_slots:
+        try:
+            return await asyncio.wait_for(query(**kwargs), timeout=TX_QUERY_TIMEOUT)
+        except asyncio.TimeoutError as e:
+            raise NetworkError(
+                message=f"Transaction query did not finish within {TX_QUERY_TIMEOUT}s",
+                details={"timeout": TX_QUERY_TIMEOUT},
+                suggestions=["Retry the query", "Verify network connectivity"],
+            ) from e
+
+
+async def _get_tx(client_pool: ClientPool, network: str, tx_hash: str) -> Dict[str, Any]:
+    """Get a transaction, from the cache once it is included in a block.
+
+    Args:
+        client_pool: Client pool to query with
+        network: Network name (e.g., "testnet")
+        tx_hash: Transaction hash
+
+    Returns:
+        Transaction response from the LCD
+
+    Raises:
+        Exception: If the query fails
+    """
+    cache_key = f"tx:{network}:{tx_hash}"
+    tx_response = _tx_cache.get(cache_key)
+    if tx_response is not None:
+        return tx_response
+
+    async def fetch_tx() -> Dict[str, Any]:
+        # Query transaction on the pool's shared async read client
+        tx_response = await _run_query(client_pool.async_read_client.tx.get_tx, hash=tx_hash)
+
+        # Only cache transactions with a block height; nothing else is final
+        height = tx_response.get("tx_response", {}).get("height")
+        if height and str(height) != "0":
+            _tx_cache.set(cache_key, tx_response)
+        return tx_response
+
+    # Share the query (and its cache fill) with any concurrent lookup of the
+    # same hash
+    return await single_flight(cache_key, fetch_tx)
+
+
+def _summarize_tx(tx_response: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a transaction response to its hash, height, code and message types.
+
+    Args:
+        tx_response: Transaction response from a search
+
+    Returns:
+        Transaction summary
+    """
+    messages = tx_response.get("tx", {}).get("body", {}).get("messages", [])
+    return {
+        "hash": tx_response.get("txhash"),
+        "height": tx_response.get("height"),
+        "code": tx_response.get("code"),
+        "message_types": [message.get("@type") for message in messages],
+    }
+
+
+def _estimate_gas(messages_count: int) -> int:
+    """Estimate gas for a transaction from its number of messages.
+
+    Args:
+        messages_count: Number of messages in the transaction
+
+    Returns:
+        Estimated gas units
+    """
+    return _BASE_GAS + messages_count * _GAS_PER_MESSAGE
 
 
 class GetTransactionTool(BaseTool):
@@ -15,6 +161,9 @@ class GetTransactionTool(BaseTool):
     Query transaction details using its hash.
     """
 
+    REQUIRED = frozenset({"hash"})
+    PARAMS_EXAMPLE = _HASH_EXAMPLE
+
     @property
     def name(self) -> str:
         return "get_transaction"
@@ -43,15 +192,7 @@ class GetTransactionTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "hash" not in params:
-            raise ValidationError(
-                message="Missing required parameter: hash",
-                details={"required_params": ["hash"]},
-                suggestions=[
-                    "Provide 'hash' parameter",
-                    "Example: {'hash': 'ABC123...'}",
-                ],
-            )
+        self._check_required_params(params)
 
         # Validate hash is a non-empty string
         tx_hash = params["hash"]
@@ -59,10 +200,7 @@ class GetTransactionTool(BaseTool):
             raise ValidationError(
                 message="Invalid hash: must be a non-empty string",
                 details={"provided": tx_hash},
-                suggestions=[
-                    "Provide a valid transaction hash",
-                    "Example: {'hash': 'ABC123...'}",
-                ],
+                suggestions=list(_INVALID_HASH_SUGGESTIONS),
             )
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -77,19 +215,21 @@ class GetTransactionTool(BaseTool):
         tx_hash = params["hash"]
 
         try:
-            # Query transaction using client pool
-            with self.context.client_pool.get_client() as client:
-                tx_response = client.tx.get_tx(hash=tx_hash)
+            tx_response = await _get_tx(
+                self.context.client_pool, self.context.network_name, tx_hash
+            )
 
-                tx_data = tx_response.get("tx_response", {})
+            tx_data = tx_response.get("tx_response", {})
 
-                return {
+            return self._with_message(
+                {
                     "hash": tx_hash,
                     "transaction": tx_data,
                     "height": tx_data.get("height"),
                     "code": tx_data.get("code"),
-                    "message": f"Transaction {tx_hash[:8]}... retrieved successfully",
-                }
+                },
+                _MSG_TRANSACTION,
+            )
 
         except Exception as e:
             raise NetworkError(
@@ -110,6 +250,9 @@ class SearchTransactionsTool(BaseTool):
     Search for transactions using query parameters.
     """
 
+    REQUIRED = frozenset({"query"})
+    PARAMS_EXAMPLE = "{'query': \"message.action='/cosmos.bank.v1beta1.MsgSend'\"}"
+
     @property
     def name(self) -> str:
         return "search_transactions"
@@ -118,7 +261,8 @@ class SearchTransactionsTool(BaseTool):
     def description(self) -> str:
         return (
             "Search for transactions using query criteria. "
-            "Supports filtering by message type, sender, recipient, and more."
+            "Supports filtering by message type, sender, recipient, and more. "
+            "Set include_details to false to get only hash, height, code and message types."
         )
 
     @property
@@ -166,38 +310,35 @@ class SearchTransactionsTool(BaseTool):
         """Validate search transactions parameters.
 
         Args:
-            params: Must contain 'query', optionally 'limit' and 'page'
+            params: Must contain 'query', optionally 'limit', 'page' and
+                'include_details'
 
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "query" not in params:
-            raise ValidationError(
-                message="Missing required parameter: query",
-                details={"required_params": ["query"]},
-                suggestions=[
-                    "Provide 'query' parameter",
-                    "Example: {'query': \"message.action='/cosmos.bank.v1beta1.MsgSend'\"}",
-                ],
-            )
+        self._check_required_params(params)
 
         # Validate limit if provided
         if "limit" in params:
             limit = params["limit"]
-            if not isinstance(limit, int) or limit < 1:
+            if (
+                not isinstance(limit, int)
+                or isinstance(limit, bool)
+                or not 1 <= limit <= TX_SEARCH_MAX_LIMIT
+            ):
                 raise ValidationError(
                     message=f"Invalid limit: {limit}",
-                    details={"provided": limit},
+                    details={"provided": limit, "max_limit": TX_SEARCH_MAX_LIMIT},
                     suggestions=[
-                        "Limit must be a positive integer",
-                        "Example: {'limit': 100}",
+                        f"Limit must be an integer from 1 to {TX_SEARCH_MAX_LIMIT}",
+                        f"Example: {{'limit': {TX_SEARCH_PAGE_LIMIT}}}",
                     ],
                 )
 
         # Validate page if provided
         if "page" in params:
             page = params["page"]
-            if not isinstance(page, int) or page < 1:
+            if not isinstance(page, int) or isinstance(page, bool) or page < 1:
                 raise ValidationError(
                     message=f"Invalid page: {page}",
                     details={"provided": page},
@@ -207,47 +348,82 @@ class SearchTransactionsTool(BaseTool):
                     ],
                 )
 
+        # Validate include_details if provided
+        if "include_details" in params and not isinstance(params["include_details"], bool):
+            raise ValidationError(
+                message=f"Invalid include_details: {params['include_details']}",
+                details={"provided_type": type(params["include_details"]).__name__},
+                suggestions=[
+                    "include_details must be true or false",
+                    "Example: {'include_details': false}",
+                ],
+            )
+
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute search transactions.
 
+        With include_details false, each transaction is reduced to its hash,
+        height, code and message types; callers needing a full transaction
+        can fetch it with get_transaction.
+
         Args:
-            params: Parameters including query, limit, page
+            params: Parameters including query, limit, page and
+                include_details
 
         Returns:
             Search results
         """
         query = params["query"]
-        limit = params.get("limit", 100)
+        limit = params.get("limit", TX_SEARCH_PAGE_LIMIT)
         page = params.get("page", 1)
+        include_details = params.get("include_details", True)
+
+        cache_key = (
+            f"search:{self.context.network_name}:{page}:{limit}:{int(include_details)}:{query}"
+        )
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
             # Parse query string into events format for secret-sdk
             # Example: "message.sender='secret1...'" -> [["message.sender", "secret1..."]]
             events = self._parse_query_to_events(query)
 
-            # Search transactions using client pool
-            with self.context.client_pool.get_client() as client:
-                # Create params for pagination
-                from secret_sdk.client.lcd.params import APIParams
-                api_params = APIParams(pagination_limit=limit, pagination_offset=(page - 1) * limit)
+            # Create params for pagination
+            api_params = PaginationOptions(limit=limit, offset=(page - 1) * limit)
 
-                search_response = client.tx.search(
-                    events=events,
-                    params=api_params,
-                )
-
-                txs = search_response.get("txs", [])
-                total_count = len(txs)  # The response returns actual results
+            # Search transactions on the pool's shared async read client
+            search_response = await _run_query(
+                self.context.client_pool.async_read_client.tx.search,
+                events=events,
+                params=api_params,
+            )
 
-                return {
-                    "query": query,
-                    "transactions": txs,
-                    "count": len(txs),
-                    "total_count": total_count,
-                    "page": page,
-                    "limit": limit,
-                    "message": f"Found {total_count} transaction(s) matching query",
-                }
+            txs = search_response.get("txs", [])
+            if not include_details:
+                # Transaction responses carry the hash, height and code
+                # alongside the body; the bare txs list has only the body
+                txs = [
+                    _summarize_tx(tx_response)
+                    for tx_response in search_response.get("tx_responses", [])
+                ]
+            total_count = len(txs)  # The response returns actual results
+
+            result = {
+                "query": query,
+                "transactions": txs,
+                "count": len(txs),
+                "total_count": total_count,
+                "page": page,
+                "limit": limit,
+                "message": f"Found {total_count} transaction(s) matching query",
+            }
+            # An empty page may fill as soon as a matching transaction lands,
+            # so only pages with results are cached
+            if txs:
+                _search_cache.set(cache_key, result)
+            return result
 
         except Exception as e:
             raise NetworkError(
@@ -267,6 +443,9 @@ class EstimateGasTool(BaseTool):
     Estimate the gas required for a transaction.
     """
 
+    REQUIRED = frozenset({"messages"})
+    PARAMS_EXAMPLE = _MESSAGES_EXAMPLE
+
     @property
     def name(self) -> str:
         return "estimate_gas"
@@ -295,25 +474,14 @@ class EstimateGasTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "messages" not in params:
-            raise ValidationError(
-                message="Missing required parameter: messages",
-                details={"required_params": ["messages"]},
-                suggestions=[
-                    "Provide 'messages' parameter as a list",
-                    "Example: {'messages': [{'type': 'MsgSend', ...}]}",
-                ],
-            )
+        self._check_required_params(params)
 
         messages = params["messages"]
         if not isinstance(messages, list) or len(messages) == 0:
             raise ValidationError(
                 message="Messages must be a non-empty list",
                 details={"provided_type": type(messages).__name__},
-                suggestions=[
-                    "Provide at least one message",
-                    "Example: {'messages': [{'type': 'MsgSend'}]}",
-                ],
+                suggestions=list(_EMPTY_MESSAGES_SUGGESTIONS),
             )
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -325,19 +493,17 @@ class EstimateGasTool(BaseTool):
         Returns:
             Gas estimation
         """
-        messages = params["messages"]
+        messages_count = len(params["messages"])
 
         # For now, provide a simple gas estimation
         # In a full implementation, this would simulate the transaction
-        base_gas = 100000
-        per_message_gas = 50000
-        estimated_gas = base_gas + (len(messages) * per_message_gas)
+        estimated_gas = _estimate_gas(messages_count)
 
         return {
-            "messages_count": len(messages),
+            "messages_count": messages_count,
             "gas_estimate": estimated_gas,
-            "message": f"Estimated gas: {estimated_gas} units for {len(messages)} message(s)",
-            "note": "This is a simplified estimation. For accurate gas estimation, use simulate_transaction.",
+            "message": f"Estimated gas: {estimated_gas} units for {messages_count} message(s)",
+            "note": _ESTIMATE_NOTE,
         }
 
 
@@ -347,6 +513,9 @@ class SimulateTransactionTool(BaseTool):
     Simulate a transaction to check if it will succeed and estimate gas.
     """
 
+    REQUIRED = frozenset({"messages"})
+    PARAMS_EXAMPLE = _MESSAGES_EXAMPLE
+
     @property
     def name(self) -> str:
         return "simulate_transaction"
@@ -375,25 +544,14 @@ class SimulateTransactionTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "messages" not in params:
-            raise ValidationError(
-                message="Missing required parameter: messages",
-                details={"required_params": ["messages"]},
-                suggestions=[
-                    "Provide 'messages' parameter as a list",
-                    "Example: {'messages': [{'type': 'MsgSend', ...}]}",
-                ],
-            )
+        self._check_required_params(params)
 
         messages = params["messages"]
         if not isinstance(messages, list) or len(messages) == 0:
             raise ValidationError(
                 message="Messages must be a non-empty list",
                 details={"provided_type": type(messages).__name__},
-                suggestions=[
-                    "Provide at least one message",
-                    "Example: {'messages': [{'type': 'MsgSend'}]}",
-                ],
+                suggestions=list(_EMPTY_MESSAGES_SUGGESTIONS),
             )
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -405,24 +563,22 @@ class SimulateTransactionTool(BaseTool):
         Returns:
             Simulation result
         """
-        messages = params["messages"]
+        messages_count = len(params["messages"])
 
         # For now, provide a mock simulation result
         # In a full implementation, this would use the LCD client to simulate
-        base_gas = 100000
-        per_message_gas = 50000
-        gas_used = base_gas + (len(messages) * per_message_gas)
+        gas_used = _estimate_gas(messages_count)
 
         return {
             "simulation": {
                 "success": True,
                 "gas_used": gas_used,
-                "gas_wanted": int(gas_used * 1.2),  # Add 20% buffer
+                "gas_wanted": int(gas_used * _GAS_WANTED_BUFFER),
                 "logs": [],
             },
-            "messages_count": len(messages),
+            "messages_count": messages_count,
             "message": "Transaction simulation successful",
-            "note": "This is a test implementation. Real simulation requires full SDK integration.",
+            "note": _SIMULATION_NOTE,
         }
 
 
@@ -432,6 +588,9 @@ class GetTransactionStatusTool(BaseTool):
     Query the status of a transaction (success/failure/pending).
     """
 
+    REQUIRED = frozenset({"hash"})
+    PARAMS_EXAMPLE = _HASH_EXAMPLE
+
     @property
     def name(self) -> str:
         return "get_transaction_status"
@@ -460,15 +619,7 @@ class GetTransactionStatusTool(BaseTool):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if "hash" not in params:
-            raise ValidationError(
-                message="Missing required parameter: hash",
-                details={"required_params": ["hash"]},
-                suggestions=[
-                    "Provide 'hash' parameter",
-                    "Example: {'hash': 'ABC123...'}",
-                ],
-            )
+        self._check_required_params(params)
 
         # Validate hash is a non-empty string
         tx_hash = params["hash"]
@@ -476,10 +627,7 @@ class GetTransactionStatusTool(BaseTool):
             raise ValidationError(
                 message="Invalid hash: must be a non-empty string",
                 details={"provided": tx_hash},
-                suggestions=[
-                    "Provide a valid transaction hash",
-                    "Example: {'hash': 'ABC123...'}",
-                ],
+                suggestions=list(_INVALID_HASH_SUGGESTIONS),
             )
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -494,34 +642,36 @@ class GetTransactionStatusTool(BaseTool):
         tx_hash = params["hash"]
 
         try:
-            # Query transaction using client pool
-            with self.context.client_pool.get_client() as client:
-                tx_response = client.tx.get_tx(hash=tx_hash)
-
-                tx_data = tx_response.get("tx_response", {})
-                code = tx_data.get("code", 0)
-                height = tx_data.get("height")
-
-                # Determine status based on code
-                if code == 0:
-                    status = "success"
-                    status_message = "Transaction executed successfully"
-                else:
-                    status = "failed"
-                    status_message = f"Transaction failed with code {code}"
+            tx_response = await _get_tx(
+                self.context.client_pool, self.context.network_name, tx_hash
+            )
 
-                return {
-                    "hash": tx_hash,
-                    "status": status,
-                    "code": code,
-                    "height": height,
-                    "message": status_message,
-                }
+            tx_data = tx_response.get("tx_response", {})
+            code = tx_data.get("code", 0)
+            height = tx_data.get("height")
+
+            # Determine status based on code
+            if code == 0:
+                status = "success"
+                status_message = "Transaction executed successfully"
+            else:
+                status = "failed"
+                status_message = f"Transaction failed with code {code}"
+
+            return {
+                "hash": tx_hash,
+                "status": status,
+                "code": code,
+                "height": height,
+                "message": status_message,
+            }
 
         except Exception as e:
             # If transaction not found, it might be pending or invalid
-            error_msg = str(e).lower()
-            if "not found" in error_msg or "does not exist" in error_msg:
+            if (
+                isinstance(e, LCDResponseError)
+                and getattr(e.response, "status", None) == _TX_NOT_FOUND_STATUS
+            ):
                 return {
                     "hash": tx_hash,
                     "status": "not_found",
@@ -537,3 +687,123 @@ class GetTransactionStatusTool(BaseTool):
                     "Try again later",
                 ],
             )
+
+
+class GetTransactionsBulkTool(BaseTool):
+    """Get transactions in bulk.
+
+    Query many transactions by hash concurrently.
+    """
+
+    REQUIRED = frozenset({"hashes"})
+    PARAMS_EXAMPLE = _HASHES_EXAMPLE
+
+    @property
+    def name(self) -> str:
+        return "get_transactions"
+
+    @property
+    def description(self) -> str:
+        return (
+            f"Get details for up to {TX_BULK_MAX_HASHES} transactions by hash at once. "
+            "Queries run concurrently; failed lookups are reported per hash."
+        )
+
+    @property
+    def category(self) -> ToolCategory:
+        return ToolCategory.TRANSACTIONS
+
+    @property
+    def requires_wallet(self) -> bool:
+        return False  # Read-only query
+
+    def validate_params(self, params: Dict[str, Any]) -> None:
+        """Validate get transactions parameters.
+
+        Args:
+            params: Must contain 'hashes', a list of transaction hashes
+
+        Raises:
+            ValidationError: If parameters are invalid
+        """
+        self._check_required_params(params)
+
+        hashes = params["hashes"]
+        if not isinstance(hashes, list) or not 1 <= len(hashes) <= TX_BULK_MAX_HASHES:
+            raise ValidationError(
+                message=f"Hashes must be a list of 1 to {TX_BULK_MAX_HASHES} transaction hashes",
+                details={
+                    "provided_type": type(hashes).__name__,
+                    "max": TX_BULK_MAX_HASHES,
+                },
+                suggestions=[
+                    f"Provide between 1 and {TX_BULK_MAX_HASHES} hashes",
+                    f"Example: {_HASHES_EXAMPLE}",
+                ],
+            )
+
+        invalid = [
+            index
+            for index, tx_hash in enumerate(hashes)
+            if not isinstance(tx_hash, str) or not tx_hash
+        ]
+        if invalid:
+            raise ValidationError(
+                message=f"Invalid hash at index(es) {invalid}",
+                details={"invalid_indices": invalid},
+                suggestions=list(_INVALID_HASH_SUGGESTIONS),
+            )
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute get transactions.
+
+        At most BULK_QUERY_CONCURRENCY queries are in flight at once on the
+        shared async read client; cached transactions skip the LCD.
+
+        Args:
+            params: Parameters including hashes
+
+        Returns:
+            Transactions and errors, each keyed by hash
+        """
+        # Query each distinct hash once, in request order
+        hashes = list(dict.fromkeys(params["hashes"]))
+        client_pool = self.context.client_pool
+        network = self.context.network_name
+        semaphore = asyncio.Semaphore(BULK_QUERY_CONCURRENCY)
+
+        async def query_one(tx_hash: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await _get_tx(client_pool, network, tx_hash)
+
+        results = await asyncio.gather(
+            *(query_one(tx_hash) for tx_hash in hashes),
+            return_exceptions=True,
+        )
+
+        transactions: Dict[str, Any] = {}
+        errors: Dict[str, str] = {}
+        for tx_hash, result in zip(hashes, results):
+            if isinstance(result, BaseException):
+                errors[tx_hash] = str(result)
+            else:
+                transactions[tx_hash] = result.get("tx_response", {})
+
+        if not transactions:
+            raise NetworkError(
+                message=f"Failed to get transactions: {errors[hashes[0]]}",
+                details={"hashes_count": len(hashes), "errors": errors},
+                suggestions=[
+                    "Check that the transaction hashes are correct",
+                    "Verify network connectivity",
+                    "Try again later",
+                ],
+            )
+
+        return {
+            "transactions": transactions,
+            "errors": errors,
+            "count": len(transactions),
+            "failed": len(errors),
+            "message": f"Retrieved {len(transactions)} of {len(hashes)} transaction(s)",
+        }
@@ -22,6 +22,8 @@ class SecretMCPError(Exception):
         suggestions: List of suggested actions to resolve the error
     """
 
+    __slots__ = ("message", "code", "details", "suggestions")
+
     def __init__(
         self,
         message: str,
@@ -64,6 +66,8 @@ class NetworkError(SecretMCPError):
     timeouts, and HTTP errors when communicating with the blockchain.
     """
 
+    __slots__ = ()
+
     def __init__(self, message: str, **kwargs: Any) -> None:
         """Initialize NetworkError.
 
@@ -81,6 +85,8 @@ class ValidationError(SecretMCPError):
     such as invalid addresses, amounts, or other parameters.
     """
 
+    __slots__ = ()
+
     def __init__(self, message: str, **kwargs: Any) -> None:
         """Initialize ValidationError.
 
@@ -98,6 +104,8 @@ class SecurityError(SecretMCPError):
     spending limit violations, rate limiting, and other security checks.
     """
 
+    __slots__ = ()
+
     def __init__(self, message: str, **kwargs: Any) -> None:
         """Initialize SecurityError.
 
@@ -115,6 +123,8 @@ class AuthenticationError(SecretMCPError):
     or when authorization checks fail.
     """
 
+    __slots__ = ()
+
     def __init__(self, message: str, **kwargs: Any) -> None:
         """Initialize AuthenticationError.
 
@@ -132,6 +142,8 @@ class WalletError(SecretMCPError):
     import, key management, or wallet not found errors.
     """
 
+    __slots__ = ()
+
     def __init__(self, message: str, **kwargs: Any) -> None:
         """Initialize WalletError.
 
@@ -149,6 +161,8 @@ class TransactionError(SecretMCPError):
     signing, broadcasting, or executing transactions.
     """
 
+    __slots__ = ()
+
     def __init__(self, message: str, **kwargs: Any) -> None:
         """Initialize TransactionError.
 
@@ -169,6 +183,8 @@ class InsufficientFundsError(TransactionError):
     for resolving insufficient funds issues.
     """
 
+    __slots__ = ()
+
     def __init__(self, required: int, available: int, **kwargs: Any) -> None:
         """Initialize InsufficientFundsError.
 
@@ -205,6 +221,8 @@ class ContractError(SecretMCPError):
     instantiation, execution, or query errors.
     """
 
+    __slots__ = ()
+
     def __init__(self, message: str, **kwargs: Any) -> None:
         """Initialize ContractError.
 
@@ -222,6 +240,8 @@ class CacheError(SecretMCPError):
     invalidation errors, or cache corruption.
     """
 
+    __slots__ = ()
+
     def __init__(self, message: str, **kwargs: Any) -> None:
         """Initialize CacheError.
 
@@ -239,6 +259,8 @@ class ConfigurationError(SecretMCPError):
     including environment variables, settings files, or runtime configuration.
     """
 
+    __slots__ = ()
+
     def __init__(self, message: str, **kwargs: Any) -> None:
         """Initialize ConfigurationError.
 
@@ -10,8 +10,9 @@ Tests the complete end-to-end contract workflow including:
 
 import pytest
 import base64
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, PropertyMock
 
+from mcp_scrt.sdk.client import ClientPool
 from mcp_scrt.tools.wallet import ImportWalletTool
 from mcp_scrt.tools.contract import (
     UploadContractTool,
@@ -80,7 +81,9 @@ class TestContractWorkflow:
         # Step 3: Get code info
         code_info_tool = GetCodeInfoTool(tool_context)
 
-        with patch.object(tool_context.client_pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_lcd_client.wasm.code_info = AsyncMock(
                 return_value={
                     "code_id": code_id,
@@ -88,7 +91,7 @@ class TestContractWorkflow:
                     "code_hash": "abc123def456",
                 }
             )
-            mock_get_client.return_value.__enter__.return_value = mock_lcd_client
+            mock_read_client.return_value = mock_lcd_client
 
             code_info_result = await code_info_tool.run({
                 "code_id": code_id
@@ -119,7 +122,9 @@ class TestContractWorkflow:
         # Step 5: Get contract info
         contract_info_tool = GetContractInfoTool(tool_context)
 
-        with patch.object(tool_context.client_pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_lcd_client.wasm.contract_info = AsyncMock(
                 return_value={
                     "address": contract_address,
@@ -128,7 +133,7 @@ class TestContractWorkflow:
                     "label": contract_label,
                 }
             )
-            mock_get_client.return_value.__enter__.return_value = mock_lcd_client
+            mock_read_client.return_value = mock_lcd_client
 
             contract_info_result = await contract_info_tool.run({
                 "contract_address": contract_address
@@ -159,11 +164,13 @@ class TestContractWorkflow:
 
         query_msg = {"get_count": {}}
 
-        with patch.object(tool_context.client_pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_lcd_client.wasm.contract_query = AsyncMock(
                 return_value={"count": 1}  # After increment
             )
-            mock_get_client.return_value.__enter__.return_value = mock_lcd_client
+            mock_read_client.return_value = mock_lcd_client
 
             query_result = await query_tool.run({
                 "contract_address": contract_address,
@@ -335,11 +342,13 @@ class TestContractWorkflow:
         contract_address = "secret1contractcontractcontractcontractcontra"
         query_msg = {"public_data": {}}
 
-        with patch.object(tool_context.client_pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_lcd_client.wasm.contract_query = AsyncMock(
                 return_value={"data": "public_value"}
             )
-            mock_get_client.return_value.__enter__.return_value = mock_lcd_client
+            mock_read_client.return_value = mock_lcd_client
 
             query_result = await query_tool.run({
                 "contract_address": contract_address,
@@ -383,11 +392,13 @@ class TestContractWorkflow:
             })
 
         # Query: Get value
-        with patch.object(tool_context.client_pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_lcd_client.wasm.contract_query = AsyncMock(
                 return_value={"value": 100}
             )
-            mock_get_client.return_value.__enter__.return_value = mock_lcd_client
+            mock_read_client.return_value = mock_lcd_client
 
             query_result = await query_tool.run({
                 "contract_address": contract_address,
@@ -407,11 +418,13 @@ class TestContractWorkflow:
             })
 
         # Query: Verify new value
-        with patch.object(tool_context.client_pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_lcd_client.wasm.contract_query = AsyncMock(
                 return_value={"value": 150}
             )
-            mock_get_client.return_value.__enter__.return_value = mock_lcd_client
+            mock_read_client.return_value = mock_lcd_client
 
             query_result = await query_tool.run({
                 "contract_address": contract_address,
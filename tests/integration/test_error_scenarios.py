@@ -9,8 +9,9 @@ Tests various error conditions and verifies proper error messages and handling:
 """
 
 import pytest
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, PropertyMock
 
+from mcp_scrt.sdk.client import ClientPool
 from mcp_scrt.tools.wallet import ImportWalletTool
 from mcp_scrt.tools.bank import SendTokensTool, GetBalanceTool
 from mcp_scrt.tools.staking import DelegateTool
@@ -188,8 +189,10 @@ class TestErrorScenarios:
             side_effect=Exception("Query failed: contract not found")
         )
 
-        with patch.object(tool_context.client_pool, "get_client") as mock_get_client:
-            mock_get_client.return_value.__enter__.return_value = mock_lcd_client
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_read_client.return_value = mock_lcd_client
 
             result = await query_tool.run({
                 "contract_address": "secret1contractcontractcontractcontractcontra",
@@ -1,7 +1,7 @@
 """Unit tests for client pool management."""
 
 import time
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
@@ -44,7 +44,7 @@ class TestClientPoolCreation:
 class TestClientAcquisition:
     """Test acquiring clients from the pool."""
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_get_client(self, mock_lcd_client: Mock) -> None:
         """Test getting a client from pool."""
         pool = ClientPool(network=NetworkType.TESTNET)
@@ -52,7 +52,7 @@ class TestClientAcquisition:
         with pool.get_client() as client:
             assert client is not None
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_client_returned_to_pool(self, mock_lcd_client: Mock) -> None:
         """Test that client is returned to pool after use."""
         pool = ClientPool(network=NetworkType.TESTNET, max_connections=2)
@@ -67,7 +67,7 @@ class TestClientAcquisition:
         assert stats["in_use_connections"] == 0
         assert stats["available_connections"] == 1
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_reuse_client_from_pool(self, mock_lcd_client: Mock) -> None:
         """Test that clients are reused from pool."""
         pool = ClientPool(network=NetworkType.TESTNET)
@@ -83,7 +83,7 @@ class TestClientAcquisition:
         # Should reuse the same client
         assert client1_id == client2_id
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_multiple_clients(self, mock_lcd_client: Mock) -> None:
         """Test getting multiple clients simultaneously."""
         # Make mock return different instances each time
@@ -105,7 +105,7 @@ class TestClientAcquisition:
 class TestConnectionLimits:
     """Test connection limit enforcement."""
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_max_connections_enforced(self, mock_lcd_client: Mock) -> None:
         """Test that max connections limit is enforced."""
         # Make mock return different instances each time
@@ -121,7 +121,7 @@ class TestConnectionLimits:
                 # Can't create more than max
                 assert stats["total_connections"] <= 2
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_wait_for_available_client(self, mock_lcd_client: Mock) -> None:
         """Test waiting for available client when pool is full."""
         pool = ClientPool(network=NetworkType.TESTNET, max_connections=1)
@@ -136,7 +136,7 @@ class TestConnectionLimits:
 class TestPoolStatistics:
     """Test pool statistics tracking."""
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_stats_structure(self, mock_lcd_client: Mock) -> None:
         """Test stats return proper structure."""
         pool = ClientPool(network=NetworkType.TESTNET)
@@ -148,7 +148,7 @@ class TestPoolStatistics:
         assert "max_connections" in stats
         assert "requests_served" in stats
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_requests_served_increments(self, mock_lcd_client: Mock) -> None:
         """Test that requests served counter increments."""
         pool = ClientPool(network=NetworkType.TESTNET)
@@ -166,7 +166,7 @@ class TestPoolStatistics:
 class TestPoolCleanup:
     """Test pool cleanup and resource management."""
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_close_pool(self, mock_lcd_client: Mock) -> None:
         """Test closing the pool."""
         pool = ClientPool(network=NetworkType.TESTNET)
@@ -181,7 +181,23 @@ class TestPoolCleanup:
         stats = pool.get_stats()
         assert stats["total_connections"] == 0
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @pytest.mark.asyncio
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
+    async def test_aclose_pool_closes_connections(self, mock_lcd_client: Mock) -> None:
+        """Test aclose() awaits closing each client's pooled connections once."""
+        mock_lcd_client.side_effect = lambda **kwargs: MagicMock(close_connections=AsyncMock())
+        pool = ClientPool(network=NetworkType.TESTNET)
+
+        with pool.get_client() as client:
+            pass
+
+        await pool.aclose()
+        await pool.aclose()
+
+        client.close_connections.assert_awaited_once()
+        assert pool.get_stats()["total_connections"] == 0
+
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_close_empty_pool(self, mock_lcd_client: Mock) -> None:
         """Test closing empty pool."""
         pool = ClientPool(network=NetworkType.TESTNET)
@@ -192,7 +208,7 @@ class TestPoolCleanup:
         stats = pool.get_stats()
         assert stats["total_connections"] == 0
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_context_manager(self, mock_lcd_client: Mock) -> None:
         """Test pool as context manager."""
         with ClientPool(network=NetworkType.TESTNET) as pool:
@@ -205,7 +221,7 @@ class TestPoolCleanup:
 class TestErrorHandling:
     """Test error handling in client pool."""
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_client_creation_failure(self, mock_lcd_client: Mock) -> None:
         """Test handling of client creation failure."""
         # Make client creation fail
@@ -217,7 +233,7 @@ class TestErrorHandling:
             with pool.get_client():
                 pass
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_client_cleanup_on_error(self, mock_lcd_client: Mock) -> None:
         """Test that client is cleaned up on error."""
         pool = ClientPool(network=NetworkType.TESTNET)
@@ -237,7 +253,7 @@ class TestErrorHandling:
 class TestNetworkConfiguration:
     """Test network configuration handling."""
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_testnet_configuration(self, mock_lcd_client: Mock) -> None:
         """Test testnet configuration."""
         pool = ClientPool(network=NetworkType.TESTNET)
@@ -246,7 +262,7 @@ class TestNetworkConfiguration:
             # Verify LCDClient was called with testnet URL
             assert mock_lcd_client.called
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_mainnet_configuration(self, mock_lcd_client: Mock) -> None:
         """Test mainnet configuration."""
         pool = ClientPool(network=NetworkType.MAINNET)
@@ -259,7 +275,7 @@ class TestNetworkConfiguration:
 class TestThreadSafety:
     """Test thread safety of client pool."""
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_concurrent_client_access(self, mock_lcd_client: Mock) -> None:
         """Test concurrent access to client pool."""
         import threading
@@ -294,7 +310,7 @@ class TestThreadSafety:
         assert len(errors) == 0
         assert success_count[0] == 10
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_concurrent_pool_stats(self, mock_lcd_client: Mock) -> None:
         """Test getting stats concurrently."""
         import threading
@@ -318,7 +334,7 @@ class TestThreadSafety:
 class TestPoolReset:
     """Test pool reset functionality."""
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_reset_pool(self, mock_lcd_client: Mock) -> None:
         """Test resetting the pool."""
         pool = ClientPool(network=NetworkType.TESTNET)
@@ -337,7 +353,7 @@ class TestPoolReset:
         assert stats_after["total_connections"] == 0
         assert stats_after["requests_served"] == 0
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_reset_clears_stats(self, mock_lcd_client: Mock) -> None:
         """Test that reset clears statistics."""
         pool = ClientPool(network=NetworkType.TESTNET)
@@ -359,7 +375,7 @@ class TestPoolReset:
 class TestPoolHealthCheck:
     """Test health checking of clients."""
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_unhealthy_client_removed(self, mock_lcd_client: Mock) -> None:
         """Test that unhealthy clients are removed."""
         pool = ClientPool(network=NetworkType.TESTNET)
@@ -375,20 +391,20 @@ class TestPoolHealthCheck:
 class TestPoolEdgeCases:
     """Test edge cases for client pool."""
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_zero_max_connections(self, mock_lcd_client: Mock) -> None:
         """Test that pool handles zero max connections."""
         # Should raise error or use default
         with pytest.raises((ValueError, RuntimeError)):
             ClientPool(network=NetworkType.TESTNET, max_connections=0)
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_negative_max_connections(self, mock_lcd_client: Mock) -> None:
         """Test that pool handles negative max connections."""
         with pytest.raises((ValueError, RuntimeError)):
             ClientPool(network=NetworkType.TESTNET, max_connections=-1)
 
-    @patch("mcp_scrt.sdk.client.LCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
     def test_get_client_after_close(self, mock_lcd_client: Mock) -> None:
         """Test getting client after pool is closed."""
         pool = ClientPool(network=NetworkType.TESTNET)
@@ -398,3 +414,27 @@ class TestPoolEdgeCases:
         with pytest.raises(RuntimeError):
             with pool.get_client():
                 pass
+
+
+class TestReadClient:
+    """Test the shared async read-only client."""
+
+    @pytest.mark.asyncio
+    @patch("mcp_scrt.sdk.client.KeepAliveAsyncLCDClient")
+    @patch("mcp_scrt.sdk.client.KeepAliveLCDClient")
+    async def test_async_read_client(self, mock_lcd_client: Mock, mock_async_client: Mock) -> None:
+        """Test the async read client is shared, separate and closed by aclose()."""
+        mock_async_client.return_value = MagicMock(close_connections=AsyncMock())
+        pool = ClientPool(network=NetworkType.TESTNET)
+
+        client = pool.async_read_client
+
+        assert pool.async_read_client is client
+        assert mock_async_client.call_count == 1
+        mock_lcd_client.assert_not_called()
+
+        await pool.aclose()
+
+        client.close_connections.assert_awaited_once()
+        with pytest.raises(RuntimeError):
+            pool.async_read_client
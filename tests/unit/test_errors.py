@@ -62,6 +62,16 @@ class TestSecretMCPError:
         assert error_dict["details"] == {"field": "value"}
         assert error_dict["suggestions"] == ["Suggestion 1", "Suggestion 2"]
 
+    def test_error_fields_use_slots(self) -> None:
+        """Test error fields are stored in slots, not an instance dict."""
+        for error in (
+            SecretMCPError("Test error", details={"field": "value"}),
+            ValidationError("Invalid", suggestions=["Fix it"]),
+            InsufficientFundsError(required=2, available=1),
+        ):
+            assert error.__dict__ == {}
+            assert error.to_dict()["message"] == error.message
+
 
 class TestNetworkError:
     """Test NetworkError exception."""
@@ -0,0 +1,74 @@
+"""Unit tests for in-flight query coalescing."""
+
+import asyncio
+
+import pytest
+
+from mcp_scrt.tools._inflight import _INFLIGHT, single_flight
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent identical queries."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_query(self) -> None:
+        """Test concurrent callers with the same key run the query once."""
+        calls = 0
+
+        async def query():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"calls": calls}
+
+        results = await asyncio.gather(
+            *(single_flight("node_info:testnet", query) for _ in range(5))
+        )
+
+        assert calls == 1
+        assert results == [{"calls": 1}] * 5
+        assert "node_info:testnet" not in _INFLIGHT
+
+    @pytest.mark.asyncio
+    async def test_failure_shared_and_key_released(self) -> None:
+        """Test a failed query raises for every waiter and is retried afterwards."""
+
+        async def failing_query():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("connection refused")
+
+        results = await asyncio.gather(
+            single_flight("ibc_channel:testnet", failing_query),
+            single_flight("ibc_channel:testnet", failing_query),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert "ibc_channel:testnet" not in _INFLIGHT
+
+        async def query():
+            return "ok"
+
+        assert await single_flight("ibc_channel:testnet", query) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_waiter_takes_over_when_leader_cancelled(self) -> None:
+        """Test cancelling the running caller makes a waiter rerun the query."""
+        calls = 0
+
+        async def query():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        leader = asyncio.create_task(single_flight("validators:testnet", query))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(single_flight("validators:testnet", query))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        assert await follower == 2
+        assert leader.cancelled()
+        assert "validators:testnet" not in _INFLIGHT
@@ -0,0 +1,54 @@
+"""Unit tests for the account sequence cache."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from mcp_scrt.constants import TX_CODE_WRONG_SEQUENCE
+from mcp_scrt.core.nonce_cache import NonceCache
+
+
+class TestNonceCache:
+    """Test account sequence caching."""
+
+    @pytest.mark.asyncio
+    async def test_sequence_fetched_once(self) -> None:
+        """Test the sequence is fetched once and then advanced locally."""
+        cache = NonceCache()
+        fetch = AsyncMock(return_value="7")
+
+        sequences = await asyncio.gather(
+            *(cache.next_sequence("wallet", "testnet", fetch) for _ in range(3))
+        )
+
+        assert sorted(sequences) == [7, 8, 9]
+        assert fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_rejected_tx_resyncs(self) -> None:
+        """Test a rejected or failed transaction drops the cached sequence."""
+        cache = NonceCache()
+        fetch = AsyncMock(return_value=3)
+
+        await cache.submit("wallet", "testnet", fetch, AsyncMock(return_value={"code": 5}))
+        with pytest.raises(RuntimeError):
+            await cache.submit(
+                "wallet", "testnet", fetch, AsyncMock(side_effect=RuntimeError("timeout"))
+            )
+
+        assert await cache.next_sequence("wallet", "testnet", fetch) == 3
+        assert fetch.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_wrong_sequence_retried_once(self) -> None:
+        """Test a sequence mismatch is retried once with a fresh sequence."""
+        cache = NonceCache()
+        fetch = AsyncMock(side_effect=[1, 4])
+        send = AsyncMock(side_effect=[{"code": TX_CODE_WRONG_SEQUENCE}, {"code": 0}])
+
+        result = await cache.submit("wallet", "testnet", fetch, send)
+
+        assert result == {"code": 0}
+        assert [call.args[0] for call in send.await_args_list] == [1, 4]
+        assert await cache.next_sequence("wallet", "testnet", fetch) == 5
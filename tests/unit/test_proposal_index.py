@@ -0,0 +1,96 @@
+"""Unit tests for the finalized-proposal index."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from mcp_scrt.core.proposal_index import ProposalIndex
+from mcp_scrt.utils.errors import ValidationError
+
+
+def _page(*proposal_ids, status="PROPOSAL_STATUS_PASSED", next_key=None):
+    """Build an LCD proposals page."""
+    return {
+        "proposals": [{"proposal_id": str(pid), "status": status} for pid in proposal_ids],
+        "pagination": {"next_key": next_key},
+    }
+
+
+def _fetcher(pages):
+    """Build a page fetcher serving passed proposals from a list of pages."""
+    passed = iter(pages)
+
+    async def fetch_page(status, pagination_key):
+        if status != "PROPOSAL_STATUS_PASSED":
+            return _page()
+        return next(passed)
+
+    return AsyncMock(side_effect=fetch_page)
+
+
+class TestProposalIndex:
+    """Test finalized-proposal indexing."""
+
+    def test_only_finalized_proposals_indexed(self) -> None:
+        """Test open proposals are never indexed."""
+        index = ProposalIndex()
+
+        assert index.add({"proposal_id": "1", "status": "PROPOSAL_STATUS_PASSED"}) is True
+        assert index.add({"proposal_id": "1", "status": "PROPOSAL_STATUS_PASSED"}) is False
+        assert index.add({"proposal_id": "2", "status": "PROPOSAL_STATUS_VOTING_PERIOD"}) is False
+
+        assert index.get("1")["status"] == "PROPOSAL_STATUS_PASSED"
+        assert index.get(2) is None
+        assert index.ready is False
+
+    @pytest.mark.asyncio
+    async def test_refresh_stops_at_known_proposals(self) -> None:
+        """Test the first sync pages through everything and later ones stop early."""
+        index = ProposalIndex()
+        fetch_page = _fetcher(
+            [
+                _page(3, 2, next_key="k1"),
+                _page(1),
+                _page(5, 4, next_key="k2"),
+                _page(3, 2, next_key="k3"),
+            ]
+        )
+
+        await index.refresh(fetch_page)
+        assert index.ready is True
+        assert [p["proposal_id"] for p in index.page("PROPOSAL_STATUS_PASSED", 10)[0]] == [
+            "1",
+            "2",
+            "3",
+        ]
+
+        await index.refresh(fetch_page)
+        _, _, total = index.page("PROPOSAL_STATUS_PASSED", 10)
+        assert total == 5
+        # Each refresh read two passed pages and one page per other status;
+        # the second stopped at the page holding already indexed proposals
+        assert fetch_page.await_count == 8
+
+    def test_page_keys(self) -> None:
+        """Test paging through indexed proposals with index keys."""
+        index = ProposalIndex()
+        for proposal_id in range(1, 6):
+            index.add({"proposal_id": str(proposal_id), "status": "PROPOSAL_STATUS_REJECTED"})
+
+        first, next_key, total = index.page("PROPOSAL_STATUS_REJECTED", 3)
+        rest, last_key, _ = index.page("PROPOSAL_STATUS_REJECTED", 3, next_key)
+
+        assert total == 5
+        assert ProposalIndex.owns_key(next_key) is True
+        assert ProposalIndex.owns_key("AAAAAAAAAAE=") is False
+        assert [p["proposal_id"] for p in first + rest] == ["1", "2", "3", "4", "5"]
+        assert last_key is None
+
+    @pytest.mark.parametrize("pagination_key", ["index:abc", "index:", "index:-1", "index:1.5"])
+    def test_page_rejects_malformed_keys(self, pagination_key) -> None:
+        """Test malformed index keys raise ValidationError instead of ValueError."""
+        index = ProposalIndex()
+        index.add({"proposal_id": "1", "status": "PROPOSAL_STATUS_PASSED"})
+
+        with pytest.raises(ValidationError):
+            index.page("PROPOSAL_STATUS_PASSED", 10, pagination_key)
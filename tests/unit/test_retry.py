@@ -0,0 +1,50 @@
+"""Unit tests for transient-failure retries."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from secret_sdk.exceptions import LCDResponseError
+
+from mcp_scrt.tools._retry import with_retries
+
+
+def _lcd_error(status, headers=None):
+    """Build an LCD error response with a status code."""
+    return LCDResponseError(message="error", response=Mock(status=status, headers=headers or {}))
+
+
+class TestWithRetries:
+    """Test retrying transient LCD query failures."""
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_retried(self) -> None:
+        """Test rate limiting and dropped connections are retried until success."""
+        query = AsyncMock(side_effect=[_lcd_error(429), ConnectionResetError(), "ok"])
+
+        with patch("mcp_scrt.tools._retry.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            assert await with_retries(query) == "ok"
+
+        assert query.await_count == 3
+        assert mock_sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_client_error_not_retried(self) -> None:
+        """Test a 4xx response other than 429 fails at once."""
+        query = AsyncMock(side_effect=_lcd_error(400))
+
+        with pytest.raises(LCDResponseError):
+            await with_retries(query)
+
+        assert query.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_after_honoured_and_attempts_bounded(self) -> None:
+        """Test Retry-After sets the delay and the last failure is raised."""
+        query = AsyncMock(side_effect=_lcd_error(503, {"Retry-After": "1.5"}))
+
+        with patch("mcp_scrt.tools._retry.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            with pytest.raises(LCDResponseError):
+                await with_retries(query, max_attempts=2)
+
+        assert query.await_count == 2
+        mock_sleep.assert_awaited_once_with(1.5)
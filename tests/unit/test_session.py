@@ -104,6 +104,7 @@ class TestWalletManagement:
 
         assert session.has_wallet() is True
         assert session.get_wallet() == wallet
+        assert session.current_wallet is wallet
 
     def test_load_wallet_inactive_session(self) -> None:
         """Test loading wallet in inactive session."""
@@ -133,6 +134,7 @@ class TestWalletManagement:
 
         assert session.has_wallet() is False
         assert session.get_wallet() is None
+        assert session.current_wallet is None
 
     def test_unload_when_no_wallet(self) -> None:
         """Test unloading when no wallet is loaded."""
@@ -0,0 +1,60 @@
+"""Unit tests for the signing client pool."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from mcp_scrt.sdk.signing_pool import SigningClientPool
+
+
+class TestSigningClientPool:
+    """Test signing client caching."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused(self) -> None:
+        """Test that a client is created once per wallet and network."""
+        pool = SigningClientPool()
+        factory = AsyncMock(side_effect=lambda wallet, network: object())
+
+        first = await pool.get("wallet", "testnet", factory)
+        second = await pool.get("wallet", "testnet", factory)
+        other_network = await pool.get("wallet", "mainnet", factory)
+
+        assert first is second
+        assert other_network is not first
+        assert factory.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self) -> None:
+        """Test that the least recently used client is evicted."""
+        pool = SigningClientPool(max_size=2)
+        factory = AsyncMock(side_effect=lambda wallet, network: object())
+
+        a = await pool.get("a", "testnet", factory)
+        await pool.get("b", "testnet", factory)
+        await pool.get("a", "testnet", factory)  # "a" is now most recent
+        await pool.get("c", "testnet", factory)  # evicts "b"
+
+        assert pool.get_stats()["cached_clients"] == 2
+        assert await pool.get("a", "testnet", factory) is a
+        await pool.get("b", "testnet", factory)
+        assert factory.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_invalidate_on_error(self) -> None:
+        """Test that a failing call drops the cached client."""
+        pool = SigningClientPool()
+        factory = AsyncMock(side_effect=lambda wallet, network: object())
+
+        first = await pool.get("wallet", "testnet", factory)
+
+        with pytest.raises(RuntimeError):
+            with pool.invalidate_on_error("wallet", "testnet"):
+                raise RuntimeError("broadcast failed")
+
+        assert await pool.get("wallet", "testnet", factory) is not first
+
+    def test_invalid_max_size(self) -> None:
+        """Test that a non-positive size is rejected."""
+        with pytest.raises(ValueError):
+            SigningClientPool(max_size=0)
@@ -7,11 +7,11 @@ import pytest
 from typing import Any, Dict, Optional
 from unittest.mock import Mock, patch
 
-from mcp_scrt.tools.base import BaseTool, ToolCategory, ToolExecutionContext
+from mcp_scrt.tools.base import BaseTool, ToolCategory, ToolExecutionContext, network_error
 from mcp_scrt.core.session import Session
 from mcp_scrt.sdk.client import ClientPool
 from mcp_scrt.types import NetworkType
-from mcp_scrt.utils.errors import ValidationError, SecretMCPError
+from mcp_scrt.utils.errors import NetworkError, ValidationError, SecretMCPError, WalletError
 
 
 class TestToolCategory:
@@ -55,6 +55,8 @@ class TestToolExecutionContext:
         assert context.session == session
         assert context.client_pool == pool
         assert context.network == NetworkType.TESTNET
+        assert context.network_name == "testnet"
+        assert context.network_config.chain_id == "pulsar-3"
 
     def test_context_with_metadata(self) -> None:
         """Test context with additional metadata."""
@@ -375,6 +377,235 @@ class TestBaseTool:
         assert result["success"] is True
         assert result["data"]["pool_available"] is True
 
+    def test_check_required_params_reports_all_missing(self) -> None:
+        """Test required parameter check reports every missing key at once."""
+
+        class RequiredTool(BaseTool):
+            """Tool with required parameters."""
+
+            REQUIRED = frozenset({"alpha", "beta", "gamma"})
+            PARAMS_EXAMPLE = "{'alpha': 1, 'beta': 2, 'gamma': 3}"
+
+            @property
+            def name(self) -> str:
+                return "required_tool"
+
+            @property
+            def description(self) -> str:
+                return "A tool with required parameters"
+
+            @property
+            def category(self) -> ToolCategory:
+                return ToolCategory.NETWORK
+
+            @property
+            def requires_wallet(self) -> bool:
+                return False
+
+            def validate_params(self, params: Dict[str, Any]) -> None:
+                """Validate parameters."""
+                self._check_required_params(params)
+
+            async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+                """Execute the tool."""
+                return {}
+
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = RequiredTool(context)
+
+        # All present passes
+        tool.validate_params({"alpha": 1, "beta": 2, "gamma": 3})
+
+        with pytest.raises(ValidationError) as exc_info:
+            tool.validate_params({"beta": 2})
+
+        error = exc_info.value
+        assert error.message == "Missing required parameters: alpha, gamma"
+        assert error.details["missing_params"] == ["alpha", "gamma"]
+        assert error.details["required_params"] == ["alpha", "beta", "gamma"]
+        assert error.suggestions[-1] == "Example: {'alpha': 1, 'beta': 2, 'gamma': 3}"
+
+    def test_check_unknown_params(self) -> None:
+        """Test unknown parameter check rejects keys outside ALLOWED."""
+
+        class AllowedTool(BaseTool):
+            """Tool with a fixed set of parameters."""
+
+            ALLOWED = frozenset({"alpha"})
+
+            @property
+            def name(self) -> str:
+                return "allowed_tool"
+
+            @property
+            def description(self) -> str:
+                return "A tool with a fixed set of parameters"
+
+            @property
+            def category(self) -> ToolCategory:
+                return ToolCategory.NETWORK
+
+            @property
+            def requires_wallet(self) -> bool:
+                return False
+
+            def validate_params(self, params: Dict[str, Any]) -> None:
+                """Validate parameters."""
+                self._check_unknown_params(params)
+
+            async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+                """Execute the tool."""
+                return {}
+
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = AllowedTool(context)
+
+        # Allowed and absent parameters pass
+        tool.validate_params({"alpha": 1})
+        tool.validate_params({})
+
+        with pytest.raises(ValidationError) as exc_info:
+            tool.validate_params({"alpha": 1, "alhpa": 2})
+
+        error = exc_info.value
+        assert error.message == "Unknown parameter: alhpa"
+        assert error.details["unknown_params"] == ["alhpa"]
+        assert error.details["allowed_params"] == ["alpha"]
+
+    @pytest.mark.asyncio
+    async def test_with_message_respects_verbosity(self) -> None:
+        """Test response messages are built from templates only when verbose."""
+
+        class MessageTool(BaseTool):
+            """Tool that returns a templated message."""
+
+            @property
+            def name(self) -> str:
+                return "message_tool"
+
+            @property
+            def description(self) -> str:
+                return "A tool with a response message"
+
+            @property
+            def category(self) -> ToolCategory:
+                return ToolCategory.NETWORK
+
+            @property
+            def requires_wallet(self) -> bool:
+                return False
+
+            def validate_params(self, params: Dict[str, Any]) -> None:
+                """Validate parameters."""
+                pass
+
+            async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+                """Execute the tool."""
+                return self._with_message({"code_id": 7}, "Code {code_id} retrieved")
+
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+
+        verbose = MessageTool(
+            ToolExecutionContext(session=session, client_pool=pool, network=NetworkType.TESTNET)
+        )
+        result = await verbose.run({})
+        assert result["data"] == {"code_id": 7, "message": "Code 7 retrieved"}
+
+        quiet = MessageTool(
+            ToolExecutionContext(
+                session=session,
+                client_pool=pool,
+                network=NetworkType.TESTNET,
+                verbose_messages=False,
+            )
+        )
+        result = await quiet.run({})
+        assert result["data"] == {"code_id": 7}
+
+
+class TestNetworkErrorDecorator:
+    """Test the network_error execute decorator."""
+
+    def _make_tool(self, exc: Exception) -> BaseTool:
+        class FailingTool(BaseTool):
+            """Tool whose execute always raises."""
+
+            @property
+            def name(self) -> str:
+                return "failing_tool"
+
+            @property
+            def description(self) -> str:
+                return "A failing tool"
+
+            @property
+            def category(self) -> ToolCategory:
+                return ToolCategory.NETWORK
+
+            @property
+            def requires_wallet(self) -> bool:
+                return False
+
+            def validate_params(self, params: Dict[str, Any]) -> None:
+                """Validate parameters."""
+                pass
+
+            @network_error(
+                "do something",
+                details_from=("address",),
+                suggestions=["Verify network connectivity"],
+            )
+            async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+                """Execute the tool."""
+                address = params["address"]
+                raise exc
+
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+        return FailingTool(context)
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_becomes_network_error(self) -> None:
+        """Test generic exceptions are translated with captured locals."""
+        tool = self._make_tool(RuntimeError("connection reset"))
+
+        with pytest.raises(NetworkError) as exc_info:
+            await tool.execute({"address": "secret1abc"})
+
+        error = exc_info.value
+        assert error.message == "Failed to do something: connection reset"
+        assert error.details == {"address": "secret1abc", "error": "connection reset"}
+        assert error.suggestions == ["Verify network connectivity"]
+        assert isinstance(error.__cause__, RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_secret_mcp_errors_propagate_unchanged(self) -> None:
+        """Test domain errors are not rewrapped."""
+        tool = self._make_tool(WalletError("No active wallet set"))
+
+        with pytest.raises(WalletError):
+            await tool.execute({"address": "secret1abc"})
+
 
 class TestToolRegistry:
     """Test tool registry patterns."""
@@ -3,9 +3,11 @@
 This module tests the contract tools for WASM contract operations.
 """
 
+import json
+
 import pytest
 from typing import Any, Dict
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, PropertyMock, patch, AsyncMock
 import base64
 
 from mcp_scrt.tools.contract import (
@@ -19,6 +21,7 @@ from mcp_scrt.tools.contract import (
     GetContractInfoTool,
     GetContractHistoryTool,
     MigrateContractTool,
+    _serialize_msg,
 )
 from mcp_scrt.tools.base import ToolCategory, ToolExecutionContext
 from mcp_scrt.core.session import Session
@@ -107,6 +110,48 @@ class TestUploadContractTool:
             assert result["success"] is True
             assert "code_id" in result["data"]
 
+            # Decoded bytes are handed over as a zero-copy view
+            uploaded = mock_signing.upload.call_args.kwargs["wasm_byte_code"]
+            assert isinstance(uploaded, memoryview)
+            assert bytes(uploaded) == b"fake_wasm_code"
+
+    @pytest.mark.asyncio
+    async def test_execute_upload_large_contract(self) -> None:
+        """Test uploading a contract large enough to decode in a thread."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        session.start()
+        wallet = WalletInfo(
+            wallet_id="test_wallet",
+            address="secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+        )
+        session.load_wallet(wallet)
+
+        tool = UploadContractTool(context)
+
+        wasm_code = b"\x00asm" * 50_000
+        wasm_bytecode = base64.b64encode(wasm_code).decode()
+
+        with patch("mcp_scrt.tools.contract.create_signing_client") as mock_create:
+            mock_signing = AsyncMock()
+            mock_signing.upload = AsyncMock(
+                return_value={"txhash": "ABC123", "code": 0, "code_id": 2}
+            )
+            mock_create.return_value = mock_signing
+
+            result = await tool.run({"wasm_byte_code": wasm_bytecode})
+
+            assert result["success"] is True
+            assert result["data"]["code_id"] == 2
+            uploaded = mock_signing.upload.call_args.kwargs["wasm_byte_code"]
+            assert bytes(uploaded) == wasm_code
+
 
 class TestGetCodeInfoTool:
     """Test get_code_info tool."""
@@ -159,7 +204,9 @@ class TestGetCodeInfoTool:
         tool = GetCodeInfoTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.wasm = Mock()
             mock_client.wasm.code = AsyncMock(
@@ -171,8 +218,7 @@ class TestGetCodeInfoTool:
                     }
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({"code_id": "1"})
 
@@ -214,7 +260,9 @@ class TestListCodesTool:
         tool = ListCodesTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.wasm = Mock()
             mock_client.wasm.codes = AsyncMock(
@@ -229,8 +277,7 @@ class TestListCodesTool:
                     "pagination": {"next_key": None, "total": "1"},
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({})
 
@@ -450,14 +497,15 @@ class TestQueryContractTool:
         tool = QueryContractTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.wasm = Mock()
             mock_client.wasm.contract_query = AsyncMock(
                 return_value={"count": 42}
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({
                 "contract_address": "secret1contractcontractcontractcontractcontra",
@@ -505,6 +553,26 @@ class TestBatchExecuteTool:
 
         assert "executions" in str(exc_info.value.message).lower()
 
+    def test_validate_params_rejects_non_bool_simulate(self) -> None:
+        """Test validation fails when simulate is not a boolean."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = BatchExecuteTool(context)
+
+        with pytest.raises(ValidationError) as exc_info:
+            tool.validate_params({
+                "executions": [{"contract_address": "secret1abc", "msg": {}}],
+                "simulate": "false",
+            })
+
+        assert "simulate" in str(exc_info.value.message).lower()
+
     @pytest.mark.asyncio
     async def test_execute_batch_execute(self) -> None:
         """Test batch executing contracts."""
@@ -547,6 +615,91 @@ class TestBatchExecuteTool:
             assert result["success"] is True
             assert "txhash" in result["data"]
 
+    @pytest.mark.asyncio
+    async def test_execute_batch_execute_with_simulation(self) -> None:
+        """Test batch execution sums simulated gas before signing."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        # Start session and load wallet
+        session.start()
+        wallet = WalletInfo(
+            wallet_id="test_wallet",
+            address="secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+        )
+        session.load_wallet(wallet)
+
+        tool = BatchExecuteTool(context)
+
+        with patch("mcp_scrt.tools.contract.create_signing_client") as mock_create:
+            mock_signing = AsyncMock()
+            mock_signing.simulate_execute = AsyncMock(return_value={"gas_used": 100000})
+            mock_signing.batch_execute = AsyncMock(
+                return_value={
+                    "txhash": "ABC123",
+                    "code": 0,
+                }
+            )
+            mock_create.return_value = mock_signing
+
+            result = await tool.run({
+                "executions": [
+                    {"contract_address": "secret1contract1contract1contract1contract1c", "msg": {"increment": {}}},
+                    {"contract_address": "secret1contract2contract2contract2contract2c", "msg": {"increment": {}}},
+                ],
+                "simulate": True,
+            })
+
+            assert result["success"] is True
+            assert result["data"]["gas_estimate"] == 200000
+            assert mock_signing.simulate_execute.await_count == 2
+            mock_signing.batch_execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_simulation_keeps_signing_client(self) -> None:
+        """Test a rejected simulation does not drop the cached signing client."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        session.start()
+        session.load_wallet(
+            WalletInfo(
+                wallet_id="test_wallet",
+                address="secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+            )
+        )
+
+        tool = BatchExecuteTool(context)
+
+        with patch("mcp_scrt.tools.contract.create_signing_client") as mock_create:
+            mock_signing = AsyncMock()
+            mock_signing.simulate_execute = AsyncMock(side_effect=RuntimeError("out of gas"))
+            mock_create.return_value = mock_signing
+
+            params = {
+                "executions": [
+                    {"contract_address": "secret1contract1contract1contract1contract1c", "msg": {}},
+                ],
+                "simulate": True,
+            }
+            first = await tool.run(params)
+            second = await tool.run(params)
+
+        assert first["success"] is False
+        assert second["success"] is False
+        mock_create.assert_awaited_once()
+        mock_signing.batch_execute.assert_not_awaited()
+
 
 class TestGetContractInfoTool:
     """Test get_contract_info tool."""
@@ -599,7 +752,9 @@ class TestGetContractInfoTool:
         tool = GetContractInfoTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.wasm = Mock()
             mock_client.wasm.contract_info = AsyncMock(
@@ -612,8 +767,7 @@ class TestGetContractInfoTool:
                     }
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({"contract_address": "secret1contractcontractcontractcontractcontra"})
 
@@ -672,7 +826,9 @@ class TestGetContractHistoryTool:
         tool = GetContractHistoryTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.wasm = Mock()
             mock_client.wasm.contract_history = AsyncMock(
@@ -687,8 +843,7 @@ class TestGetContractHistoryTool:
                     "pagination": {"next_key": None, "total": "1"},
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({"contract_address": "secret1contractcontractcontractcontractcontra"})
 
@@ -778,6 +933,33 @@ class TestMigrateContractTool:
             assert "txhash" in result["data"]
 
 
+class TestSerializeMsg:
+    """Test contract message serialization helper."""
+
+    def test_serialize_msg_returns_compact_json_bytes(self) -> None:
+        """Test messages are encoded to compact UTF-8 JSON bytes."""
+        encoded = _serialize_msg({"transfer": {"recipient": "secret1abc", "amount": "100"}})
+
+        assert isinstance(encoded, bytes)
+        assert encoded == b'{"transfer":{"recipient":"secret1abc","amount":"100"}}'
+
+    def test_serialize_msg_empty_message(self) -> None:
+        """Test an empty message serializes to an empty JSON object."""
+        assert _serialize_msg({}) == b"{}"
+
+    def test_serialize_msg_stdlib_fallback_matches(self) -> None:
+        """Test the stdlib fallback encodes non-ASCII text and int keys like orjson."""
+        msg = {"memo": "café ✓", 1: "one"}
+        expected = '{"memo":"café ✓","1":"one"}'.encode("utf-8")
+
+        assert _serialize_msg(msg) == expected
+        # json is only imported when orjson is missing
+        with patch("mcp_scrt.tools.contract.orjson", None), patch(
+            "mcp_scrt.tools.contract.json", json, create=True
+        ):
+            assert _serialize_msg(msg) == expected
+
+
 class TestContractToolsIntegration:
     """Test contract tools working together."""
 
@@ -3,9 +3,14 @@
 This module tests the governance tools for proposals, voting, and deposits.
 """
 
+import asyncio
+import threading
+
 import pytest
 from typing import Any, Dict
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, PropertyMock, patch, AsyncMock
+
+from secret_sdk.exceptions import LCDResponseError
 
 from mcp_scrt.tools.governance import (
     GetProposalsTool,
@@ -14,6 +19,9 @@ from mcp_scrt.tools.governance import (
     DepositProposalTool,
     VoteProposalTool,
     GetVoteTool,
+    GetVotesBulkTool,
+    _proposal_cache,
+    create_signing_client,
 )
 from mcp_scrt.tools.base import ToolCategory, ToolExecutionContext
 from mcp_scrt.core.session import Session
@@ -22,6 +30,14 @@ from mcp_scrt.types import NetworkType, WalletInfo
 from mcp_scrt.utils.errors import ValidationError
 
 
+@pytest.fixture(autouse=True)
+def clear_proposal_cache():
+    """Start every test with an empty proposal cache."""
+    _proposal_cache.clear()
+    yield
+    _proposal_cache.clear()
+
+
 class TestGetProposalsTool:
     """Test get_proposals tool."""
 
@@ -74,7 +90,9 @@ class TestGetProposalsTool:
         tool = GetProposalsTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.gov = Mock()
             mock_client.gov.proposals = AsyncMock(
@@ -99,8 +117,7 @@ class TestGetProposalsTool:
                     "pagination": {"next_key": None, "total": "1"},
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({})
 
@@ -108,6 +125,180 @@ class TestGetProposalsTool:
             assert "proposals" in result["data"]
             assert result["data"]["count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_execute_get_proposals_paged(self) -> None:
+        """Test proposals are fetched one capped page at a time."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = GetProposalsTool(context)
+
+        for max_items in (0, 501, True):
+            with pytest.raises(ValidationError):
+                tool.validate_params({"max_items": max_items})
+        tool.validate_params({"max_items": 500})
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.gov.proposals = AsyncMock(
+                return_value={
+                    "proposals": [{"proposal_id": "1"}, {"proposal_id": "2"}],
+                    "pagination": {"next_key": "AAE=", "total": "5"},
+                }
+            )
+            mock_read_client.return_value = mock_client
+
+            result = await tool.run({"max_items": 2, "pagination_key": "AAA="})
+
+            assert result["success"] is True
+            assert result["data"]["count"] == 2
+            assert result["data"]["next_key"] == "AAE="
+            page = mock_client.gov.proposals.call_args.kwargs["params"]
+            assert page.to_dict() == {"pagination.key": "AAA=", "pagination.limit": 2}
+
+    @pytest.mark.asyncio
+    async def test_listed_proposals_served_from_cache(self) -> None:
+        """Test get_proposal after get_proposals needs no extra request."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.gov.proposals = AsyncMock(
+                return_value={
+                    "proposals": [
+                        {"proposal_id": "5", "status": "PROPOSAL_STATUS_REJECTED"}
+                    ],
+                    "pagination": {"next_key": None, "total": "1"},
+                }
+            )
+            mock_read_client.return_value = mock_client
+
+            await GetProposalsTool(context).run({})
+            result = await GetProposalTool(context).run({"proposal_id": "5"})
+
+            assert result["success"] is True
+            assert result["data"]["proposal"]["status"] == "PROPOSAL_STATUS_REJECTED"
+            mock_client.gov.proposal.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_finalized_proposals_served_from_index(self) -> None:
+        """Test finalized-status queries are answered by a synced index."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+        await context.proposal_index.refresh(
+            AsyncMock(
+                side_effect=lambda status, key: {
+                    "proposals": [{"proposal_id": "7", "status": status}],
+                    "pagination": {"next_key": None},
+                }
+            )
+        )
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            listed = await GetProposalsTool(context).run({"status": "PROPOSAL_STATUS_FAILED"})
+            single = await GetProposalTool(context).run({"proposal_id": "7"})
+
+        assert listed["success"] is True
+        assert listed["data"]["proposals"] == [
+            {"proposal_id": "7", "status": "PROPOSAL_STATUS_FAILED"}
+        ]
+        assert listed["data"]["next_key"] is None
+        assert single["data"]["proposal"]["status"] == "PROPOSAL_STATUS_FAILED"
+        mock_read_client.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_index_pagination_keys_checked(self) -> None:
+        """Test malformed or unusable index keys are rejected before reaching the LCD."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+        tool = GetProposalsTool(context)
+
+        passed = {"status": "PROPOSAL_STATUS_PASSED", "pagination_key": "index:5"}
+
+        with pytest.raises(ValidationError):
+            tool.validate_params({**passed, "pagination_key": "index:abc"})
+        with pytest.raises(ValidationError):
+            tool.validate_params({**passed, "status": "PROPOSAL_STATUS_VOTING_PERIOD"})
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client, patch.object(context.proposal_index, "schedule_refresh"):
+            # The index has not synced, so it cannot continue its own key
+            result = await tool.run(passed)
+
+        assert result["success"] is False
+        assert "expired" in result["error"]["message"]
+        mock_read_client.return_value.gov.proposals.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_get_proposals_with_details(self) -> None:
+        """Test proposal details are fetched for every listed proposal."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = GetProposalsTool(context)
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.gov.proposals = AsyncMock(
+                return_value={
+                    "proposals": [{"proposal_id": "1"}, {"proposal_id": "2"}],
+                    "pagination": {"next_key": None, "total": "2"},
+                }
+            )
+            mock_read_client.return_value = mock_client
+            mock_client.gov.proposal = AsyncMock(
+                side_effect=lambda proposal_id: {
+                    "proposal": {
+                        "proposal_id": proposal_id,
+                        "status": "PROPOSAL_STATUS_PASSED",
+                    }
+                }
+            )
+
+            result = await tool.run({"include_details": True})
+
+            assert result["success"] is True
+            assert result["data"]["proposals"] == [
+                {"proposal_id": "1", "status": "PROPOSAL_STATUS_PASSED"},
+                {"proposal_id": "2", "status": "PROPOSAL_STATUS_PASSED"},
+            ]
+            assert mock_client.gov.proposal.await_count == 2
+
 
 class TestGetProposalTool:
     """Test get_proposal tool."""
@@ -160,7 +351,9 @@ class TestGetProposalTool:
         tool = GetProposalTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_async_read_client:
             mock_client = Mock()
             mock_client.gov = Mock()
             mock_client.gov.proposal = AsyncMock(
@@ -176,14 +369,85 @@ class TestGetProposalTool:
                     }
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_async_read_client.return_value = mock_client
 
             result = await tool.run({"proposal_id": "1"})
 
             assert result["success"] is True
             assert "proposal" in result["data"]
 
+    @pytest.mark.asyncio
+    async def test_execute_get_proposal_cached(self) -> None:
+        """Test repeated proposal queries are served from the cache."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_async_read_client:
+            mock_client = Mock()
+            mock_client.gov.proposal = AsyncMock(
+                return_value={
+                    "proposal": {
+                        "proposal_id": "2",
+                        "status": "PROPOSAL_STATUS_PASSED",
+                    }
+                }
+            )
+            mock_async_read_client.return_value = mock_client
+
+            first = await GetProposalTool(context).run({"proposal_id": "2"})
+            second = await GetProposalTool(context).run({"proposal_id": 2})
+
+            assert first["success"] is True
+            assert second["data"]["proposal"] == first["data"]["proposal"]
+            mock_client.gov.proposal.assert_awaited_once_with("2")
+
+    @pytest.mark.asyncio
+    async def test_vote_invalidates_cached_proposal(self) -> None:
+        """Test voting drops the cached proposal."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+        session.start()
+        session.load_wallet(
+            WalletInfo(
+                wallet_id="test_wallet",
+                address="secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+            )
+        )
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_async_read_client:
+            mock_client = Mock()
+            mock_client.gov.proposal = AsyncMock(
+                return_value={
+                    "proposal": {
+                        "proposal_id": "3",
+                        "status": "PROPOSAL_STATUS_VOTING_PERIOD",
+                    }
+                }
+            )
+            mock_async_read_client.return_value = mock_client
+
+            await GetProposalTool(context).run({"proposal_id": "3"})
+            await VoteProposalTool(context).run(
+                {"proposal_id": "3", "option": "VOTE_OPTION_YES"}
+            )
+            await GetProposalTool(context).run({"proposal_id": "3"})
+
+            assert mock_client.gov.proposal.call_count == 2
+
 
 class TestSubmitProposalTool:
     """Test submit_proposal tool."""
@@ -599,6 +863,27 @@ class TestGetVoteTool:
 
         assert "voter" in str(exc_info.value.message).lower()
 
+    @pytest.mark.parametrize("proposal_id", ["abc", "0", -1, True, 1.5])
+    def test_validate_params_invalid_proposal_id(self, proposal_id: Any) -> None:
+        """Test validation rejects proposal IDs that are not positive integers."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = GetVoteTool(context)
+
+        with pytest.raises(ValidationError) as exc_info:
+            tool.validate_params({
+                "proposal_id": proposal_id,
+                "voter": "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+            })
+
+        assert "proposal_id" in str(exc_info.value.message).lower()
+
     @pytest.mark.asyncio
     async def test_execute_get_vote(self) -> None:
         """Test getting a vote."""
@@ -613,7 +898,9 @@ class TestGetVoteTool:
         tool = GetVoteTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.gov = Mock()
             mock_client.gov.vote = AsyncMock(
@@ -625,8 +912,7 @@ class TestGetVoteTool:
                     }
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({
                 "proposal_id": "1",
@@ -636,6 +922,182 @@ class TestGetVoteTool:
             assert result["success"] is True
             assert "vote" in result["data"]
 
+    @pytest.mark.asyncio
+    async def test_execute_get_vote_without_message(self) -> None:
+        """Test no message is built when verbose messages are disabled."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+            verbose_messages=False,
+        )
+
+        mock_client = Mock()
+        mock_client.gov.vote = AsyncMock(
+            return_value={"vote": {"proposal_id": "1", "option": "VOTE_OPTION_YES"}}
+        )
+        with patch.object(ClientPool, "async_read_client", mock_client):
+            result = await GetVoteTool(context).run({
+                "proposal_id": "1",
+                "voter": "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+            })
+
+        assert result["success"] is True
+        assert result["data"]["vote"]["option"] == "VOTE_OPTION_YES"
+        assert "message" not in result["data"]
+
+    @pytest.mark.asyncio
+    async def test_execute_get_vote_on_event_loop(self) -> None:
+        """Test the vote query is awaited on the event loop thread."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        query_threads = []
+
+        def vote(**kwargs: Any) -> Dict[str, Any]:
+            query_threads.append(threading.get_ident())
+            return {"vote": {"option": "VOTE_OPTION_YES"}}
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.gov.vote = AsyncMock(side_effect=vote)
+            mock_read_client.return_value = mock_client
+
+            result = await GetVoteTool(context).run({
+                "proposal_id": "1",
+                "voter": "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+            })
+
+            assert result["success"] is True
+            assert query_threads == [threading.get_ident()]
+
+    @pytest.mark.asyncio
+    async def test_execute_get_vote_not_found(self) -> None:
+        """Test a missing vote is reported by LCD status, not message text."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+        params = {
+            "proposal_id": "1",
+            "voter": "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+        }
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_read_client.return_value = mock_client
+
+            mock_client.gov.vote = AsyncMock(
+                side_effect=LCDResponseError("vote not found", Mock(status=404))
+            )
+            result = await GetVoteTool(context).run(params)
+
+            assert result["success"] is True
+            assert result["data"]["vote"] is None
+
+            # A not-found message on any other error is still a failure
+            mock_client.gov.vote = AsyncMock(side_effect=Exception("route not found"))
+            result = await GetVoteTool(context).run(params)
+
+            assert result["success"] is False
+
+
+class TestGetVotesBulkTool:
+    """Test get_votes tool."""
+
+    def test_validate_params_invalid_queries(self) -> None:
+        """Test every malformed query is reported at once."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = GetVotesBulkTool(context)
+
+        with pytest.raises(ValidationError) as exc_info:
+            tool.validate_params({"queries": []})
+        assert "non-empty list" in str(exc_info.value)
+
+        with pytest.raises(ValidationError) as exc_info:
+            tool.validate_params({
+                "queries": [
+                    {"proposal_id": "1"},
+                    {"proposal_id": "2", "voter": "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03"},
+                    "not a query",
+                    {"proposal_id": "x", "voter": "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03"},
+                ]
+            })
+        assert exc_info.value.details["invalid_indices"] == [0, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_execute_get_votes(self) -> None:
+        """Test votes are returned per query, in order, with missing votes as None."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+        voter = "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03"
+
+        in_flight = 0
+        peak = 0
+
+        async def vote(proposal_id: str, voter: str) -> Dict[str, Any]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if proposal_id == "2":
+                raise LCDResponseError("vote not found", Mock(status=404))
+            if proposal_id == "3":
+                raise Exception("connection reset")
+            return {"vote": {"proposal_id": proposal_id, "option": "VOTE_OPTION_YES"}}
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client, patch("mcp_scrt.tools.governance.BULK_QUERY_CONCURRENCY", 2):
+            mock_client = Mock()
+            mock_client.gov.vote = AsyncMock(side_effect=vote)
+            mock_read_client.return_value = mock_client
+
+            result = await GetVotesBulkTool(context).run({
+                "queries": [
+                    {"proposal_id": 1, "voter": voter},
+                    {"proposal_id": "2", "voter": voter},
+                    {"proposal_id": "3", "voter": voter},
+                ]
+            })
+
+            assert result["success"] is True
+            votes = result["data"]["votes"]
+            assert [v["proposal_id"] for v in votes] == ["1", "2", "3"]
+            assert votes[0]["vote"]["option"] == "VOTE_OPTION_YES"
+            assert votes[1]["vote"] is None and "error" not in votes[1]
+            assert votes[2]["vote"] is None and "connection reset" in votes[2]["error"]
+            assert result["data"]["found"] == 1
+            assert result["data"]["failed"] == 1
+            assert peak == 2
+
 
 class TestGovernanceToolsIntegration:
     """Test governance tools working together."""
@@ -658,6 +1120,7 @@ class TestGovernanceToolsIntegration:
             DepositProposalTool(context),
             VoteProposalTool(context),
             GetVoteTool(context),
+            GetVotesBulkTool(context),
         ]
 
         # All tools should be GOVERNANCE category
@@ -676,4 +1139,16 @@ class TestGovernanceToolsIntegration:
 
         # submit_proposal, deposit_proposal, vote_proposal should require wallet
         assert len(wallet_required) == 3
-        assert len(wallet_not_required) == 3
+        assert len(wallet_not_required) == 4
+
+        # Tools are slotted, so instances carry no per-instance __dict__
+        for tool in tools:
+            assert not hasattr(tool, "__dict__")
+
+    @pytest.mark.asyncio
+    async def test_placeholder_signing_client_shared(self) -> None:
+        """Test the placeholder signing client is one shared instance."""
+        first = await create_signing_client("wallet_a", "testnet")
+        second = await create_signing_client("wallet_b", "mainnet")
+
+        assert first is second
@@ -1,7 +1,7 @@
 """Unit tests for IBC tools."""
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, PropertyMock, patch
 
 from mcp_scrt.sdk.client import ClientPool
 from mcp_scrt.utils.errors import ValidationError, WalletError
@@ -10,12 +10,26 @@ from mcp_scrt.core.session import Session
 from mcp_scrt.tools.base import ToolCategory, ToolExecutionContext
 from mcp_scrt.tools.ibc import (
     IBCTransferTool,
+    IBCTransferBatchTool,
     GetIBCChannelsTool,
     GetIBCChannelTool,
     GetIBCDenomTraceTool,
+    _denom_trace_cache,
+    _ibc_cache,
+    create_signing_client,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_ibc_caches():
+    """Start every test with empty IBC caches."""
+    _ibc_cache.clear()
+    _denom_trace_cache.clear()
+    yield
+    _ibc_cache.clear()
+    _denom_trace_cache.clear()
+
+
 class TestIBCTransferTool:
     """Test ibc_transfer tool."""
 
@@ -96,6 +110,23 @@ class TestIBCTransferTool:
 
         assert "amount" in str(exc_info.value.message).lower()
 
+    def test_validate_params_reports_all_missing(self) -> None:
+        """Test validation reports every missing parameter at once."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = IBCTransferTool(context)
+
+        with pytest.raises(ValidationError) as exc_info:
+            tool.validate_params({"channel_id": "channel-0"})
+
+        assert exc_info.value.details["missing_params"] == ["amount", "recipient"]
+
     @pytest.mark.asyncio
     async def test_execute_ibc_transfer(self) -> None:
         """Test IBC transfer."""
@@ -120,6 +151,7 @@ class TestIBCTransferTool:
         # Mock the signing client
         with patch("mcp_scrt.tools.ibc.create_signing_client") as mock_create:
             mock_signing = AsyncMock()
+            mock_signing.account_sequence = AsyncMock(return_value=7)
             mock_signing.ibc_transfer = AsyncMock(
                 return_value={
                     "txhash": "ABC123",
@@ -137,6 +169,46 @@ class TestIBCTransferTool:
             assert result["success"] is True
             assert "txhash" in result["data"]
             assert result["data"]["channel_id"] == "channel-0"
+            assert result["data"]["message"] == (
+                "Successfully transferred 1000000 uscrt to "
+                "cosmos1recipientrecipientrecipientrecipient via channel-0"
+            )
+
+    @pytest.mark.asyncio
+    async def test_execute_ibc_transfer_without_message(self) -> None:
+        """Test no message is built when verbose messages are disabled."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+            verbose_messages=False,
+        )
+
+        session.start()
+        session.load_wallet(
+            WalletInfo(
+                wallet_id="test_wallet",
+                address="secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+            )
+        )
+
+        with patch("mcp_scrt.tools.ibc.create_signing_client") as mock_create:
+            mock_signing = AsyncMock()
+            mock_signing.account_sequence = AsyncMock(return_value=7)
+            mock_signing.ibc_transfer = AsyncMock(return_value={"txhash": "ABC123"})
+            mock_create.return_value = mock_signing
+
+            result = await IBCTransferTool(context).run({
+                "channel_id": "channel-0",
+                "recipient": "cosmos1recipientrecipientrecipientrecipient",
+                "amount": "1000000",
+            })
+
+        assert result["success"] is True
+        assert result["data"]["txhash"] == "ABC123"
+        assert "message" not in result["data"]
 
     @pytest.mark.asyncio
     async def test_execute_ibc_transfer_with_timeout(self) -> None:
@@ -162,6 +234,7 @@ class TestIBCTransferTool:
         # Mock the signing client
         with patch("mcp_scrt.tools.ibc.create_signing_client") as mock_create:
             mock_signing = AsyncMock()
+            mock_signing.account_sequence = AsyncMock(return_value=7)
             mock_signing.ibc_transfer = AsyncMock(
                 return_value={
                     "txhash": "ABC123",
@@ -180,6 +253,95 @@ class TestIBCTransferTool:
 
             assert result["success"] is True
             assert "txhash" in result["data"]
+            # Only the optional fields that were set are passed on
+            transfer_kwargs = mock_signing.ibc_transfer.call_args.kwargs
+            assert transfer_kwargs["timeout_height"] == "1000"
+            assert transfer_kwargs["sequence"] == 7
+            assert "memo" not in transfer_kwargs
+
+
+class TestIBCTransferBatchTool:
+    """Test ibc_transfer_batch tool."""
+
+    def test_validate_params_reports_all_invalid_transfers(self) -> None:
+        """Test validation lists every invalid transfer at once."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = IBCTransferBatchTool(context)
+
+        with pytest.raises(ValidationError) as exc_info:
+            tool.validate_params({
+                "transfers": [
+                    {"channel_id": "channel-0", "recipient": "cosmos1abc", "amount": "1"},
+                    {"channel_id": "channel-0", "amount": "1"},
+                    "not a transfer",
+                ],
+            })
+
+        assert exc_info.value.details["invalid_indices"] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_execute_ibc_transfer_batch(self) -> None:
+        """Test all transfers are broadcast in one transaction."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        session.start()
+        wallet = WalletInfo(
+            wallet_id="test_wallet",
+            address="secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+        )
+        session.load_wallet(wallet)
+
+        tool = IBCTransferBatchTool(context)
+
+        with patch("mcp_scrt.tools.ibc.create_signing_client") as mock_create:
+            mock_signing = AsyncMock()
+            mock_signing.account_sequence = AsyncMock(return_value=7)
+            mock_signing.broadcast_tx = AsyncMock(
+                return_value={
+                    "txhash": "ABC123",
+                    "code": 0,
+                    "logs": [
+                        {"msg_index": 0, "events": [{"type": "send_packet"}]},
+                        {"msg_index": 1, "events": []},
+                    ],
+                }
+            )
+            mock_create.return_value = mock_signing
+
+            result = await tool.run({
+                "transfers": [
+                    {"channel_id": "channel-0", "recipient": "cosmos1abc", "amount": "100"},
+                    {
+                        "channel_id": "channel-1",
+                        "recipient": "osmo1abc",
+                        "amount": "200",
+                        "denom": "uatom",
+                    },
+                ],
+            })
+
+            assert result["success"] is True
+            assert result["data"]["txhash"] == "ABC123"
+            assert result["data"]["results"][0]["events"] == [{"type": "send_packet"}]
+            assert result["data"]["results"][1]["denom"] == "uatom"
+            mock_create.assert_called_once()
+            msgs = mock_signing.broadcast_tx.call_args.kwargs["msgs"]
+            assert [msg["source_channel"] for msg in msgs] == ["channel-0", "channel-1"]
+            assert msgs[0]["sender"] == wallet.address
+            assert mock_signing.broadcast_tx.call_args.kwargs["sequence"] == 7
 
 
 class TestGetIBCChannelsTool:
@@ -216,7 +378,9 @@ class TestGetIBCChannelsTool:
         tool = GetIBCChannelsTool(context)
 
         # Mock the client
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = AsyncMock()
             mock_client.ibc.channels = AsyncMock(
                 return_value={
@@ -243,7 +407,7 @@ class TestGetIBCChannelsTool:
                     "pagination": {},
                 }
             )
-            mock_get_client.return_value.__enter__.return_value = mock_client
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({})
 
@@ -265,7 +429,9 @@ class TestGetIBCChannelsTool:
         tool = GetIBCChannelsTool(context)
 
         # Mock the client
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = AsyncMock()
             mock_client.ibc.channels = AsyncMock(
                 return_value={
@@ -279,7 +445,7 @@ class TestGetIBCChannelsTool:
                     "pagination": {"next_key": "abc123"},
                 }
             )
-            mock_get_client.return_value.__enter__.return_value = mock_client
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({
                 "pagination_limit": "10",
@@ -341,7 +507,9 @@ class TestGetIBCChannelTool:
         tool = GetIBCChannelTool(context)
 
         # Mock the client
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = AsyncMock()
             mock_client.ibc.channel = AsyncMock(
                 return_value={
@@ -359,7 +527,7 @@ class TestGetIBCChannelTool:
                     },
                 }
             )
-            mock_get_client.return_value.__enter__.return_value = mock_client
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({
                 "channel_id": "channel-0",
@@ -383,7 +551,9 @@ class TestGetIBCChannelTool:
         tool = GetIBCChannelTool(context)
 
         # Mock the client
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = AsyncMock()
             mock_client.ibc.channel = AsyncMock(
                 return_value={
@@ -394,7 +564,7 @@ class TestGetIBCChannelTool:
                     },
                 }
             )
-            mock_get_client.return_value.__enter__.return_value = mock_client
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({
                 "channel_id": "channel-0",
@@ -404,6 +574,34 @@ class TestGetIBCChannelTool:
             assert result["success"] is True
             assert "channel" in result["data"]
 
+    @pytest.mark.asyncio
+    async def test_execute_get_ibc_channel_cached(self) -> None:
+        """Test repeated channel queries are served from the cache."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.ibc.channel = AsyncMock(
+                return_value={"channel": {"channel_id": "channel-0", "state": "STATE_OPEN"}}
+            )
+            mock_read_client.return_value = mock_client
+
+            first = await GetIBCChannelTool(context).run({"channel_id": "channel-0"})
+            second = await GetIBCChannelTool(context).run({"channel_id": "channel-0"})
+            await GetIBCChannelTool(context).run({"channel_id": "channel-0", "port_id": "icahost"})
+
+            assert first["success"] is True
+            assert second["data"] == first["data"]
+            assert mock_client.ibc.channel.call_count == 2
+
 
 class TestGetIBCDenomTraceTool:
     """Test get_ibc_denom_trace tool."""
@@ -456,7 +654,9 @@ class TestGetIBCDenomTraceTool:
         tool = GetIBCDenomTraceTool(context)
 
         # Mock the client
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = AsyncMock()
             mock_client.ibc.denom_trace = AsyncMock(
                 return_value={
@@ -466,7 +666,7 @@ class TestGetIBCDenomTraceTool:
                     },
                 }
             )
-            mock_get_client.return_value.__enter__.return_value = mock_client
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({
                 "hash": "27394FB092D2ECCD56123C74F36E4C1F926001CEADA9CA97EA622B25F41E5EB2",
@@ -476,6 +676,35 @@ class TestGetIBCDenomTraceTool:
             assert "denom_trace" in result["data"]
             assert result["data"]["denom_trace"]["base_denom"] == "uatom"
 
+    @pytest.mark.asyncio
+    async def test_execute_get_ibc_denom_trace_cached(self) -> None:
+        """Test a denom trace is only queried once per hash."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+        denom_hash = "27394FB092D2ECCD56123C74F36E4C1F926001CEADA9CA97EA622B25F41E5EB2"
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.ibc.denom_trace = AsyncMock(
+                return_value={
+                    "denom_trace": {"path": "transfer/channel-0", "base_denom": "uatom"},
+                }
+            )
+            mock_read_client.return_value = mock_client
+
+            await GetIBCDenomTraceTool(context).run({"hash": denom_hash})
+            result = await GetIBCDenomTraceTool(context).run({"hash": denom_hash})
+
+            assert result["data"]["path"] == "transfer/channel-0"
+            mock_client.ibc.denom_trace.assert_called_once_with(hash=denom_hash)
+
 
 class TestIBCToolsIntegration:
     """Integration tests for IBC tools."""
@@ -502,3 +731,13 @@ class TestIBCToolsIntegration:
             assert tool.description is not None
             assert tool.category == ToolCategory.IBC
             assert isinstance(tool.requires_wallet, bool)
+            # Tools are slotted, so instances carry no per-instance __dict__
+            assert not hasattr(tool, "__dict__")
+
+    @pytest.mark.asyncio
+    async def test_placeholder_signing_client_shared(self) -> None:
+        """Test the placeholder signing client is one shared instance."""
+        first = await create_signing_client("wallet_a", "testnet")
+        second = await create_signing_client("wallet_b", "mainnet")
+
+        assert first is second
@@ -3,15 +3,19 @@
 This module tests the network tools for blockchain connectivity and information.
 """
 
+import asyncio
+import time
+
 import pytest
 from typing import Any, Dict
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, PropertyMock, patch, AsyncMock
 
 from mcp_scrt.tools.network import (
     ConfigureNetworkTool,
     GetNetworkInfoTool,
     GetGasPricesTool,
     HealthCheckTool,
+    _health_cache,
 )
 from mcp_scrt.tools.base import ToolCategory, ToolExecutionContext
 from mcp_scrt.core.session import Session
@@ -20,6 +24,14 @@ from mcp_scrt.types import NetworkType
 from mcp_scrt.utils.errors import ValidationError
 
 
+@pytest.fixture(autouse=True)
+def clear_health_cache():
+    """Start every test without a cached health result."""
+    _health_cache.clear()
+    yield
+    _health_cache.clear()
+
+
 class TestConfigureNetworkTool:
     """Test configure_network tool."""
 
@@ -113,6 +125,34 @@ class TestConfigureNetworkTool:
         assert result["data"]["network"] == "mainnet"
         assert "chain_id" in result["data"]
         assert "lcd_url" in result["data"]
+        assert result["data"]["message"] == "Network configured: mainnet (secret-4)"
+
+    @pytest.mark.asyncio
+    async def test_execute_configure_network_without_message(self) -> None:
+        """Test no message is built when verbose messages are disabled."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+            verbose_messages=False,
+        )
+
+        result = await ConfigureNetworkTool(context).run({"network": "mainnet"})
+
+        assert result["success"] is True
+        assert result["data"]["chain_id"] == "secret-4"
+        assert "message" not in result["data"]
+
+        # The shared built-in response is left without a message too
+        verbose_context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+        result = await ConfigureNetworkTool(verbose_context).run({"network": "mainnet"})
+        assert result["data"]["message"] == "Network configured: mainnet (secret-4)"
 
 
 class TestGetNetworkInfoTool:
@@ -228,6 +268,25 @@ class TestGetGasPricesTool:
         assert result["data"]["denom"] == "uscrt"
         assert isinstance(result["data"]["gas_prices"], dict)
 
+    @pytest.mark.asyncio
+    async def test_execute_returns_independent_copies(self) -> None:
+        """Test changing one response does not affect later calls."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = GetGasPricesTool(context)
+
+        first = await tool.execute({})
+        first["gas_prices"]["low"] = "0uscrt"
+        second = await tool.execute({})
+
+        assert second["gas_prices"]["low"] == "0.1uscrt"
+
 
 class TestHealthCheckTool:
     """Test health_check tool."""
@@ -278,7 +337,9 @@ class TestHealthCheckTool:
         tool = HealthCheckTool(context)
 
         # Mock the client pool to return a healthy response
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.tendermint = Mock()
             mock_client.tendermint.node_info = AsyncMock(
@@ -287,8 +348,7 @@ class TestHealthCheckTool:
                     "application_version": {"version": "1.0.0"},
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({})
 
@@ -298,6 +358,29 @@ class TestHealthCheckTool:
             assert "node_connected" in result["data"]
             assert result["data"]["node_connected"] is True
 
+    @pytest.mark.asyncio
+    async def test_execute_health_check_without_message(self) -> None:
+        """Test no message is built when verbose messages are disabled."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+            verbose_messages=False,
+        )
+
+        mock_client = Mock()
+        mock_client.tendermint.node_info = AsyncMock(
+            return_value={"node_info": {"network": "pulsar-3"}}
+        )
+        with patch.object(ClientPool, "async_read_client", mock_client):
+            result = await HealthCheckTool(context).run({})
+
+        assert result["success"] is True
+        assert result["data"]["status"] == "healthy"
+        assert "message" not in result["data"]
+
     @pytest.mark.asyncio
     async def test_execute_health_check_failure(self) -> None:
         """Test health check with connection failure."""
@@ -312,14 +395,15 @@ class TestHealthCheckTool:
         tool = HealthCheckTool(context)
 
         # Mock the client pool to raise an exception
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.tendermint = Mock()
             mock_client.tendermint.node_info = AsyncMock(
                 side_effect=Exception("Connection failed")
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({})
 
@@ -328,6 +412,87 @@ class TestHealthCheckTool:
             assert result["data"]["node_connected"] is False
             assert "error" in result["data"]
 
+    @pytest.mark.asyncio
+    async def test_execute_health_check_cached(self) -> None:
+        """Test repeated health checks reuse a fresh healthy result."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.tendermint.node_info = AsyncMock(
+                return_value={"node_info": {"network": "pulsar-3"}}
+            )
+            mock_read_client.return_value = mock_client
+
+            first = await HealthCheckTool(context).run({})
+            second = await HealthCheckTool(context).run({})
+
+        assert first["data"]["status"] == "healthy"
+        assert second["data"] == first["data"]
+        mock_client.tendermint.node_info.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_execute_health_check_timeout_returns_stale(self) -> None:
+        """Test a slow node yields the last healthy result marked stale."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+        _health_cache[NetworkType.TESTNET] = (
+            time.monotonic() - 60,
+            {"status": "healthy", "node_connected": True},
+        )
+
+
+        async def slow_node_info() -> Dict[str, Any]:
+            await asyncio.sleep(0.2)
+            return {"node_info": {"network": "pulsar-3"}}
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client, patch("mcp_scrt.tools.network.HEALTH_CHECK_TIMEOUT", 0.01):
+            mock_client = Mock()
+            mock_client.tendermint.node_info = AsyncMock(side_effect=slow_node_info)
+            mock_read_client.return_value = mock_client
+
+            result = await HealthCheckTool(context).run({})
+
+        assert result["data"]["status"] == "stale"
+        assert result["data"]["node_connected"] is True
+
+    @pytest.mark.asyncio
+    async def test_execute_health_check_retries_transient_failure(self) -> None:
+        """Test one node_info query is sent and a transient failure is retried once."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+        mock_client = Mock()
+        mock_client.tendermint.node_info = AsyncMock(
+            side_effect=[ConnectionResetError(), {"node_info": {"network": "pulsar-3"}}]
+        )
+
+        with patch.object(ClientPool, "async_read_client", mock_client):
+            result = await HealthCheckTool(context).run({})
+
+        assert result["data"]["status"] == "healthy"
+        assert result["data"]["node_info"]["network"] == "pulsar-3"
+        assert "failed_connections" not in result["data"]
+        assert mock_client.tendermint.node_info.await_count == 2
 
 class TestNetworkToolsIntegration:
     """Test network tools working together."""
@@ -384,3 +549,7 @@ class TestNetworkToolsIntegration:
         # All tool names should be unique
         names = [tool.name for tool in tools]
         assert len(names) == len(set(names))
+
+        # Tools are slotted, so instances carry no per-instance __dict__
+        for tool in tools:
+            assert not hasattr(tool, "__dict__")
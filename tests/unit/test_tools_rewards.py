@@ -5,13 +5,15 @@ This module tests the rewards tools for staking rewards and distribution operati
 
 import pytest
 from typing import Any, Dict
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, PropertyMock, patch, AsyncMock
 
 from mcp_scrt.tools.rewards import (
     GetRewardsTool,
     WithdrawRewardsTool,
+    WithdrawRewardsBatchTool,
     SetWithdrawAddressTool,
     GetCommunityPoolTool,
+    _rewards_cache,
 )
 from mcp_scrt.tools.base import ToolCategory, ToolExecutionContext
 from mcp_scrt.core.session import Session
@@ -20,6 +22,14 @@ from mcp_scrt.types import NetworkType, WalletInfo
 from mcp_scrt.utils.errors import ValidationError
 
 
+@pytest.fixture(autouse=True)
+def clear_rewards_cache():
+    """Start every test with an empty rewards cache."""
+    _rewards_cache.clear()
+    yield
+    _rewards_cache.clear()
+
+
 class TestGetRewardsTool:
     """Test get_rewards tool."""
 
@@ -71,7 +81,9 @@ class TestGetRewardsTool:
         tool = GetRewardsTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.distribution = Mock()
             mock_client.distribution.rewards = AsyncMock(
@@ -89,8 +101,7 @@ class TestGetRewardsTool:
                     ],
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({"address": "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03"})
 
@@ -98,6 +109,63 @@ class TestGetRewardsTool:
             assert "rewards" in result["data"]
             assert "total" in result["data"]
 
+    @pytest.mark.asyncio
+    async def test_execute_get_rewards_cached_until_withdrawal(self) -> None:
+        """Test repeated queries reuse the response until rewards are withdrawn."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+        address = "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03"
+
+        session.start()
+        session.load_wallet(WalletInfo(wallet_id="test_wallet", address=address))
+
+        mock_client = Mock()
+        with patch.object(ClientPool, "async_read_client", mock_client), patch(
+            "mcp_scrt.tools.rewards.create_signing_client"
+        ) as mock_create:
+            mock_client.distribution.rewards = AsyncMock(
+                return_value={"rewards": [], "total": [{"denom": "uscrt", "amount": "5"}]}
+            )
+            mock_create.return_value.withdraw_delegator_reward = AsyncMock(
+                return_value={"txhash": "ABC123"}
+            )
+
+            first = await GetRewardsTool(context).run({"address": address})
+            second = await GetRewardsTool(context).run({"address": address})
+            assert mock_client.distribution.rewards.call_count == 1
+            assert second["data"] == first["data"]
+
+            await WithdrawRewardsTool(context).run({"validator_address": "secretvaloper1abc"})
+            await GetRewardsTool(context).run({"address": address})
+            assert mock_client.distribution.rewards.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_get_rewards_only_transport_errors_wrapped(self) -> None:
+        """Test connection failures become NetworkError while other bugs do not."""
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=Session(network=NetworkType.TESTNET),
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+        params = {"address": "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03"}
+        mock_client = Mock()
+
+        with patch.object(ClientPool, "async_read_client", mock_client):
+            mock_client.distribution.rewards = AsyncMock(side_effect=ConnectionResetError())
+            result = await GetRewardsTool(context).run(params)
+            assert result["error"]["code"] == "NETWORK_ERROR"
+
+            mock_client.distribution.rewards = AsyncMock(side_effect=KeyError("total"))
+            result = await GetRewardsTool(context).run(params)
+            assert result["error"]["code"] == "ERR001"
+            assert result["error"]["details"]["error_type"] == "KeyError"
+
 
 class TestWithdrawRewardsTool:
     """Test withdraw_rewards tool."""
@@ -137,6 +205,11 @@ class TestWithdrawRewardsTool:
         # Should not raise with validator_address
         tool.validate_params({"validator_address": "secretvaloper1abc"})
 
+        # A misspelt validator_address is rejected instead of withdrawing from all
+        with pytest.raises(ValidationError) as exc_info:
+            tool.validate_params({"validator_adress": "secretvaloper1abc"})
+        assert exc_info.value.details["unknown_params"] == ["validator_adress"]
+
     @pytest.mark.asyncio
     async def test_execute_withdraw_rewards_from_validator(self) -> None:
         """Test withdrawing rewards from specific validator."""
@@ -212,9 +285,8 @@ class TestWithdrawRewardsTool:
         tool = WithdrawRewardsTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
-            mock_client = Mock()
-            mock_client.distribution = Mock()
+        mock_client = Mock()
+        with patch.object(ClientPool, "async_read_client", mock_client):
             mock_client.distribution.rewards = AsyncMock(
                 return_value={
                     "rewards": [
@@ -230,9 +302,6 @@ class TestWithdrawRewardsTool:
                     "total": [{"denom": "uscrt", "amount": "3000000"}],
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
-
             # Mock the signing client
             with patch("mcp_scrt.tools.rewards.create_signing_client") as mock_create:
                 mock_signing = AsyncMock()
@@ -250,6 +319,233 @@ class TestWithdrawRewardsTool:
                 assert "txhash" in result["data"]
                 assert result["data"]["validators_count"] == 2
 
+    @pytest.mark.asyncio
+    async def test_execute_withdraw_all_only_validators_with_rewards(self) -> None:
+        """Test withdrawing from all validators skips those without rewards."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        session.start()
+        session.load_wallet(
+            WalletInfo(
+                wallet_id="test_wallet",
+                address="secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+            )
+        )
+
+        mock_client = Mock()
+        with patch.object(ClientPool, "async_read_client", mock_client), patch(
+            "mcp_scrt.tools.rewards.create_signing_client"
+        ) as mock_create, patch.object(pool, "get_client") as mock_get_client:
+            mock_client.distribution.rewards = AsyncMock(
+                return_value={
+                    "rewards": [
+                        {
+                            "validator_address": "secretvaloper1abc",
+                            "reward": [{"denom": "uscrt", "amount": "1000000"}],
+                        },
+                        {"validator_address": "secretvaloper1xyz", "reward": []},
+                    ],
+                }
+            )
+            mock_signing = AsyncMock()
+            mock_signing.account_sequence = AsyncMock(return_value=7)
+            mock_signing.withdraw_all_rewards = AsyncMock(return_value={"txhash": "ABC123"})
+            mock_create.return_value = mock_signing
+
+            result = await WithdrawRewardsTool(context).run({})
+
+        assert result["success"] is True
+        assert result["data"]["validators_count"] == 1
+        mock_client.distribution.rewards.assert_awaited_once_with(
+            "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03"
+        )
+        mock_get_client.assert_not_called()
+        mock_signing.withdraw_all_rewards.assert_awaited_once_with(
+            ["secretvaloper1abc"], sequence=7
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_withdraw_all_no_rewards_skips_signing(self) -> None:
+        """Test withdrawing with nothing to withdraw never creates a signing client."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        session.start()
+        session.load_wallet(
+            WalletInfo(
+                wallet_id="test_wallet",
+                address="secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+            )
+        )
+
+        mock_client = Mock()
+        mock_client.distribution.rewards = AsyncMock(return_value={"rewards": []})
+        with patch.object(ClientPool, "async_read_client", mock_client), patch(
+            "mcp_scrt.tools.rewards.create_signing_client"
+        ) as mock_create:
+            result = await WithdrawRewardsTool(context).run({})
+
+        assert result["success"] is True
+        assert result["data"]["validators_count"] == 0
+        mock_create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_withdraw_rewards_without_message(self) -> None:
+        """Test no message is built when verbose messages are disabled."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+            verbose_messages=False,
+        )
+
+        session.start()
+        session.load_wallet(
+            WalletInfo(
+                wallet_id="test_wallet",
+                address="secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+            )
+        )
+
+        mock_client = Mock()
+        mock_client.distribution.rewards = AsyncMock(return_value={"rewards": []})
+        with patch.object(ClientPool, "async_read_client", mock_client):
+            result = await WithdrawRewardsTool(context).run({})
+
+        assert result["success"] is True
+        assert result["data"]["validators_count"] == 0
+        assert "message" not in result["data"]
+
+
+class TestWithdrawRewardsBatchTool:
+    """Test withdraw_rewards_batch tool."""
+
+    def test_validate_params(self) -> None:
+        """Test validation requires a non-empty list of validator addresses."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = WithdrawRewardsBatchTool(context)
+
+        valid = "secretvaloper1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a123456"
+        tool.validate_params({"validator_addresses": [valid]})
+
+        with pytest.raises(ValidationError):
+            tool.validate_params({"validator_addresses": []})
+
+        with pytest.raises(ValidationError) as exc_info:
+            tool.validate_params({"validator_addresses": [valid, "", 5, "secretvaloper1abc"]})
+        assert exc_info.value.details["invalid_indices"] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_execute_packs_withdrawals_into_transactions(self) -> None:
+        """Test validators are split into transactions with consecutive sequences."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        session.start()
+        session.load_wallet(
+            WalletInfo(
+                wallet_id="test_wallet",
+                address="secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+            )
+        )
+
+        with patch("mcp_scrt.tools.rewards.create_signing_client") as mock_create, patch(
+            "mcp_scrt.tools.rewards.WITHDRAW_BATCH_MSGS_PER_TX", 2
+        ):
+            mock_signing = AsyncMock()
+            mock_signing.account_sequence = AsyncMock(return_value=7)
+            mock_signing.withdraw_all_rewards = AsyncMock(return_value={"txhash": "ABC123"})
+            mock_create.return_value = mock_signing
+
+            validators = [f"secretvaloper1{letter * 38}" for letter in "abacde"]
+            result = await WithdrawRewardsBatchTool(context).run(
+                {"validator_addresses": validators}
+            )
+
+        assert result["success"] is True
+        assert result["data"]["validators_count"] == 5
+        assert result["data"]["transactions_count"] == 3
+
+        mock_create.assert_awaited_once()
+        calls = mock_signing.withdraw_all_rewards.await_args_list
+        assert [call.args[0] for call in calls] == [
+            [validators[0], validators[1]],
+            [validators[3], validators[4]],
+            [validators[5]],
+        ]
+        assert [call.kwargs["sequence"] for call in calls] == [7, 8, 9]
+
+    @pytest.mark.asyncio
+    async def test_execute_stops_on_rejected_transaction(self) -> None:
+        """Test a non-zero code stops the batch and reports completed hashes."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        session.start()
+        session.load_wallet(
+            WalletInfo(
+                wallet_id="test_wallet",
+                address="secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+            )
+        )
+
+        with patch("mcp_scrt.tools.rewards.create_signing_client") as mock_create, patch(
+            "mcp_scrt.tools.rewards.WITHDRAW_BATCH_MSGS_PER_TX", 2
+        ):
+            mock_signing = AsyncMock()
+            mock_signing.account_sequence = AsyncMock(return_value=7)
+            mock_signing.withdraw_all_rewards = AsyncMock(
+                side_effect=[
+                    {"txhash": "FIRST", "code": 0},
+                    {"txhash": "SECOND", "code": 5, "raw_log": "insufficient fees"},
+                    {"txhash": "THIRD", "code": 0},
+                ]
+            )
+            mock_create.return_value = mock_signing
+
+            validators = [f"secretvaloper1{letter * 38}" for letter in "abcde"]
+            result = await WithdrawRewardsBatchTool(context).run(
+                {"validator_addresses": validators}
+            )
+
+        assert result["success"] is False
+        assert result["error"]["code"] == "TRANSACTION_ERROR"
+        details = result["error"]["details"]
+        assert details["completed_txhashes"] == ["FIRST"]
+        assert details["failed_txhash"] == "SECOND"
+        assert details["code"] == 5
+        assert mock_signing.withdraw_all_rewards.await_count == 2
+
 
 class TestSetWithdrawAddressTool:
     """Test set_withdraw_address tool."""
@@ -287,6 +583,7 @@ class TestSetWithdrawAddressTool:
             tool.validate_params({})
 
         assert "withdraw_address" in str(exc_info.value.message).lower()
+        assert exc_info.value.details["missing_params"] == ["withdraw_address"]
 
     @pytest.mark.asyncio
     async def test_execute_set_withdraw_address(self) -> None:
@@ -343,6 +640,46 @@ class TestSetWithdrawAddressTool:
                 assert result["success"] is True
                 assert "txhash" in result["data"]
 
+    @pytest.mark.asyncio
+    async def test_signing_client_reused_across_calls(self) -> None:
+        """Test repeated calls share one signing client and consecutive sequences."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        session.start()
+        session.load_wallet(
+            WalletInfo(
+                wallet_id="test_wallet",
+                address="secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+            )
+        )
+
+        with patch("mcp_scrt.tools.rewards.create_signing_client") as mock_create:
+            mock_signing = AsyncMock()
+            mock_signing.account_sequence = AsyncMock(return_value=3)
+            mock_signing.set_withdraw_address = AsyncMock(
+                return_value={"txhash": "ABC123", "code": 0}
+            )
+            mock_create.return_value = mock_signing
+
+            for _ in range(2):
+                result = await SetWithdrawAddressTool(context).run({
+                    "withdraw_address": "secret1xyz123xyz123xyz123xyz123xyz123xyz123xyz"
+                })
+                assert result["success"] is True
+
+        mock_create.assert_awaited_once()
+        mock_signing.account_sequence.assert_awaited_once()
+        sequences = [
+            call.kwargs["sequence"] for call in mock_signing.set_withdraw_address.await_args_list
+        ]
+        assert sequences == [3, 4]
+
 
 class TestGetCommunityPoolTool:
     """Test get_community_pool tool."""
@@ -436,6 +773,8 @@ class TestRewardsToolsIntegration:
         # All tools should be REWARDS category
         for tool in tools:
             assert tool.category == ToolCategory.REWARDS
+            # Tools are slotted, so instances carry no per-instance __dict__
+            assert not hasattr(tool, "__dict__")
             assert tool.name is not None
             assert tool.description is not None
 
@@ -443,6 +782,9 @@ class TestRewardsToolsIntegration:
         names = [tool.name for tool in tools]
         assert len(names) == len(set(names))
 
+        # Metadata is readable from the class without an instance
+        assert [type(tool).name for tool in tools] == names
+
         # Check which tools require wallet
         wallet_required = [tool for tool in tools if tool.requires_wallet]
         wallet_not_required = [tool for tool in tools if not tool.requires_wallet]
@@ -3,9 +3,10 @@
 This module tests the staking tools for validators and delegation operations.
 """
 
+import asyncio
 import pytest
 from typing import Any, Dict
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, PropertyMock, patch, AsyncMock
 
 from mcp_scrt.tools.staking import (
     GetValidatorsTool,
@@ -16,6 +17,8 @@ from mcp_scrt.tools.staking import (
     GetDelegationsTool,
     GetUnbondingTool,
     GetRedelegationsTool,
+    GetStakingSummaryTool,
+    _staking_cache,
 )
 from mcp_scrt.tools.base import ToolCategory, ToolExecutionContext
 from mcp_scrt.core.session import Session
@@ -24,6 +27,14 @@ from mcp_scrt.types import NetworkType, WalletInfo
 from mcp_scrt.utils.errors import ValidationError
 
 
+@pytest.fixture(autouse=True)
+def clear_staking_cache():
+    """Start every test with an empty staking cache."""
+    _staking_cache.clear()
+    yield
+    _staking_cache.clear()
+
+
 class TestGetValidatorsTool:
     """Test get_validators tool."""
 
@@ -62,6 +73,14 @@ class TestGetValidatorsTool:
         # Should not raise with valid status
         tool.validate_params({"status": "BOND_STATUS_BONDED"})
 
+        with pytest.raises(ValidationError) as exc_info:
+            tool.validate_params({"status": "BONDED"})
+        assert exc_info.value.details["valid_values"] == [
+            "BOND_STATUS_BONDED",
+            "BOND_STATUS_UNBONDING",
+            "BOND_STATUS_UNBONDED",
+        ]
+
     @pytest.mark.asyncio
     async def test_execute_get_validators(self) -> None:
         """Test getting validators."""
@@ -76,7 +95,9 @@ class TestGetValidatorsTool:
         tool = GetValidatorsTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.staking = Mock()
             mock_client.staking.validators = AsyncMock(
@@ -109,8 +130,7 @@ class TestGetValidatorsTool:
                     "pagination": {"next_key": None, "total": "1"},
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({})
 
@@ -118,6 +138,43 @@ class TestGetValidatorsTool:
             assert "validators" in result["data"]
             assert result["data"]["count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_execute_get_validators_page(self) -> None:
+        """Test one page of validators is requested and its next_key returned."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = GetValidatorsTool(context)
+
+        for max_items in (0, 501, True):
+            with pytest.raises(ValidationError):
+                tool.validate_params({"max_items": max_items})
+        tool.validate_params({"max_items": 500})
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.staking.validators = AsyncMock(
+                return_value={
+                    "validators": [{"operator_address": "secretvaloper1..."}],
+                    "pagination": {"next_key": "page2", "total": "80"},
+                }
+            )
+            mock_read_client.return_value = mock_client
+
+            result = await tool.run({"max_items": 1, "pagination_key": "page1"})
+
+        assert result["success"] is True
+        assert result["data"]["next_key"] == "page2"
+        page = mock_client.staking.validators.call_args.kwargs["params"]
+        assert (page.key, page.limit) == ("page1", 1)
+
 
 class TestGetValidatorTool:
     """Test get_validator tool."""
@@ -170,7 +227,9 @@ class TestGetValidatorTool:
         tool = GetValidatorTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.staking = Mock()
             mock_client.staking.validator = AsyncMock(
@@ -186,8 +245,7 @@ class TestGetValidatorTool:
                     }
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({"validator_address": "secretvaloper1abc"})
 
@@ -249,6 +307,23 @@ class TestDelegateTool:
 
         assert "amount" in str(exc_info.value.message).lower()
 
+    def test_validate_params_reports_all_missing(self) -> None:
+        """Test every missing parameter is reported in one error."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = DelegateTool(context)
+
+        with pytest.raises(ValidationError) as exc_info:
+            tool.validate_params({})
+
+        assert exc_info.value.details["missing_params"] == ["amount", "validator_address"]
+
     @pytest.mark.asyncio
     async def test_execute_delegate(self) -> None:
         """Test delegating tokens."""
@@ -305,6 +380,77 @@ class TestDelegateTool:
 
                 assert result["success"] is True
                 assert "txhash" in result["data"]
+                assert result["data"]["message"] == (
+                    "Successfully delegated 1000000 uscrt to secretvaloper1abc"
+                )
+
+    @pytest.mark.asyncio
+    async def test_execute_delegate_without_message(self) -> None:
+        """Test no message is built when verbose messages are disabled."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+            verbose_messages=False,
+        )
+
+        session.start()
+        session.load_wallet(
+            WalletInfo(
+                wallet_id="test_wallet",
+                address="secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+            )
+        )
+
+        with patch("mcp_scrt.tools.staking.create_signing_client") as mock_create:
+            mock_signing = AsyncMock()
+            mock_signing.delegate = AsyncMock(return_value={"txhash": "ABC123"})
+            mock_create.return_value = mock_signing
+
+            result = await DelegateTool(context).run({
+                "validator_address": "secretvaloper1abc",
+                "amount": "1000000",
+            })
+
+        assert result["success"] is True
+        assert result["data"]["txhash"] == "ABC123"
+        assert "message" not in result["data"]
+
+    @pytest.mark.asyncio
+    async def test_signing_client_reused_across_calls(self) -> None:
+        """Test repeated delegations share one signing client."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        session.start()
+        session.load_wallet(
+            WalletInfo(
+                wallet_id="test_wallet",
+                address="secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03",
+            )
+        )
+
+        with patch("mcp_scrt.tools.staking.create_signing_client") as mock_create:
+            mock_signing = AsyncMock()
+            mock_signing.delegate = AsyncMock(return_value={"txhash": "ABC123", "code": 0})
+            mock_create.return_value = mock_signing
+
+            for _ in range(2):
+                result = await DelegateTool(context).run({
+                    "validator_address": "secretvaloper1abc",
+                    "amount": "1000000",
+                })
+                assert result["success"] is True
+
+        mock_create.assert_awaited_once()
+        assert mock_signing.delegate.await_count == 2
 
 
 class TestUndelegateTool:
@@ -568,7 +714,9 @@ class TestGetDelegationsTool:
         tool = GetDelegationsTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.staking = Mock()
             mock_client.staking.delegations = AsyncMock(
@@ -586,14 +734,72 @@ class TestGetDelegationsTool:
                     "pagination": {"next_key": None, "total": "1"},
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({"address": "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03"})
 
             assert result["success"] is True
             assert "delegations" in result["data"]
 
+    @pytest.mark.asyncio
+    async def test_execute_get_delegations_cached_until_delegate(self) -> None:
+        """Test repeated queries reuse the response until the delegator delegates."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+        address = "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03"
+
+        session.start()
+        session.load_wallet(WalletInfo(wallet_id="test_wallet", address=address))
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.staking.delegations = AsyncMock(return_value={"delegation_responses": []})
+            mock_read_client.return_value = mock_client
+
+            first = await GetDelegationsTool(context).run({"address": address})
+            second = await GetDelegationsTool(context).run({"address": address})
+            assert mock_client.staking.delegations.call_count == 1
+            assert second["data"] == first["data"]
+
+            await DelegateTool(context).run(
+                {"validator_address": "secretvaloper1abc", "amount": "1000000"}
+            )
+            await GetDelegationsTool(context).run({"address": address})
+            assert mock_client.staking.delegations.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_delegations_share_one_query(self) -> None:
+        """Test concurrent identical queries run once."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+        address = "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03"
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.staking.delegations = AsyncMock(return_value={"delegation_responses": []})
+            mock_read_client.return_value = mock_client
+
+            results = await asyncio.gather(
+                *(GetDelegationsTool(context).run({"address": address}) for _ in range(3))
+            )
+
+        assert all(result["success"] for result in results)
+        mock_client.staking.delegations.assert_called_once_with(address)
+
 
 class TestGetUnbondingTool:
     """Test get_unbonding tool."""
@@ -646,7 +852,9 @@ class TestGetUnbondingTool:
         tool = GetUnbondingTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.staking = Mock()
             mock_client.staking.unbonding_delegations = AsyncMock(
@@ -668,8 +876,7 @@ class TestGetUnbondingTool:
                     "pagination": {"next_key": None, "total": "1"},
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({"address": "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03"})
 
@@ -728,7 +935,9 @@ class TestGetRedelegationsTool:
         tool = GetRedelegationsTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.staking = Mock()
             mock_client.staking.redelegations = AsyncMock(
@@ -757,8 +966,7 @@ class TestGetRedelegationsTool:
                     "pagination": {"next_key": None, "total": "1"},
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({"address": "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03"})
 
@@ -766,6 +974,50 @@ class TestGetRedelegationsTool:
             assert "redelegations" in result["data"]
 
 
+class TestGetStakingSummaryTool:
+    """Test get_staking_summary tool."""
+
+    @pytest.mark.asyncio
+    async def test_execute_get_staking_summary(self) -> None:
+        """Test the summary merges all three queries and caches the result."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+        address = "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03"
+
+        mock_client = Mock()
+        mock_client.staking.delegations = AsyncMock(
+            return_value={"delegation_responses": [{"balance": {"amount": "1"}}]}
+        )
+        mock_client.staking.unbonding_delegations = AsyncMock(
+            return_value={"unbonding_responses": []}
+        )
+        mock_client.staking.redelegations = AsyncMock(
+            return_value={"redelegation_responses": [{}, {}]}
+        )
+
+        with patch.object(ClientPool, "async_read_client", mock_client), patch.object(
+            pool, "get_client"
+        ) as mock_get_client:
+            result = await GetStakingSummaryTool(context).run({"address": address})
+            await GetStakingSummaryTool(context).run({"address": address})
+
+        # The shared async read client serves every query; nothing is checked out
+        mock_get_client.assert_not_called()
+
+        assert result["success"] is True
+        assert result["data"]["delegations_count"] == 1
+        assert result["data"]["unbonding_count"] == 0
+        assert result["data"]["redelegations_count"] == 2
+        mock_client.staking.delegations.assert_awaited_once_with(address)
+        mock_client.staking.unbonding_delegations.assert_awaited_once_with(address)
+        mock_client.staking.redelegations.assert_awaited_once_with(delegator_addr=address)
+
+
 class TestStakingToolsIntegration:
     """Test staking tools working together."""
 
@@ -789,11 +1041,14 @@ class TestStakingToolsIntegration:
             GetDelegationsTool(context),
             GetUnbondingTool(context),
             GetRedelegationsTool(context),
+            GetStakingSummaryTool(context),
         ]
 
         # All tools should be STAKING category
         for tool in tools:
             assert tool.category == ToolCategory.STAKING
+            # Tools are slotted, so instances carry no per-instance __dict__
+            assert not hasattr(tool, "__dict__")
             assert tool.name is not None
             assert tool.description is not None
 
@@ -801,10 +1056,13 @@ class TestStakingToolsIntegration:
         names = [tool.name for tool in tools]
         assert len(names) == len(set(names))
 
+        # Metadata is readable from the class without an instance
+        assert [type(tool).name for tool in tools] == names
+
         # Check which tools require wallet
         wallet_required = [tool for tool in tools if tool.requires_wallet]
         wallet_not_required = [tool for tool in tools if not tool.requires_wallet]
 
         # Delegate, undelegate, redelegate should require wallet
         assert len(wallet_required) == 3
-        assert len(wallet_not_required) == 5
+        assert len(wallet_not_required) == 6
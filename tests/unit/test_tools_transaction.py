@@ -3,9 +3,13 @@
 This module tests the transaction tools for querying and simulating transactions.
 """
 
+import asyncio
+
 import pytest
 from typing import Any, Dict
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, PropertyMock, patch, AsyncMock
+
+from secret_sdk.exceptions import LCDResponseError
 
 from mcp_scrt.tools.transaction import (
     GetTransactionTool,
@@ -13,6 +17,9 @@ from mcp_scrt.tools.transaction import (
     EstimateGasTool,
     SimulateTransactionTool,
     GetTransactionStatusTool,
+    GetTransactionsBulkTool,
+    _search_cache,
+    _tx_cache,
 )
 from mcp_scrt.tools.base import ToolCategory, ToolExecutionContext
 from mcp_scrt.core.session import Session
@@ -21,6 +28,16 @@ from mcp_scrt.types import NetworkType
 from mcp_scrt.utils.errors import ValidationError
 
 
+@pytest.fixture(autouse=True)
+def clear_tx_caches():
+    """Start every test with empty transaction caches."""
+    _tx_cache.clear()
+    _search_cache.clear()
+    yield
+    _tx_cache.clear()
+    _search_cache.clear()
+
+
 class TestGetTransactionTool:
     """Test get_transaction tool."""
 
@@ -57,6 +74,8 @@ class TestGetTransactionTool:
             tool.validate_params({})
 
         assert "hash" in str(exc_info.value.message).lower()
+        assert exc_info.value.details["missing_params"] == ["hash"]
+        assert exc_info.value.suggestions[-1] == "Example: {'hash': 'ABC123...'}"
 
     @pytest.mark.asyncio
     async def test_execute_get_transaction(self) -> None:
@@ -72,7 +91,9 @@ class TestGetTransactionTool:
         tool = GetTransactionTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.tx = Mock()
             mock_client.tx.get_tx = AsyncMock(
@@ -85,14 +106,253 @@ class TestGetTransactionTool:
                     }
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({"hash": "ABC123"})
 
             assert result["success"] is True
             assert "transaction" in result["data"]
 
+    @pytest.mark.asyncio
+    async def test_execute_get_transaction_bounded_by_timeout(self) -> None:
+        """Test the query is awaited on the async read client and bounded by a timeout."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = GetTransactionTool(context)
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.tx.get_tx = AsyncMock(
+                return_value={"tx_response": {"txhash": "ABC123", "height": "12345", "code": 0}}
+            )
+            mock_read_client.return_value = mock_client
+
+            result = await tool.run({"hash": "ABC123"})
+
+            cancelled = asyncio.Event()
+
+            async def slow_get_tx(hash: str) -> Dict[str, Any]:
+                try:
+                    await asyncio.sleep(0.2)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+                return {}
+
+            with patch("mcp_scrt.tools.transaction.TX_QUERY_TIMEOUT", 0.01):
+                mock_client.tx.get_tx.side_effect = slow_get_tx
+                timed_out = await tool.run({"hash": "DEF456"})
+
+        assert result["success"] is True
+        assert result["data"]["height"] == "12345"
+        assert result["data"]["message"] == "Transaction ABC123... retrieved successfully"
+        mock_client.tx.get_tx.assert_awaited_with(hash="DEF456")
+        assert timed_out["success"] is False
+        assert timed_out["error"]["code"] == "NETWORK_ERROR"
+        assert "did not finish within 0.01s" in timed_out["error"]["message"]
+        # The timed-out query was cancelled rather than left running
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_queries_bounded_by_shared_slots(self) -> None:
+        """Test concurrent queries from different tools share one set of query slots."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+        running = 0
+        peak = 0
+
+        async def get_tx(hash: str) -> Dict[str, Any]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return {"tx_response": {"txhash": hash, "height": "12345", "code": 0}}
+
+        with patch("mcp_scrt.tools.transaction._query_slots", asyncio.Semaphore(2)), patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.tx.get_tx = AsyncMock(side_effect=get_tx)
+            mock_read_client.return_value = mock_client
+
+            results = await asyncio.gather(
+                GetTransactionTool(context).run({"hash": "A1"}),
+                GetTransactionStatusTool(context).run({"hash": "B2"}),
+                GetTransactionsBulkTool(context).run({"hashes": ["C3", "D4"]}),
+            )
+
+        assert all(result["success"] for result in results)
+        assert mock_client.tx.get_tx.await_count == 4
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_slot_wait_does_not_count_towards_timeout(self) -> None:
+        """Test the query timeout starts once the query holds a slot."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        async def get_tx(hash: str) -> Dict[str, Any]:
+            await asyncio.sleep(0.1)
+            return {"tx_response": {"txhash": hash, "height": "12345", "code": 0}}
+
+        with patch("mcp_scrt.tools.transaction._query_slots", asyncio.Semaphore(1)), patch(
+            "mcp_scrt.tools.transaction.TX_QUERY_TIMEOUT", 0.15
+        ), patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.tx.get_tx = AsyncMock(side_effect=get_tx)
+            mock_read_client.return_value = mock_client
+
+            # The second query waits 0.1s for the slot, then runs 0.1s itself
+            results = await asyncio.gather(
+                GetTransactionTool(context).run({"hash": "A1"}),
+                GetTransactionTool(context).run({"hash": "B2"}),
+            )
+
+        assert all(result["success"] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_execute_get_transaction_without_message(self) -> None:
+        """Test no message is built when verbose messages are disabled."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+            verbose_messages=False,
+        )
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.tx.get_tx = AsyncMock(
+                return_value={
+                    "tx_response": {"txhash": "ABC123DEF456", "height": "12345", "code": 0}
+                }
+            )
+            mock_read_client.return_value = mock_client
+
+            result = await GetTransactionTool(context).run({"hash": "ABC123DEF456"})
+
+        assert result["success"] is True
+        assert result["data"]["height"] == "12345"
+        assert "message" not in result["data"]
+
+    @pytest.mark.asyncio
+    async def test_included_transactions_cached(self) -> None:
+        """Test transactions with a block height are served from the cache, others are not."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        responses = {
+            "ABC123": {"tx_response": {"txhash": "ABC123", "height": "12345", "code": 0}},
+            "DEF456": {"tx_response": {"txhash": "DEF456", "height": "0"}},
+        }
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.tx.get_tx = AsyncMock(side_effect=lambda hash: responses[hash])
+            mock_read_client.return_value = mock_client
+
+            for tx_hash in ("ABC123", "DEF456"):
+                await GetTransactionTool(context).run({"hash": tx_hash})
+                status = await GetTransactionStatusTool(context).run({"hash": tx_hash})
+                assert status["success"] is True
+
+        # The included transaction was queried once; the pending one each time
+        hashes = [call.kwargs["hash"] for call in mock_client.tx.get_tx.call_args_list]
+        assert hashes == ["ABC123", "DEF456", "DEF456"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_query(self) -> None:
+        """Test concurrent lookups of one hash share a query while distinct hashes do not."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.tx.get_tx = AsyncMock(
+                side_effect=lambda hash: {"tx_response": {"txhash": hash}}
+            )
+            mock_read_client.return_value = mock_client
+
+            results = await asyncio.gather(
+                GetTransactionTool(context).run({"hash": "ABC123"}),
+                GetTransactionStatusTool(context).run({"hash": "ABC123"}),
+                GetTransactionTool(context).run({"hash": "DEF456"}),
+            )
+
+        assert all(result["success"] for result in results)
+        hashes = sorted(call.kwargs["hash"] for call in mock_client.tx.get_tx.call_args_list)
+        assert hashes == ["ABC123", "DEF456"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_fill_cache_once(self) -> None:
+        """Test waiters on a shared lookup leave the cache fill to the query itself."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client, patch.object(
+            _tx_cache, "set", wraps=_tx_cache.set
+        ) as mock_set:
+            mock_client = Mock()
+            mock_client.tx.get_tx = AsyncMock(
+                return_value={
+                    "tx_response": {"txhash": "ABC123", "height": "12345", "code": 0}
+                }
+            )
+            mock_read_client.return_value = mock_client
+
+            await asyncio.gather(
+                *(GetTransactionStatusTool(context).run({"hash": "ABC123"}) for _ in range(3))
+            )
+
+        mock_client.tx.get_tx.assert_awaited_once_with(hash="ABC123")
+        mock_set.assert_called_once()
+
 
 class TestSearchTransactionsTool:
     """Test search_transactions tool."""
@@ -148,6 +408,28 @@ class TestSearchTransactionsTool:
 
         assert "limit" in str(exc_info.value.message).lower()
 
+        with pytest.raises(ValidationError) as exc_info:
+            tool.validate_params({"query": "test", "limit": True})
+
+        assert "limit" in str(exc_info.value.message).lower()
+
+    def test_validate_params_invalid_include_details(self) -> None:
+        """Test validation fails when include_details is not a boolean."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = SearchTransactionsTool(context)
+
+        with pytest.raises(ValidationError) as exc_info:
+            tool.validate_params({"query": "test", "include_details": "no"})
+
+        assert "include_details" in str(exc_info.value.message).lower()
+
     @pytest.mark.asyncio
     async def test_execute_search_transactions(self) -> None:
         """Test searching transactions."""
@@ -162,7 +444,9 @@ class TestSearchTransactionsTool:
         tool = SearchTransactionsTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.tx = Mock()
             mock_client.tx.search = AsyncMock(
@@ -171,14 +455,94 @@ class TestSearchTransactionsTool:
                     "total_count": "1",
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({"query": "message.action='/cosmos.bank.v1beta1.MsgSend'"})
 
             assert result["success"] is True
             assert "transactions" in result["data"]
 
+    @pytest.mark.asyncio
+    async def test_search_pages_with_results_cached(self) -> None:
+        """Test repeated searches reuse a page with results but not an empty one."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+        query = "message.sender='secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03'"
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.tx.search = AsyncMock(
+                side_effect=lambda events, params: {
+                    "txs": [{"txhash": "ABC123"}] if params.offset == 0 else []
+                }
+            )
+            mock_read_client.return_value = mock_client
+
+            for _ in range(2):
+                first = await SearchTransactionsTool(context).run({"query": query})
+                second = await SearchTransactionsTool(context).run({"query": query, "page": 2})
+
+        assert first["data"]["count"] == 1
+        assert second["data"]["count"] == 0
+        # Page 1 was searched once; the empty page 2 each time
+        assert mock_client.tx.search.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_search_summaries_without_details(self) -> None:
+        """Test oversized pages are rejected and summaries drop transaction bodies."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = SearchTransactionsTool(context)
+
+        with pytest.raises(ValidationError):
+            tool.validate_params({"query": "tx.height=5", "limit": 501})
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.tx.search = AsyncMock(
+                return_value={
+                    "txs": [{"body": {}}],
+                    "tx_responses": [
+                        {
+                            "txhash": "ABC123",
+                            "height": "5",
+                            "code": 0,
+                            "raw_log": "[]",
+                            "tx": {
+                                "body": {"messages": [{"@type": "/cosmos.bank.v1beta1.MsgSend"}]}
+                            },
+                        }
+                    ],
+                }
+            )
+            mock_read_client.return_value = mock_client
+
+            result = await tool.run({"query": "tx.height=5", "include_details": False})
+
+        assert result["data"]["transactions"] == [
+            {
+                "hash": "ABC123",
+                "height": "5",
+                "code": 0,
+                "message_types": ["/cosmos.bank.v1beta1.MsgSend"],
+            }
+        ]
+
 
 class TestEstimateGasTool:
     """Test estimate_gas tool."""
@@ -343,7 +707,9 @@ class TestGetTransactionStatusTool:
         tool = GetTransactionStatusTool(context)
 
         # Mock the client pool
-        with patch.object(pool, "get_client") as mock_get_client:
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
             mock_client = Mock()
             mock_client.tx = Mock()
             mock_client.tx.get_tx = AsyncMock(
@@ -355,8 +721,7 @@ class TestGetTransactionStatusTool:
                     }
                 }
             )
-            mock_get_client.return_value.__enter__ = Mock(return_value=mock_client)
-            mock_get_client.return_value.__exit__ = Mock(return_value=False)
+            mock_read_client.return_value = mock_client
 
             result = await tool.run({"hash": "ABC123"})
 
@@ -364,6 +729,131 @@ class TestGetTransactionStatusTool:
             assert "status" in result["data"]
             assert result["data"]["status"] == "success"
 
+    @pytest.mark.asyncio
+    async def test_execute_get_transaction_status_not_found(self) -> None:
+        """Test a 404 from the LCD reports not_found while other failures are errors."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = GetTransactionStatusTool(context)
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.tx.get_tx = AsyncMock()
+            mock_read_client.return_value = mock_client
+
+            mock_client.tx.get_tx.side_effect = LCDResponseError(
+                "tx not found", Mock(status=404)
+            )
+            result = await tool.run({"hash": "ABC123"})
+
+            mock_client.tx.get_tx.side_effect = Exception("route not found")
+            failed = await tool.run({"hash": "DEF456"})
+
+        assert result["success"] is True
+        assert result["data"]["status"] == "not_found"
+        assert failed["success"] is False
+        assert failed["error"]["code"] == "NETWORK_ERROR"
+
+
+class TestGetTransactionsBulkTool:
+    """Test get_transactions tool."""
+
+    def test_validate_params_invalid_hashes(self) -> None:
+        """Test empty, oversized and malformed hash lists are rejected."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        tool = GetTransactionsBulkTool(context)
+
+        with pytest.raises(ValidationError) as exc_info:
+            tool.validate_params({"hashes": []})
+        assert "1 to 100" in str(exc_info.value)
+
+        with pytest.raises(ValidationError):
+            tool.validate_params({"hashes": ["ABC123"] * 101})
+
+        with pytest.raises(ValidationError) as exc_info:
+            tool.validate_params({"hashes": ["", "ABC123", 42]})
+        assert exc_info.value.details["invalid_indices"] == [0, 2]
+
+    @pytest.mark.asyncio
+    async def test_execute_get_transactions(self) -> None:
+        """Test hashes are queried once each and failures are reported per hash."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        def get_tx(hash: str) -> Dict[str, Any]:
+            if hash == "MISSING":
+                raise LCDResponseError("tx not found", Mock(status=404))
+            return {"tx_response": {"txhash": hash, "height": "12345", "code": 0}}
+
+        with patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.tx.get_tx = AsyncMock(side_effect=get_tx)
+            mock_read_client.return_value = mock_client
+
+            result = await GetTransactionsBulkTool(context).run(
+                {"hashes": ["ABC123", "MISSING", "DEF456", "ABC123"]}
+            )
+
+        assert result["success"] is True
+        data = result["data"]
+        assert list(data["transactions"]) == ["ABC123", "DEF456"]
+        assert data["transactions"]["DEF456"]["height"] == "12345"
+        assert list(data["errors"]) == ["MISSING"]
+        assert data["count"] == 2
+        assert data["failed"] == 1
+        assert mock_client.tx.get_tx.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_execute_get_transactions_reports_timeouts(self) -> None:
+        """Test a timed-out hash is reported with a non-empty error."""
+        session = Session(network=NetworkType.TESTNET)
+        pool = ClientPool(network=NetworkType.TESTNET, max_connections=5)
+        context = ToolExecutionContext(
+            session=session,
+            client_pool=pool,
+            network=NetworkType.TESTNET,
+        )
+
+        async def get_tx(hash: str) -> Dict[str, Any]:
+            if hash == "SLOW":
+                await asyncio.sleep(0.2)
+            return {"tx_response": {"txhash": hash, "height": "12345", "code": 0}}
+
+        with patch("mcp_scrt.tools.transaction.TX_QUERY_TIMEOUT", 0.01), patch.object(
+            ClientPool, "async_read_client", new_callable=PropertyMock
+        ) as mock_read_client:
+            mock_client = Mock()
+            mock_client.tx.get_tx = AsyncMock(side_effect=get_tx)
+            mock_read_client.return_value = mock_client
+
+            result = await GetTransactionsBulkTool(context).run({"hashes": ["FAST", "SLOW"]})
+
+        assert result["success"] is True
+        assert list(result["data"]["transactions"]) == ["FAST"]
+        assert "did not finish within 0.01s" in result["data"]["errors"]["SLOW"]
+
 
 class TestTransactionToolsIntegration:
     """Test transaction tools working together."""
@@ -385,6 +875,7 @@ class TestTransactionToolsIntegration:
             EstimateGasTool(context),
             SimulateTransactionTool(context),
             GetTransactionStatusTool(context),
+            GetTransactionsBulkTool(context),
         ]
 
         # All tools should be TRANSACTIONS category
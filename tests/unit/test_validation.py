@@ -1,8 +1,14 @@
 """Unit tests for input validation."""
 
+from unittest.mock import patch
+
 import pytest
 
 from mcp_scrt.core.validation import (
+    _is_valid_amount_string,
+    _matches_address,
+    _matches_validator_address,
+    invalid_validator_addresses,
     is_valid_address,
     is_valid_amount,
     is_valid_contract_address,
@@ -71,6 +77,38 @@ class TestAddressValidation:
         with pytest.raises(ValidationError, match="recipient"):
             validate_address("invalid", field_name="recipient")
 
+    def test_address_check_memoized(self) -> None:
+        """Test repeated addresses reuse the cached result, still raising when invalid."""
+        address = "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03"
+        _matches_address.cache_clear()
+
+        for _ in range(3):
+            validate_address(address)
+            with pytest.raises(ValidationError):
+                validate_address("secret1invalid")
+
+        info = _matches_address.cache_info()
+        assert info.misses == 2
+        assert info.hits == 4
+
+        # Unhashable input is rejected before reaching the cache
+        assert is_valid_address(["secret1"]) is False
+
+    def test_success_log_skipped_below_debug(self) -> None:
+        """Test no success record is built unless debug logging is enabled."""
+        address = "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03"
+
+        with patch("mcp_scrt.core.validation.logger") as mock_logger, patch(
+            "mcp_scrt.core.validation._stdlib_logger"
+        ) as mock_stdlib_logger:
+            mock_stdlib_logger.isEnabledFor.return_value = False
+            validate_address(address)
+            mock_logger.debug.assert_not_called()
+
+            mock_stdlib_logger.isEnabledFor.return_value = True
+            validate_address(address)
+            mock_logger.debug.assert_called_once()
+
 
 class TestValidatorAddressValidation:
     """Test validator address validation."""
@@ -94,11 +132,32 @@ class TestValidatorAddressValidation:
         address = "secretvaloper1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a123456"
         validate_validator_address(address)
 
+    def test_validator_address_check_memoized(self) -> None:
+        """Test repeated validator addresses reuse the cached result."""
+        address = "secretvaloper1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a123456"
+        _matches_validator_address.cache_clear()
+
+        for _ in range(3):
+            validate_validator_address(address)
+            with pytest.raises(ValidationError):
+                validate_validator_address("secretvaloper1invalid")
+
+        info = _matches_validator_address.cache_info()
+        assert info.misses == 2
+        assert info.hits == 4
+
     def test_validate_validator_address_failure(self) -> None:
         """Test validate_validator_address with invalid address."""
         with pytest.raises(ValidationError, match="Invalid validator address"):
             validate_validator_address("invalid_address")
 
+    def test_invalid_validator_addresses_bulk(self) -> None:
+        """Test bulk check reports the index of every invalid entry."""
+        valid = "secretvaloper1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a123456"
+        addresses = [valid, "secret1ap26qrlp8mcq2pg6r47w43l0y8zkqm8a450s03", valid, None, ""]
+        assert invalid_validator_addresses(addresses) == [1, 3, 4]
+        assert invalid_validator_addresses([valid, valid]) == []
+
 
 class TestContractAddressValidation:
     """Test contract address validation."""
@@ -189,6 +248,19 @@ class TestAmountValidation:
         with pytest.raises(ValidationError, match="exceeds maximum"):
             validate_amount(1000, max_amount=100)
 
+    def test_amount_string_check_memoized(self) -> None:
+        """Test repeated amount strings reuse the cached result, still raising when invalid."""
+        _is_valid_amount_string.cache_clear()
+
+        for _ in range(3):
+            validate_amount("1000000")
+            with pytest.raises(ValidationError):
+                validate_amount("-5")
+
+        info = _is_valid_amount_string.cache_info()
+        assert info.misses == 2
+        assert info.hits == 4
+
     def test_validate_amount_custom_field_name(self) -> None:
         """Test validate_amount with custom field name."""
         with pytest.raises(ValidationError, match="transfer_amount"):